@@ -0,0 +1,260 @@
+"""
+complete.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Provides fast shell completion for command-line programs built from operation sets. The argument
+parser is walked once into a compact completion spec that is cached, so answering a completion
+request only reads the cached spec instead of importing every operation and building the parser.
+Values that depend on the environment, such as names read from a project, come from provider
+functions. Only modules loaded at interpreter startup are imported at the module level and caches
+are stored with marshal, because importing even json or typing would dominate the latency of a
+completion request.
+"""
+
+from __future__ import annotations
+import os
+import sys
+import marshal
+
+
+# Names used in annotations only. Importing them at runtime is too slow for completion requests.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable
+    from argparse import Action, ArgumentParser
+
+
+SPEC_VERSION = 1
+"""
+The version of the completion spec format. A cached spec of another version is rebuilt.
+"""
+
+COMP_LINE_ENV_VAR = 'COMP_LINE'
+"""
+The name of the environment variable holding the command line being completed. Bash sets it when
+running a completion command registered with "complete -C".
+"""
+
+COMP_POINT_ENV_VAR = 'COMP_POINT'
+"""
+The name of the environment variable holding the cursor position in the command line being
+completed.
+"""
+
+COMPLETER_ATTR = 'completer'
+"""
+The name of the attribute of an argument parser action naming the provider of its values.
+"""
+
+
+def set_completer(action: Action, provider: str) -> Action:
+    """
+    Names the provider function that supplies the completions of the values of the given action.
+    Returns the action.
+    """
+
+    setattr(action, COMPLETER_ATTR, provider)
+    return action
+
+
+def build_spec(parser: ArgumentParser) -> dict:
+    """
+    Walks the given argument parser and its operation subparsers into a completion spec. The spec
+    holds the options of the parser, whether each option takes values, their choices and provider,
+    the positional arguments, and the spec of each operation.
+    """
+
+    from argparse import _SubParsersAction
+
+    spec = {'options': {}, 'positionals': [], 'operations': {}}
+
+    for action in parser._actions:
+
+        # Descend into the parser of each operation.
+        if isinstance(action, _SubParsersAction):
+            for name, subparser in action.choices.items():
+                spec['operations'][name] = build_spec(subparser)
+            continue
+
+        entry = {
+            'nargs': action.nargs if isinstance(action.nargs, (str, int)) else None,
+            'choices': [str(choice) for choice in action.choices] if action.choices else None,
+            'completer': getattr(action, COMPLETER_ATTR, None)
+        }
+
+        # Options are keyed by each of their strings. Positional arguments keep their order.
+        if action.option_strings:
+            entry['value'] = action.nargs != 0
+            for option in action.option_strings:
+                spec['options'][option] = entry
+        else:
+            spec['positionals'].append(entry)
+
+    return spec
+
+
+def read_cache(path: str, key: Any) -> Any:
+    """
+    Returns the value cached at the given path if it was cached with an equal key, or None if the
+    cache is missing, stale, or unreadable.
+    """
+
+    try:
+        with open(path, 'rb') as file:
+            cached_key, value = marshal.load(file)
+        return value if cached_key == key else None
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+
+
+def write_cache(path: str, key: Any, value: Any) -> None:
+    """
+    Caches a value along with its key at the given path, replacing the file atomically. The value
+    must consist of built-in types. The cache is only an optimization so failing to write it is
+    ignored.
+    """
+
+    try:
+        os.makedirs(os.path.dirname(path), 511, True)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as file:
+            marshal.dump((key, value), file)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+def load_spec(path: str, fingerprint: list, build: Callable[[], ArgumentParser]) -> dict:
+    """
+    Returns the completion spec cached at the given path if it was built with the given
+    fingerprint, which should change whenever the program's arguments may have changed (such as
+    the package version and the modification times of its operation modules). Otherwise the
+    parser is built, its spec is cached, and the spec is returned.
+    """
+
+    key = [SPEC_VERSION, sys.version, *fingerprint]
+    spec = read_cache(path, key)
+
+    if spec is None:
+        spec = build_spec(build())
+        write_cache(path, key, spec)
+
+    return spec
+
+
+def complete(spec: dict,
+             words: list[str],
+             current: str,
+             providers: dict[str, Callable[[dict[str, str]], list[str]]]=None) -> list[str]:
+    """
+    Returns the completions of the current word given the words before it (excluding the program
+    name). Options, operation names, and choices come from the spec. Values of arguments with a
+    named provider come from calling the provider with the option values given so far, keyed by
+    option string.
+    """
+
+    node = spec
+    values = {}
+    positional = 0
+    pending = None
+
+    # Follow the words through the operations, tracking the argument the current word belongs to.
+    for word in words:
+
+        # A word following an option that takes values is one of its values.
+        if pending is not None and not word.startswith('-'):
+            values[pending[0]] = word
+            if pending[1]['nargs'] not in ('+', '*'):
+                pending = None
+            continue
+
+        pending = None
+
+        if word.startswith('-') and len(word) > 1:
+            option, equals, value = word.partition('=')
+            entry = node['options'].get(option)
+            if equals:
+                values[option] = value
+            elif entry is not None and entry['value']:
+                pending = (option, entry)
+
+        elif word in node['operations']:
+            node, positional = node['operations'][word], 0
+
+        elif positional < len(node['positionals']) \
+                and node['positionals'][positional]['nargs'] not in ('+', '*'):
+            positional += 1
+
+    # Gather the candidates for the argument the current word belongs to.
+    if pending is not None:
+        candidates = _values(pending[1], values, providers)
+    elif current.startswith('-'):
+        candidates = list(node['options'])
+    elif node['operations']:
+        candidates = list(node['operations'])
+    elif positional < len(node['positionals']):
+        candidates = _values(node['positionals'][positional], values, providers)
+    else:
+        candidates = []
+
+    return sorted(candidate for candidate in candidates if candidate.startswith(current))
+
+
+def _values(entry: dict,
+            values: dict[str, str],
+            providers: dict[str, Callable[[dict[str, str]], list[str]]]) -> list[str]:
+    """
+    Returns the possible values of an argument from its choices or its provider. Failures of the
+    provider yield no values so completion never displays an error.
+    """
+
+    if entry['choices']:
+        return entry['choices']
+
+    provider = (providers or {}).get(entry['completer'])
+    if provider is None:
+        return []
+
+    try:
+        return provider(values)
+    except Exception:
+        return []
+
+
+def completion_requested() -> bool:
+    """
+    Determines whether the program was run by the shell to complete a command line.
+    """
+
+    return COMP_LINE_ENV_VAR in os.environ
+
+
+def run_completion(load: Callable[[], dict],
+                   providers: dict[str, Callable[[dict[str, str]], list[str]]]=None) -> None:
+    """
+    Answers the completion request described by the environment by writing each completion of the
+    word at the cursor on its own line. The spec is only loaded by calling the given function.
+    """
+
+    # Split the line up to the cursor into words. The word being completed is empty if the cursor
+    # follows a space.
+    line = os.environ.get(COMP_LINE_ENV_VAR, '')
+    point = int(os.environ.get(COMP_POINT_ENV_VAR, len(line)))
+    words = line[:point].split()
+    current = '' if not words or line[:point][-1:].isspace() else words.pop()
+
+    sys.stdout.write(''.join(f'{candidate}\n'
+                             for candidate in complete(load(), words[1:], current, providers)))
+
+
+def bash_script(prog: str) -> str:
+    """
+    Returns the shell command that registers the program as its own completion command in bash (or
+    zsh with bashcompinit). Completion falls back to file names when there are no candidates.
+    """
+
+    return f'complete -o default -C {prog} {prog}'
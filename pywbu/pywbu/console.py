@@ -4,12 +4,22 @@ console.py
 Type:       Python Script
 Author:     Will Brandon
 Created:    June 15, 2023
-Revised:    July 6, 2023
+Revised:    October 19, 2026
 
 Contains functionality to interact with the console.
 """
 
 import sys
+import os
+import mmap
+import json
+import threading
+from time import monotonic
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
+from datetime import datetime
+from itertools import chain, islice
 
 
 logging_enabled = True
@@ -58,6 +68,299 @@ interface_istream = sys.stdin
 Determines which input stream user interface responses will be read from.
 """
 
+TABLE_SAMPLE_SIZE = 1000
+"""
+The number of rows read ahead to compute the column widths of a table whose rows are streamed.
+Values in later rows that are wider than their column are not truncated to fit.
+"""
+
+TABLE_BLOCK_SIZE = 1000
+"""
+The number of table rows written to the output stream with each write.
+"""
+
+STYLE_CODES = {
+    'reset': '0',
+    'bold': '1',
+    'dim': '2',
+    'yellow': '0;33',
+    'red': '0;91'
+}
+"""
+The ANSI format codes of the named styles that output may be written with.
+"""
+
+DEBUG = 10
+"""
+The level of detailed diagnostic log records.
+"""
+
+INFO = 20
+"""
+The level of log records describing normal progress.
+"""
+
+WARNING = 30
+"""
+The level of log records describing problems that do not stop the program.
+"""
+
+ERROR = 40
+"""
+The level of log records describing failures.
+"""
+
+LEVEL_NAMES = {DEBUG: 'debug', INFO: 'info', WARNING: 'warning', ERROR: 'error'}
+"""
+The name of each log level.
+"""
+
+json_logs = False
+"""
+Determines whether log records are written as JSON lines instead of human readable lines.
+"""
+
+# The escape sequence of each style keyed by style name and whether formatted output is enabled.
+_escapes: dict[tuple[str, bool], str] = {}
+
+# The lowest level emitted by loggers without a more specific level and the levels set for logger
+# names and their descendants.
+_default_level = INFO
+_name_levels: dict[str, int] = {}
+
+# The logger of each name created so far.
+_loggers: dict[str, 'Logger'] = {}
+
+# Serializes writes to the console streams so text written by concurrent threads never interleaves
+# within a write.
+_write_lock = threading.Lock()
+
+# The progress line currently drawn at the bottom of the log stream on a terminal, or None. Other
+# output clears it before writing and draws it again afterwards.
+_status_line: str = None
+
+PROGRESS_RATE = 10
+"""
+The default maximum number of times per second a progress line is redrawn on a terminal.
+"""
+
+PROGRESS_LOG_INTERVAL = 5.0
+"""
+The default number of seconds between progress log lines when the log stream is not a terminal or
+formatted output is disabled.
+"""
+
+OUTPUT_MODES = ('interleaved', 'grouped')
+"""
+The ways the output of concurrent tasks may be combined. Interleaved output is written in whole
+lines as each task produces it. Grouped output is held until a task finishes and written as one
+block.
+"""
+
+
+class Logger(object):
+    """
+    Writes structured log records for a named part of a program, typically a module. Messages may
+    be strings with %-style arguments or callables returning the message and are only formatted
+    when a record is emitted. Extra keyword arguments are attached to the record as fields. A call
+    below the logger's level returns after a single comparison. Obtain loggers with get_logger.
+    """
+
+    name: str
+    """
+    The dotted name of the logger.
+    """
+
+    level: int
+    """
+    The lowest level the logger emits. It is kept up to date by set_level.
+    """
+
+
+    def __init__(self, name: str) -> None:
+        """
+        Creates a logger with the given name. Prefer get_logger, which shares one logger per name.
+        """
+
+        self.name = name
+        self.level = _level_of(name)
+
+
+    def enabled(self, level: int) -> bool:
+        """
+        Determines whether a record of the given level would be emitted, for guarding work that is
+        only needed to build a log record.
+        """
+
+        return level >= self.level
+
+
+    def debug(self, msg: str | Callable[[], str], *args: Any, **fields: Any) -> None:
+        """
+        Emits a debug record.
+        """
+
+        if DEBUG >= self.level:
+            self.__emit(DEBUG, msg, args, fields)
+
+
+    def info(self, msg: str | Callable[[], str], *args: Any, **fields: Any) -> None:
+        """
+        Emits an info record.
+        """
+
+        if INFO >= self.level:
+            self.__emit(INFO, msg, args, fields)
+
+
+    def warning(self, msg: str | Callable[[], str], *args: Any, **fields: Any) -> None:
+        """
+        Emits a warning record.
+        """
+
+        if WARNING >= self.level:
+            self.__emit(WARNING, msg, args, fields)
+
+
+    def error(self, msg: str | Callable[[], str], *args: Any, **fields: Any) -> None:
+        """
+        Emits an error record. Unlike err the program does not exit.
+        """
+
+        if ERROR >= self.level:
+            self.__emit(ERROR, msg, args, fields)
+
+
+    def __emit(self, level: int, msg: str | Callable[[], str], args: tuple, fields: dict) -> None:
+        """
+        Formats the message and writes the record to the stream of its level. Debug and info
+        records follow logging_enabled and warning records follow warnings_enabled.
+        """
+
+        # Respect the switches of the existing console message functions.
+        if level < WARNING and not logging_enabled or level == WARNING and not warnings_enabled:
+            return
+
+        # Format the message now that the record is known to be emitted.
+        text = msg() if callable(msg) else msg % args if args else msg
+        stream = log_ostream if level < WARNING else warn_ostream if level == WARNING \
+            else err_ostream
+
+        # Write the record as a JSON line or as a human readable line with the fields appended.
+        if json_logs:
+            record = {'time': datetime.now().isoformat(), 'level': LEVEL_NAMES[level],
+                      'logger': self.name, 'msg': text, **fields}
+            line = json.dumps(record, default=str)
+        else:
+            if fields:
+                text += ' ' + ' '.join(f'{key}={value}' for key, value in fields.items())
+            if level == DEBUG:
+                line = f'{escape("dim")}Debug: [{self.name}] {text}{escape("reset")}'
+            elif level == INFO:
+                line = text
+            elif level == WARNING:
+                line = f'{escape("yellow")}Warning:{escape("reset")} {text}'
+            else:
+                line = f'{escape("red")}Error:{escape("reset")} {text}'
+
+        _write(stream, f'{line}\n')
+
+
+def _level_of(name: str) -> int:
+    """
+    Returns the level set for the given logger name or its closest dotted ancestor, or the default
+    level if none was set.
+    """
+
+    while True:
+        if name in _name_levels:
+            return _name_levels[name]
+        if '.' not in name:
+            return _default_level
+        name = name.rpartition('.')[0]
+
+
+def get_logger(name: str) -> Logger:
+    """
+    Returns the logger with the given dotted name, typically the __name__ of the calling module,
+    creating it if needed.
+    """
+
+    logger = _loggers.get(name)
+
+    if logger is None:
+        logger = _loggers.setdefault(name, Logger(name))
+
+    return logger
+
+
+def set_level(level: int, name: str=None) -> None:
+    """
+    Sets the lowest level emitted by the logger with the given name and its descendants, or by
+    every logger without a more specific level if no name is given. The levels of existing loggers
+    are updated at once so logging calls never look them up.
+    """
+
+    global _default_level
+
+    if name is None:
+        _default_level = level
+    else:
+        _name_levels[name] = level
+
+    for logger in list(_loggers.values()):
+        logger.level = _level_of(logger.name)
+
+
+def parse_level(name: str) -> int:
+    """
+    Returns the log level with the given case-insensitive name.
+    """
+
+    for level, level_name in LEVEL_NAMES.items():
+        if level_name == name.strip().lower():
+            return level
+
+    raise ValueError(f'Unknown log level "{name}". Expected one of ' \
+                     + f'{", ".join(LEVEL_NAMES.values())}.')
+
+
+def configure_levels(spec: str) -> None:
+    """
+    Sets log levels from a comma-separated specification of level names, which set the default
+    level, and "name=level" pairs, which set the level of a logger and its descendants. For example
+    "warning,stax.build=debug".
+    """
+
+    for item in filter(None, (item.strip() for item in spec.split(','))):
+        name, _, level = item.rpartition('=')
+        set_level(parse_level(level), name.strip() or None)
+
+
+def save_levels() -> tuple[int, dict[str, int]]:
+    """
+    Returns the default level and the levels set for logger names so they can be restored later by
+    restore_levels.
+    """
+
+    return _default_level, dict(_name_levels)
+
+
+def restore_levels(levels: tuple[int, dict[str, int]]) -> None:
+    """
+    Restores the log levels saved by save_levels, discarding any levels set since. The levels of
+    existing loggers are updated at once.
+    """
+
+    global _default_level
+
+    _default_level = levels[0]
+    _name_levels.clear()
+    _name_levels.update(levels[1])
+
+    for logger in list(_loggers.values()):
+        logger.level = _level_of(logger.name)
+
 
 def output(content: str='', newline: bool=True) -> None:
     """
@@ -66,8 +369,505 @@ def output(content: str='', newline: bool=True) -> None:
 
     # Write the content and append a newline if the option is true. Flush the stream to ensure the
     # content is written.
-    output_ostream.write(f'{content}\n' if newline else content)
-    output_ostream.flush()
+    _write(output_ostream, f'{content}\n' if newline else content)
+
+
+def escape(style: str) -> str:
+    """
+    Returns the ANSI escape sequence of the given named style, or an empty string if formatted
+    output is disabled. The sequences are built once and cached.
+    """
+
+    key = (style, formatted_output)
+    sequence = _escapes.get(key)
+
+    if sequence is None:
+        sequence = f'\033[{STYLE_CODES[style]}m' if formatted_output else ''
+        _escapes[key] = sequence
+
+    return sequence
+
+
+def output_width() -> int:
+    """
+    Returns the width of the terminal the output stream is attached to, or None if the output stream
+    is not a terminal (such as when it is piped to a file or another program) or does not report
+    its width.
+    """
+
+    try:
+        if output_ostream.isatty():
+            return os.get_terminal_size(output_ostream.fileno()).columns or None
+    except (AttributeError, ValueError, OSError):
+        pass
+
+    return None
+
+
+def _cells(row: Sequence) -> list[str]:
+    """
+    Converts the values of a table row to strings with None values blank.
+    """
+
+    return ['' if value is None else str(value) for value in row]
+
+
+def _write(stream: Any, text: str) -> None:
+    """
+    Writes text to a stream and flushes the stream while holding the write lock.
+    """
+
+    with _write_lock:
+        _hide_status()
+        stream.write(text)
+        stream.flush()
+        _show_status()
+
+
+def _hide_status() -> None:
+    """
+    Clears the progress line from the terminal, if one is drawn, so other output starts on a clean
+    line. The write lock must be held.
+    """
+
+    if _status_line is not None:
+        log_ostream.write('\r\033[K')
+
+
+def _show_status() -> None:
+    """
+    Draws the progress line again, if one is drawn, after other output. The write lock must be
+    held.
+    """
+
+    if _status_line is not None:
+        log_ostream.write(_status_line)
+        log_ostream.flush()
+
+
+def _write_lines(lines: list[str]) -> None:
+    """
+    Writes the given lines to the output stream with a single write and flush.
+    """
+
+    _write(output_ostream, '\n'.join(lines) + '\n')
+
+
+def table(
+        headers: Sequence[str],
+        rows: Iterable[Sequence],
+        align: str=None,
+        truncate: bool=True) -> int:
+    """
+    Outputs rows of values as a table with a header row. Each column is as wide as its widest value
+    except the last, which is not padded. The alignment string holds a '<' (left) or '>' (right)
+    for each column and defaults to left alignment. None values are displayed as blank. If the rows
+    are a sequence the widths are computed from every row in one pass. Otherwise the rows are
+    streamed and the widths are computed from a sample of the first rows. Lines are truncated to
+    the width of the terminal unless truncation is disabled or the output is not a terminal. Rows
+    are written in blocks with one write each. Returns the number of rows written.
+    """
+
+    align = align or '<' * len(headers)
+    width = output_width() if truncate else None
+
+    # Convert the values of the rows needed to compute the column widths to strings.
+    if isinstance(rows, Sequence):
+        sample, rest = [_cells(row) for row in rows], iter(())
+    else:
+        rows = iter(rows)
+        sample, rest = [_cells(row) for row in islice(rows, TABLE_SAMPLE_SIZE)], rows
+
+    # Compute the column widths and build a template that pads every column except the last.
+    widths = [max(len(value) for value in column) for column in zip(headers, *sample)]
+    template = ' '.join([f'{{:{a}{w}}}' for a, w in zip(align, widths[:-1])] + ['{}'])
+
+    # Format the header with the header style.
+    header = template.format(*headers).rstrip()
+    if width is not None:
+        header = header[:width]
+    lines = [f'{escape("bold")}{header}{escape("reset")}']
+    count = 0
+
+    # Format the rows, writing the lines in blocks.
+    for row in chain(sample, (_cells(row) for row in rest)):
+        line = template.format(*row).rstrip()
+        lines.append(line if width is None else line[:width])
+        count += 1
+
+        if len(lines) >= TABLE_BLOCK_SIZE:
+            _write_lines(lines)
+            lines = []
+
+    if lines:
+        _write_lines(lines)
+
+    return count
+
+
+def key_values(pairs: Iterable[tuple[str, object]]) -> None:
+    """
+    Outputs pairs of keys and values as lines of the form "Key: value" with the values aligned.
+    Pairs whose value is None are omitted. Lines are truncated to the width of the terminal unless
+    the output is not a terminal. The lines are written with one write.
+    """
+
+    pairs = [(f'{key}:', str(value)) for key, value in pairs if value is not None]
+    if not pairs:
+        return
+
+    # Align the values after the longest key.
+    key_width = max(len(key) for key, _ in pairs)
+    width = output_width()
+    lines = [f'{key:<{key_width}} {value}' for key, value in pairs]
+
+    _write_lines(lines if width is None else [line[:width] for line in lines])
+
+
+class TaskOutput(object):
+    """
+    Buffers the output of one task, such as a worker thread, so it reaches the output stream in
+    whole lines. Each line is given the task's prefix. In interleaved mode the complete lines of
+    each write are committed at once as one block. In grouped mode every line is held until the
+    task output is closed and committed as one block, so the output of a task is never split by
+    the output of other tasks. Committing takes the console write lock once per block rather than
+    once per line. Use as a context manager to close the output automatically.
+    """
+
+    prefix: str
+    """
+    The text put before every line.
+    """
+
+    mode: str
+    """
+    Either "interleaved" or "grouped".
+    """
+
+    __lines: list[str]
+    """
+    The complete lines that have not been committed.
+    """
+
+    __partial: str
+    """
+    The text written after the last newline.
+    """
+
+
+    def __init__(self, prefix: str='', mode: str='interleaved') -> None:
+        """
+        Creates a task output with the given line prefix and mode.
+        """
+
+        if mode not in OUTPUT_MODES:
+            raise ValueError(f'Unknown output mode "{mode}". Expected one of ' \
+                             + f'{", ".join(OUTPUT_MODES)}.')
+
+        self.prefix = prefix
+        self.mode = mode
+        self.__lines = []
+        self.__partial = ''
+
+
+    def write(self, text: str) -> None:
+        """
+        Writes text to the buffer. Text after the last newline is held until its line is complete.
+        """
+
+        # Split the complete lines from the text, keeping any unfinished line.
+        *lines, self.__partial = (self.__partial + text).split('\n')
+        self.__lines.extend(f'{self.prefix}{line}' for line in lines)
+
+        if self.mode == 'interleaved':
+            self.flush()
+
+
+    def line(self, text: str='') -> None:
+        """
+        Writes a complete line to the buffer.
+        """
+
+        self.write(f'{text}\n')
+
+
+    def flush(self) -> None:
+        """
+        Commits the complete lines in the buffer to the output stream as one block.
+        """
+
+        if self.__lines:
+            lines, self.__lines = self.__lines, []
+            _write_lines(lines)
+
+
+    def close(self) -> None:
+        """
+        Completes any unfinished line and commits everything in the buffer.
+        """
+
+        if self.__partial:
+            self.__lines.append(f'{self.prefix}{self.__partial}')
+            self.__partial = ''
+
+        self.flush()
+
+
+    def __enter__(self) -> 'TaskOutput':
+        """
+        Returns the task output for use in a with block.
+        """
+
+        return self
+
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """
+        Closes the task output at the end of a with block.
+        """
+
+        self.close()
+
+
+class Progress(object):
+    """
+    Reports the progress of a long operation with a count, a throughput, and, when the total is
+    known, a percentage and an estimated time remaining. The hot loop only adds to the count while
+    a background ticker reports it at a bounded rate. On a terminal with formatted output a single
+    line is redrawn in place at most rate times per second. Otherwise a log line is written every
+    log interval. Nothing is reported if logging is disabled. Use as a context manager to start the
+    ticker and report the final count automatically.
+    """
+
+    label: str
+    """
+    The text describing what is counted.
+    """
+
+    total: int
+    """
+    The number of items expected or None if unknown. It may be set after the progress has started,
+    such as once a discovery finishes.
+    """
+
+    count: int
+    """
+    The number of items finished so far. Add to it directly or with advance. Add from one thread,
+    such as the thread collecting the results of a pool.
+    """
+
+    __interval: float
+    """
+    The number of seconds between reports.
+    """
+
+    __inline: bool
+    """
+    Whether the progress is redrawn in place on a terminal instead of logged periodically.
+    """
+
+    __start: float
+    """
+    The monotonic time the progress started.
+    """
+
+    __stopped: threading.Event
+    """
+    Set when the progress stops to wake the ticker.
+    """
+
+    __ticker: threading.Thread
+    """
+    The background thread reporting the progress or None if it is not running.
+    """
+
+    __reported: bool
+    """
+    Whether the progress has been reported at least once.
+    """
+
+
+    def __init__(self,
+                 label: str,
+                 total: int=None,
+                 rate: float=PROGRESS_RATE,
+                 log_interval: float=PROGRESS_LOG_INTERVAL) -> None:
+        """
+        Creates a progress report with the given label and optional total. The rate bounds the
+        redraws per second on a terminal and the log interval is the number of seconds between log
+        lines otherwise.
+        """
+
+        try:
+            terminal = log_ostream.isatty()
+        except (AttributeError, ValueError):
+            terminal = False
+
+        self.label = label
+        self.total = total
+        self.count = 0
+        self.__inline = terminal and formatted_output
+        self.__interval = 1 / rate if self.__inline else log_interval
+        self.__start = monotonic()
+        self.__stopped = threading.Event()
+        self.__ticker = None
+        self.__reported = False
+
+
+    def advance(self, amount: int=1) -> None:
+        """
+        Adds to the number of items finished.
+        """
+
+        self.count += amount
+
+
+    def render(self) -> str:
+        """
+        Returns the current progress as text, such as "Indexing: 1200/5000 (24.0%) 850/s ETA
+        0:00:04".
+        """
+
+        count, total = self.count, self.total
+        elapsed = monotonic() - self.__start
+        rate = count / elapsed if elapsed > 0 else 0.0
+
+        text = f'{self.label}: {count}'
+        if total:
+            text += f'/{total} ({min(count / total, 1):.1%})'
+        text += f' {rate:,.0f}/s'
+        if total and rate > 0 and count < total:
+            text += f' ETA {timedelta(seconds=round((total - count) / rate))}'
+
+        return text
+
+
+    def start(self) -> 'Progress':
+        """
+        Starts the background ticker unless logging is disabled. Returns the progress.
+        """
+
+        if logging_enabled and self.__ticker is None:
+            self.__start = monotonic()
+            self.__ticker = threading.Thread(target=self.__tick, name='progress', daemon=True)
+            self.__ticker.start()
+
+        return self
+
+
+    def stop(self) -> None:
+        """
+        Stops the ticker and reports the final progress on its own line. Operations that finish
+        before the first report leave no output.
+        """
+
+        global _status_line
+
+        if self.__ticker is None:
+            return
+
+        self.__stopped.set()
+        self.__ticker.join()
+        self.__ticker = None
+
+        if not self.__reported:
+            return
+
+        # Replace the line drawn in place, if any, with the final progress.
+        with _write_lock:
+            if self.__inline:
+                _hide_status()
+                _status_line = None
+            log_ostream.write(f'{self.render()}\n')
+            log_ostream.flush()
+
+
+    def __tick(self) -> None:
+        """
+        Runs on the ticker thread. Reports the progress every interval until stopped.
+        """
+
+        global _status_line
+
+        while not self.__stopped.wait(self.__interval):
+            text = self.render()
+            self.__reported = True
+
+            with _write_lock:
+                if self.__inline:
+                    _hide_status()
+                    _status_line = text
+                    _show_status()
+                else:
+                    log_ostream.write(f'{text}\n')
+                    log_ostream.flush()
+
+
+    def __enter__(self) -> 'Progress':
+        """
+        Starts the progress for use in a with block.
+        """
+
+        return self.start()
+
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """
+        Stops the progress at the end of a with block.
+        """
+
+        self.stop()
+
+
+def output_file(path: Path, newline: bool=True) -> None:
+    """
+    Outputs the raw content of the file at the given path to the output stream without decoding or
+    re-encoding it. Where the platform allows, the kernel copies the bytes directly to the stream
+    with sendfile. Otherwise the file is memory-mapped and written to the underlying binary buffer.
+    By default a newline is included.
+    """
+
+    # Hold the write lock so text written by other threads never lands inside the file content.
+    with _write_lock:
+        _hide_status()
+
+        # Flush any text already written to the stream so the file content appears in order.
+        output_ostream.flush()
+
+        # Open the file for reading raw bytes in an auto-closeable block.
+        with open(path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            offset = 0
+
+            # Try to have the kernel copy the file directly to the stream's file descriptor. Streams
+            # without a file descriptor or platforms that reject the descriptor fall through.
+            try:
+                out_fd = output_ostream.fileno()
+                while offset < size:
+                    sent = os.sendfile(out_fd, file.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except (AttributeError, ValueError, OSError):
+                pass
+
+            # Write any remaining content from a memory map of the file. Text streams without a
+            # binary buffer receive the decoded content instead.
+            if offset < size:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    buffer = getattr(output_ostream, 'buffer', None)
+                    if buffer is not None:
+                        buffer.write(content[offset:])
+                        buffer.flush()
+                    else:
+                        output_ostream.write(content[offset:].decode())
+
+        # Append a newline if the option is true and flush the stream to ensure the content is
+        # written.
+        if newline:
+            output_ostream.write('\n')
+        output_ostream.flush()
+        _show_status()
 
 
 def log(msg: str=None, spacing: tuple[int, int]=(0, 0)) -> bool:
@@ -88,8 +888,7 @@ def log(msg: str=None, spacing: tuple[int, int]=(0, 0)) -> bool:
     
     # Write the message to the appropriate output stream then flush the stream to ensure the message
     # is displayed.
-    log_ostream.write(f'{top}{msg if msg else ""}{bottom}\n')
-    log_ostream.flush()
+    _write(log_ostream, f'{top}{msg if msg else ""}{bottom}\n')
 
     # Return true indicating that the log message was successfully written to the stream.
     return True
@@ -115,12 +914,9 @@ def warn(msg: str, exit_code: int=None, spacing: tuple[int, int]=(0, 0)) -> bool
     # Display a formatted warning message if formatted output is enabled. Otherwise display an
     # unformatted message.
     if formatted_output:
-        warn_ostream.write(f'{top}\033[0;33mWarning:\033[0m {msg}{bottom}\n')
+        _write(warn_ostream, f'{top}\033[0;33mWarning:\033[0m {msg}{bottom}\n')
     else:
-        warn_ostream.write(f'{top}Warning: {msg}{bottom}\n')
-    
-    # Flush the stream to ensure the message is displayed.
-    warn_ostream.flush()
+        _write(warn_ostream, f'{top}Warning: {msg}{bottom}\n')
 
     # If the exit code is not None exit with the given code.
     if exit_code != None:
@@ -165,12 +961,9 @@ def err(msg: str, exit_code: int=1, spacing: tuple[int, int]=(0, 0)) -> None:
     # Display a formatted error message if formatted output is enabled. Otherwise display an
     # unformatted message.
     if formatted_output:
-        err_ostream.write(f'{top}\033[0;91mError:\033[0m {msg}{bottom}\n')
+        _write(err_ostream, f'{top}\033[0;91mError:\033[0m {msg}{bottom}\n')
     else:
-        err_ostream.write(f'{top}Error: {msg}{bottom}\n')
-    
-    # Flush the stream to ensure the message is displayed.
-    err_ostream.flush()
+        _write(err_ostream, f'{top}Error: {msg}{bottom}\n')
 
     # If the exit code is not None exit with the given code.
     if exit_code != None:
@@ -4,13 +4,24 @@ filesystem.py
 Type:       Python Script
 Author:     Will Brandon
 Created:    June 30, 2023
-Revised:    July 2, 2023
+Revised:    October 19, 2026
 
 Contains functionality to interact with the filesystem.
 """
 
 import os
 from pathlib import Path
+from typing import IO, Iterator
+from contextlib import contextmanager
+import tempfile
+import shutil as shu
+
+# The fcntl module only exists on Unix-like platforms. Cloning falls back to other methods without
+# it.
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 
 ROOT = Path('/')
@@ -18,6 +29,17 @@ ROOT = Path('/')
 A path to the root directory on the filesystem.
 """
 
+FICLONE = 0x40049409
+"""
+The Linux ioctl request number that clones the extents of one file into another (a reflink) on
+filesystems with copy-on-write support such as Btrfs and XFS.
+"""
+
+# Read the process umask once at import time. The umask can only be read by setting it, which is not
+# safe to do later once other threads may be creating files.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 def cwd() -> Path:
     """
@@ -64,3 +86,123 @@ def parent_step(path: Path, steps: int=1) -> Path:
 
     # Recursively continue traversing up the directory tree if more steps are present.
     return parent_step(path.parent, steps - 1)
+
+
+@contextmanager
+def atomic_open(path: Path, mode: str='w') -> Iterator[IO]:
+    """
+    Opens a temporary file beside the given path for writing and yields it. When the block exits
+    without an exception the temporary file replaces the given path in a single rename so readers
+    see either the old or the new content, never a partial write. If the block raises an exception
+    the temporary file is removed and the given path is left untouched.
+    """
+
+    # Create the temporary file in the same directory so the final rename stays on one filesystem.
+    fd, temp_path = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+
+    # Try to yield the open temporary file then move it into place.
+    try:
+        with os.fdopen(fd, mode) as file:
+            yield file
+
+        # Keep the permissions of the file being replaced, or the usual defaults for a new file.
+        try:
+            os.chmod(temp_path, os.stat(path).st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(temp_path, 0o666 & ~_UMASK)
+
+        os.replace(temp_path, path)
+
+    # On any failure remove the temporary file and propagate the exception.
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def reflink(source: Path, target: Path) -> bool:
+    """
+    Tries to create the target file as a copy-on-write clone of the source file. The clone shares
+    the source's storage until either file is modified, so it is as fast as a link but as safe as a
+    copy. Returns false without leaving a target file if the platform or filesystem does not
+    support cloning.
+    """
+
+    # Cloning requires the Linux ioctl.
+    if fcntl is None:
+        return False
+
+    # Try to clone the source into a new target file, removing the target if the clone fails.
+    with open(source, 'rb') as src, open(target, 'xb') as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            cloned = True
+        except OSError:
+            cloned = False
+
+    if not cloned:
+        os.unlink(target)
+        return False
+
+    shu.copystat(source, target)
+    return True
+
+
+def copy_range(source: Path, target: Path) -> bool:
+    """
+    Tries to create the target file as a copy of the source file made within the kernel with
+    copy_file_range, which some filesystems complete by sharing extents or copying on the server.
+    Returns false without leaving a target file if the platform or filesystem does not support it.
+    """
+
+    # The system call is only exposed on Linux.
+    if not hasattr(os, 'copy_file_range'):
+        return False
+
+    # Copy the source into a new target file, removing the target if the copy fails.
+    with open(source, 'rb') as src, open(target, 'xb') as dst:
+        try:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if not copied:
+                    break
+                remaining -= copied
+            complete = remaining <= 0
+        except OSError:
+            complete = False
+
+    if not complete:
+        os.unlink(target)
+        return False
+
+    shu.copystat(source, target)
+    return True
+
+
+def clone_file(source: Path, target: Path, hardlink: bool=True) -> str:
+    """
+    Makes the target file hold the content of the source file as cheaply as the filesystem allows.
+    A copy-on-write clone is tried first, then (if allowed) a hard link sharing the source's inode,
+    then an in-kernel range copy, and finally a regular copy. The target must not exist. Returns
+    the method that was used: "reflink", "hardlink", "range", or "copy".
+    """
+
+    if reflink(source, target):
+        return 'reflink'
+
+    # Hard links fail across filesystems and on filesystems without link support.
+    if hardlink:
+        try:
+            os.link(source, target)
+            return 'hardlink'
+        except OSError:
+            pass
+
+    if copy_range(source, target):
+        return 'range'
+
+    shu.copy2(source, target)
+    return 'copy'
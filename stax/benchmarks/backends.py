@@ -0,0 +1,91 @@
+"""
+backends.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Benchmarks the stax module storage backends against each other. For each module count a temporary
+project is created, converted to each layout, and timed for a full load, a single module lookup, a
+batch of single module updates, and a streamed scan.
+
+Usage:      python3 benchmarks/backends.py [-s SIZES...] [-u UPDATES]
+"""
+
+from pathlib import Path
+from argparse import ArgumentParser
+from datetime import date, timedelta
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from stax.project import create_project, Project
+from stax.config import STORAGE_LAYOUTS
+from stax.records import ModuleRecord
+
+
+def timed(func) -> float:
+    """
+    Calls the given function and returns the elapsed wall-clock time in milliseconds.
+    """
+
+    start = perf_counter()
+    func()
+    return (perf_counter() - start) * 1000
+
+
+def bench(size: int, updates: int) -> None:
+    """
+    Runs the benchmark for every layout with a project holding the given number of modules.
+    """
+
+    # Create a temporary project and fill it with synthetic modules.
+    with TemporaryDirectory() as temp:
+        root = Path(temp) / 'bench'
+        create_project(root)
+        config = Project(root).config()
+
+        modules = [ModuleRecord(f'module-{i:07d}', date(2020, 1, 1) + timedelta(days=i % 1500),
+                                f'synthetic module {i}' if i % 2 else None)
+                   for i in range(size)]
+        config.backend().create(modules)
+
+        for layout in STORAGE_LAYOUTS:
+
+            # Convert the project to the layout being measured.
+            config.convert(layout)
+            target = modules[size // 2].name
+
+            # Time each access pattern.
+            load = timed(config.record)
+            get = timed(lambda: config.module(target))
+            scan = timed(lambda: sum(1 for _ in config.iter_modules()))
+            update = timed(lambda: [config.set_module_record(modules[(i * 7919) % size])
+                                    for i in range(updates)])
+
+            print(f'{size:>8} {layout:<8} {load:>10.1f} {get:>10.2f} {scan:>10.1f} ' \
+                  + f'{update / updates:>12.2f}')
+
+
+def main() -> None:
+    """
+    Parses the command-line arguments and runs the benchmark for each size.
+    """
+
+    parser = ArgumentParser(description='Benchmarks the stax module storage backends.')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='the module counts to benchmark (default 1000 10000 100000)')
+    parser.add_argument('-u', '--updates', type=int, default=20,
+                        help='the number of single module updates to time (default 20)')
+    args = parser.parse_args()
+
+    # Output a header followed by one row per size and layout. Times are in milliseconds.
+    print(f'{"modules":>8} {"layout":<8} {"load":>10} {"get":>10} {"scan":>10} ' \
+          + f'{"update/each":>12}')
+
+    for size in args.sizes:
+        bench(size, args.updates)
+
+
+# Run the benchmark when executed as a script.
+if __name__ == '__main__':
+    main()
@@ -4,7 +4,7 @@ setup.py
 Type:       Python Package Setup Script
 Author:     Will Brandon
 Created:    June 23, 2023
-Revised:    July 6, 2023
+Revised:    October 19, 2026
 
 Builds and installs the stax package.
 """
@@ -23,9 +23,12 @@ setup.setup(
     author='Will Brandon',
     packages=setup.find_packages(),
     install_requires=['pywbu'],
+    extras_require={
+        'stats': ['numpy']
+    },
     entry_points={
         'console_scripts': [
-            'stax=stax.cli.cli:main'
+            'stax=stax.cli.complete:main'
         ]
     },
     classifiers=[
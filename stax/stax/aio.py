@@ -0,0 +1,446 @@
+"""
+aio.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Provides an asyncio interface to stax projects and their configurations. Filesystem work is run on
+a managed thread pool so it never blocks the event loop, concurrent reads of a configuration share
+a single load whose result is cached until the configuration changes, and writes to a project are
+serialized.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from datetime import date
+import asyncio
+import threading
+import weakref
+import pywbu.filesystem as fs
+import stax.project as proj
+from stax.config import Config
+from stax.records import ModuleRecord, ProjectRecord
+
+
+DEFAULT_WORKERS = 8
+"""
+The number of threads in the managed executor that runs filesystem work.
+"""
+
+# The executor that runs filesystem work, created when first needed, and the lock guarding it.
+_executor: Executor = None
+_executor_lock = threading.Lock()
+
+# The shared asynchronous projects of each event loop keyed by canonical root path. Projects are
+# kept per loop because their locks and refreshes belong to the loop they are used on, and a loop's
+# projects are forgotten once the loop is discarded (such as after each asyncio.run).
+_projects: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Path, AsyncProject]]' = \
+    weakref.WeakKeyDictionary()
+
+
+def executor() -> Executor:
+    """
+    Returns the executor that runs filesystem work, creating the managed thread pool if no executor
+    has been set.
+    """
+
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(DEFAULT_WORKERS, thread_name_prefix='stax-aio')
+        return _executor
+
+
+def set_executor(pool: Executor) -> None:
+    """
+    Replaces the executor that runs filesystem work, such as with an executor shared with the rest
+    of an application. The previous executor is not shut down.
+    """
+
+    global _executor
+
+    with _executor_lock:
+        _executor = pool
+
+
+def shutdown(wait: bool=True) -> None:
+    """
+    Shuts down the executor that runs filesystem work. A new managed executor is created if more
+    work is submitted afterwards.
+    """
+
+    global _executor
+
+    with _executor_lock:
+        pool, _executor = _executor, None
+
+    if pool is not None:
+        pool.shutdown(wait)
+
+
+async def _run(func: Callable, *args: Any) -> Any:
+    """
+    Runs a blocking function on the executor and waits for its result without blocking the event
+    loop.
+    """
+
+    return await asyncio.get_running_loop().run_in_executor(executor(), partial(func, *args))
+
+
+class AsyncConfig(object):
+    """
+    Provides asynchronous access to a project configuration. The project record is cached along
+    with the stamp of the configuration it was read from, so reads only load the configuration
+    again once it has changed. Concurrent reads share one refresh. Cached records and models are
+    shared between callers and must not be modified.
+    """
+
+    config: Config
+    """
+    The configuration manager that performs the blocking work.
+    """
+
+    __project: 'AsyncProject'
+    """
+    The project the configuration belongs to, which holds the write lock.
+    """
+
+    __stamp: list[int]
+    """
+    The stamp of the configuration the cached record was read from or None if nothing is cached.
+    """
+
+    __record: ProjectRecord
+    """
+    The cached project record.
+    """
+
+    __model: dict
+    """
+    The cached model dictionary derived from the cached record or None until first requested.
+    """
+
+    __index: dict[str, ModuleRecord]
+    """
+    The cached module records keyed by name or None until first requested.
+    """
+
+    __generation: int
+    """
+    The number of times the cache has been invalidated. A refresh started in an earlier generation
+    may predate a write, so readers never join it.
+    """
+
+    __refresh: tuple[int, asyncio.Future]
+    """
+    The generation and future of the refresh in progress, shared by concurrent readers, or None.
+    """
+
+
+    def __init__(self, config: Config, project: 'AsyncProject') -> None:
+        """
+        Creates asynchronous access to the given configuration of the given project.
+        """
+
+        self.config = config
+        self.__project = project
+        self.__stamp = None
+        self.__record = None
+        self.__model = None
+        self.__index = None
+        self.__generation = 0
+        self.__refresh = None
+
+
+    def __load(self, stamp: list[int]) -> tuple[list[int], ProjectRecord]:
+        """
+        Runs on the executor. Returns the current stamp and the freshly read record, or the stamp
+        and None if the configuration is unchanged since the given stamp. The stamp is captured
+        before reading so a concurrent rewrite is never mistaken for the cached state.
+        """
+
+        current = self.config.stamp()
+        if current == stamp:
+            return current, None
+
+        return current, self.config.record()
+
+
+    async def __refresh_cache(self, generation: int) -> ProjectRecord:
+        """
+        Loads the configuration if it changed since the cached record was read and returns the
+        current record. The cache is only replaced if no invalidation happened in the meantime.
+        """
+
+        try:
+            stamp, record = await _run(self.__load, self.__stamp)
+            record = self.__record if record is None else record
+
+            if generation == self.__generation:
+                if record is not self.__record:
+                    self.__record, self.__model, self.__index = record, None, None
+                self.__stamp = stamp
+
+            return record
+
+        finally:
+            if self.__refresh and self.__refresh[0] == generation:
+                self.__refresh = None
+
+
+    async def __refreshed(self) -> ProjectRecord:
+        """
+        Ensures the cached record reflects the current configuration and returns it. A refresh
+        already in progress in the current generation is joined instead of starting another.
+        """
+
+        # Start a refresh unless one is in progress in this generation.
+        if self.__refresh is None or self.__refresh[0] != self.__generation:
+            future = asyncio.ensure_future(self.__refresh_cache(self.__generation))
+            self.__refresh = (self.__generation, future)
+
+        # Shield the refresh so a cancelled reader does not cancel it for the other readers.
+        return await asyncio.shield(self.__refresh[1])
+
+
+    def invalidate(self) -> None:
+        """
+        Discards the cached record so the next read loads the configuration again.
+        """
+
+        self.__stamp = None
+        self.__generation += 1
+
+
+    async def record(self) -> ProjectRecord:
+        """
+        Returns the validated project record.
+        """
+
+        return await self.__refreshed()
+
+
+    async def model(self) -> dict:
+        """
+        Returns the validated model dictionary object.
+        """
+
+        record = await self.__refreshed()
+
+        # Derive the model once per cached record.
+        if self.__record is not record:
+            return record.to_dict()
+        if self.__model is None:
+            self.__model = record.to_dict()
+        return self.__model
+
+
+    async def modules(self) -> list[ModuleRecord]:
+        """
+        Returns the module records in configuration order.
+        """
+
+        return (await self.__refreshed()).modules
+
+
+    async def module(self, name: str) -> ModuleRecord:
+        """
+        Returns the record of the module with the given name or None if no such module exists. The
+        lookup uses an index of the cached modules.
+        """
+
+        record = await self.__refreshed()
+
+        # Index the modules once per cached record.
+        if self.__record is not record:
+            return record.module(name)
+        if self.__index is None:
+            self.__index = {module.name: module for module in record.modules}
+        return self.__index.get(name)
+
+
+    async def __write(self, func: Callable, *args: Any) -> Any:
+        """
+        Runs a blocking write on the executor while holding the project's write lock, then
+        discards the cached record.
+        """
+
+        async with self.__project.write_lock():
+            try:
+                return await _run(func, *args)
+            finally:
+                self.invalidate()
+
+
+    async def set_module(self, name: str, creation_date: date, desc: str=None) -> bool:
+        """
+        Sets the given module data. Returns true if a module with the given name already existed.
+        """
+
+        return await self.set_module_record(ModuleRecord(name, creation_date, desc))
+
+
+    async def set_module_record(self, module: ModuleRecord) -> bool:
+        """
+        Sets the given module record. Returns true if a module with the same name already existed.
+        """
+
+        return await self.__write(self.config.set_module_record, module)
+
+
+    async def set_modules(self, modules: Iterable[ModuleRecord]) -> int:
+        """
+        Sets every given module record with a single write. Returns the number of modules that
+        already existed.
+        """
+
+        return await self.__write(self.config.set_modules, list(modules))
+
+
+    async def convert(self, layout: str) -> int:
+        """
+        Converts the configuration to the given module storage layout. Returns the number of
+        modules converted.
+        """
+
+        return await self.__write(self.config.convert, layout)
+
+
+    async def validate(self) -> None:
+        """
+        Validates the whole configuration against the schema.
+        """
+
+        await _run(self.config.validate)
+
+
+class AsyncProject(object):
+    """
+    Provides asynchronous access to a stax project. One instance is shared by every caller opening
+    the same project root on the same event loop so its cached configuration and write lock are
+    shared too. Instances belong to the event loop they were opened on.
+    """
+
+    project: proj.Project
+    """
+    The project that performs the blocking work.
+    """
+
+    __config: AsyncConfig
+    """
+    The asynchronous configuration or None until first requested.
+    """
+
+    __lock: asyncio.Lock
+    """
+    Serializes writes to the project or None until the first write.
+    """
+
+
+    def __init__(self, project: proj.Project) -> None:
+        """
+        Creates asynchronous access to the given project. Prefer open_project or enclosing_project,
+        which share one instance per project root and event loop.
+        """
+
+        self.project = project
+        self.__config = None
+        self.__lock = None
+
+
+    @property
+    def root(self) -> Path:
+        """
+        The canonical path to the root directory of the project.
+        """
+
+        return self.project.root
+
+
+    @property
+    def meta_dir(self) -> Path:
+        """
+        The canonical path to the metadata directory in the project.
+        """
+
+        return self.project.meta_dir
+
+
+    def write_lock(self) -> asyncio.Lock:
+        """
+        Returns the lock that serializes writes to the project.
+        """
+
+        if self.__lock is None:
+            self.__lock = asyncio.Lock()
+        return self.__lock
+
+
+    async def config(self) -> AsyncConfig:
+        """
+        Returns the asynchronous configuration of the project.
+        """
+
+        if self.__config is None:
+            config = await _run(self.project.config)
+            if self.__config is None:
+                self.__config = AsyncConfig(config, self)
+
+        return self.__config
+
+
+    async def dismantle(self) -> None:
+        """
+        Dismantles the project once every write in progress has finished. The project must not be
+        used afterwards.
+        """
+
+        async with self.write_lock():
+            await _run(self.project.dismantle)
+            _loop_projects().pop(self.root, None)
+
+
+def _loop_projects() -> dict[Path, AsyncProject]:
+    """
+    Returns the shared asynchronous projects of the running event loop keyed by root.
+    """
+
+    loop = asyncio.get_running_loop()
+    projects = _projects.get(loop)
+
+    if projects is None:
+        projects = _projects[loop] = {}
+
+    return projects
+
+
+def _shared(project: proj.Project) -> AsyncProject:
+    """
+    Returns the shared asynchronous project of the given project's root on the running event loop.
+    """
+
+    return _loop_projects().setdefault(project.root, AsyncProject(project))
+
+
+async def open_project(root: Path) -> AsyncProject:
+    """
+    Returns the shared asynchronous project at the given root. Raises an exception if the directory
+    is not a stax project.
+    """
+
+    return _shared(await _run(proj.open_project, root))
+
+
+async def enclosing_project(path: Path=None) -> AsyncProject:
+    """
+    Finds the shared asynchronous project enclosing the given path (the current working directory
+    by default). If an enclosing project does not exist None is returned.
+    """
+
+    project = await _run(proj.enclosing_project, path if path is not None else fs.cwd())
+    return _shared(project) if project else None
@@ -0,0 +1,388 @@
+"""
+build.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Builds the modules of a stax project in dependency order. Each module's build is keyed by a hash of
+its configuration entry, its build file, its input files, and the keys of the modules it depends on
+so unchanged modules are restored from the artifact cache instead of being built again.
+"""
+
+from pathlib import Path
+from typing import Iterable
+import json
+import hashlib
+import threading
+import subprocess
+import pywbu.console as csl
+import pywbu.filesystem as fs
+from pywbu.exc import MalformedDataException
+from stax.project import Project
+from stax.modules import MODULES_DIR_NAME
+from stax.records import ModuleRecord
+from stax.graph import ModuleGraph, WaveResult, run_waves
+from stax.cache import DEFAULT_MAX_SIZE, ArtifactCache, check_output_path, remove_outputs
+
+
+BUILD_FILE_NAME = 'build.json'
+"""
+The name of the file in a module directory describing how the module is built. It holds a "command"
+(a shell command string or a list of arguments) run in the module directory, the "outputs" it
+produces (paths relative to the module directory), and optionally the "inputs" it reads (glob
+patterns relative to the module directory, every file by default).
+"""
+
+DIGESTS_FILE_NAME = 'digests.json'
+"""
+The name of the file in the cache directory that remembers the digest of each input file along with
+its size and modification time so unchanged files are not read again.
+"""
+
+KEY_VERSION = 1
+"""
+The version of the build key derivation. Changing it invalidates every cached build.
+"""
+
+CHUNK_SIZE = 1024 * 1024
+"""
+The number of bytes read at a time when hashing an input file.
+"""
+
+# The logger of the build engine.
+_log = csl.get_logger(__name__)
+
+
+class BuildSpec(object):
+    """
+    Represents the build file of a module.
+    """
+
+    command: object
+    """
+    The command run to build the module. A string is run by the shell and a list is run directly.
+    """
+
+    outputs: list[str]
+    """
+    The paths of the artifacts the command produces relative to the module directory.
+    """
+
+    inputs: list[str]
+    """
+    The glob patterns of the files the command reads relative to the module directory.
+    """
+
+
+    def __init__(self, command: object, outputs: list[str], inputs: list[str]=None) -> None:
+        """
+        Creates a build specification.
+        """
+
+        self.command = command
+        self.outputs = outputs
+        self.inputs = inputs if inputs is not None else ['**/*']
+
+
+    def to_dict(self) -> dict:
+        """
+        Returns a dictionary representing the specification in the build file JSON schema.
+        """
+
+        return {'command': self.command, 'outputs': self.outputs, 'inputs': self.inputs}
+
+
+def read_build_spec(module_dir: Path) -> BuildSpec:
+    """
+    Reads the build file of the module in the given directory. Returns None if the module has no
+    build file.
+    """
+
+    source = module_dir / BUILD_FILE_NAME
+
+    # Read the build file if it exists.
+    try:
+        with open(source, 'r') as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return None
+    except ValueError as exc:
+        raise MalformedDataException(f'Malformed build file "{source}": {exc}.')
+
+    def strings(value: object) -> bool:
+        """
+        Determines whether a value is a non-empty list of strings.
+        """
+
+        return isinstance(value, list) and value and all(isinstance(item, str) for item in value)
+
+    # Check each property.
+    if not isinstance(data, dict):
+        raise MalformedDataException(f'Malformed build file "{source}": expected an object.')
+    if not (isinstance(data.get('command'), str) and data['command']) \
+            and not strings(data.get('command')):
+        raise MalformedDataException(f'Malformed build file "{source}" at "command": expected a ' \
+                                     + 'string or a list of strings.')
+    if not strings(data.get('outputs')):
+        raise MalformedDataException(f'Malformed build file "{source}" at "outputs": expected a ' \
+                                     + 'list of paths.')
+    if 'inputs' in data and not strings(data['inputs']):
+        raise MalformedDataException(f'Malformed build file "{source}" at "inputs": expected a ' \
+                                     + 'list of glob patterns.')
+
+    # Ensure no output escapes the module directory.
+    for output in data['outputs']:
+        check_output_path(output)
+
+    return BuildSpec(data['command'], data['outputs'], data.get('inputs'))
+
+
+class BuildOutcome(object):
+    """
+    Describes how a module was brought up to date.
+    """
+
+    status: str
+    """
+    "built" if the command ran, "cached" if the artifacts were restored, or "none" if the module
+    has no build file.
+    """
+
+    key: str
+    """
+    The build key of the module.
+    """
+
+    method: str
+    """
+    How cached artifacts were restored or None if they were not.
+    """
+
+
+    def __init__(self, status: str, key: str, method: str=None) -> None:
+        """
+        Creates a build outcome.
+        """
+
+        self.status = status
+        self.key = key
+        self.method = method
+
+
+class Builder(object):
+    """
+    Builds the modules of a project over a pool of threads in dependency waves, using an artifact
+    cache to skip unchanged modules.
+    """
+
+    project: Project
+    """
+    The project whose modules are built.
+    """
+
+    cache: ArtifactCache
+    """
+    The cache of build artifacts.
+    """
+
+    use_cache: bool
+    """
+    Whether cached artifacts are restored. Built artifacts are always stored.
+    """
+
+    max_size: int
+    """
+    The size in bytes the cache is pruned to after the build.
+    """
+
+    __modules: dict[str, ModuleRecord]
+    """
+    The record of each module keyed by module name.
+    """
+
+    __keys: dict[str, str]
+    """
+    The memoized build key of each module.
+    """
+
+    __digests: dict[str, list]
+    """
+    The remembered size, modification time, and digest of each input file keyed by path.
+    """
+
+    __lock: threading.Lock
+    """
+    Serializes output and updates of the memoized keys.
+    """
+
+
+    def __init__(self,
+                 project: Project,
+                 use_cache: bool=True,
+                 max_size: int=DEFAULT_MAX_SIZE) -> None:
+        """
+        Creates a builder for the given project.
+        """
+
+        self.project = project
+        self.cache = ArtifactCache(project.meta_dir)
+        self.use_cache = use_cache
+        self.max_size = max_size
+        self.__modules = {module.name: module for module in project.modules()}
+        self.__keys = {}
+        self.__lock = threading.Lock()
+
+        # Load the remembered input digests.
+        try:
+            with open(self.cache.root / DIGESTS_FILE_NAME, 'r') as file:
+                self.__digests = json.load(file)
+        except (FileNotFoundError, ValueError):
+            self.__digests = {}
+
+
+    def __module_dir(self, name: str) -> Path:
+        """
+        Returns the directory of the module with the given name.
+        """
+
+        return self.project.root / MODULES_DIR_NAME / name
+
+
+    def __digest(self, path: Path) -> str:
+        """
+        Returns the SHA-256 digest of a file. Files whose size and modification time are unchanged
+        since they were last hashed are not read again.
+        """
+
+        stat = path.stat()
+        remembered = self.__digests.get(str(path))
+        if remembered and remembered[0] == stat.st_size and remembered[1] == stat.st_mtime_ns:
+            return remembered[2]
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            while chunk := file.read(CHUNK_SIZE):
+                digest.update(chunk)
+
+        self.__digests[str(path)] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        return digest.hexdigest()
+
+
+    def __inputs(self, module_dir: Path, spec: BuildSpec) -> list[list[str]]:
+        """
+        Returns the relative path and digest of every input file of a module in path order. Files
+        within the outputs are never inputs.
+        """
+
+        outputs = [module_dir / output for output in spec.outputs]
+        paths = set()
+
+        for pattern in spec.inputs:
+            for path in module_dir.glob(pattern):
+                if path.is_file() and not any(path == output or output in path.parents
+                                              for output in outputs):
+                    paths.add(path)
+
+        return [[path.relative_to(module_dir).as_posix(), self.__digest(path)]
+                for path in sorted(paths)]
+
+
+    def key(self, name: str) -> str:
+        """
+        Returns the build key of a module. The key covers the module's configuration entry, its
+        build file, the digests of its input files, and the keys of the modules it depends on, so
+        a change to any module changes the keys of every module downstream of it.
+        """
+
+        with self.__lock:
+            if name in self.__keys:
+                return self.__keys[name]
+
+        module = self.__modules[name]
+        module_dir = self.__module_dir(name)
+        spec = read_build_spec(module_dir) if module_dir.is_dir() else None
+
+        material = [
+            KEY_VERSION,
+            module.to_dict(),
+            spec.to_dict() if spec else None,
+            self.__inputs(module_dir, spec) if spec else None,
+            [self.key(dependency) for dependency in module.depends_on]
+        ]
+        key = hashlib.sha256(json.dumps(material, sort_keys=True).encode()).hexdigest()
+
+        with self.__lock:
+            self.__keys[name] = key
+
+        _log.debug('Computed the build key of module "%s".', name, key=key)
+        return key
+
+
+    def __build_module(self, name: str) -> BuildOutcome:
+        """
+        Brings a module up to date by restoring its cached artifacts or running its build command
+        and caching the artifacts it produces.
+        """
+
+        module_dir = self.__module_dir(name)
+        spec = read_build_spec(module_dir) if module_dir.is_dir() else None
+        key = self.key(name)
+
+        # Modules without a build file have nothing to build.
+        if not spec:
+            return BuildOutcome('none', key)
+
+        # Restore the artifacts of an identical earlier build.
+        if self.use_cache:
+            method = self.cache.restore(key, module_dir)
+            if method:
+                _log.debug('Restored module "%s" from the cache.', name, method=method)
+                return BuildOutcome('cached', key, method)
+
+        # Remove the previous outputs then run the build command with its output captured and display
+        # the output as one block.
+        remove_outputs(module_dir, spec.outputs)
+        _log.debug('Running the build command of module "%s".', name, command=spec.command)
+        result = subprocess.run(spec.command, shell=isinstance(spec.command, str), cwd=module_dir,
+                                stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True, errors='replace')
+        with csl.TaskOutput(f'{name} | ', 'grouped') as output:
+            output.write(result.stdout)
+
+        if result.returncode != 0:
+            raise RuntimeError(f'The build command of module "{name}" exited with code ' \
+                               + f'{result.returncode}.')
+
+        # Store the new artifacts.
+        self.cache.store(key, module_dir, spec.outputs)
+        return BuildOutcome('built', key)
+
+
+    def build(self,
+              names: Iterable[str]=None,
+              jobs: int=None,
+              fail_fast: bool=False) -> WaveResult:
+        """
+        Builds the given modules (every module by default) in dependency waves. Afterwards the
+        input digests are saved, the hit and miss counts are recorded, and the cache is pruned to
+        its maximum size.
+        """
+
+        graph = ModuleGraph.from_modules(self.__modules.values())
+        result = run_waves(graph, self.__build_module, names, jobs, False, fail_fast)
+
+        # Remember the input digests for the next build.
+        self.cache.root.mkdir(511, True, True)
+        with fs.atomic_open(self.cache.root / DIGESTS_FILE_NAME) as file:
+            json.dump(self.__digests, file)
+
+        # Record the cache activity and bound the cache size.
+        outcomes = list(result.results.values())
+        self.cache.record(sum(outcome.status == 'cached' for outcome in outcomes),
+                          sum(outcome.status == 'built' for outcome in outcomes))
+        evicted, freed = self.cache.prune(self.max_size)
+        _log.debug('Pruned the artifact cache.', evicted=evicted, freed=freed)
+
+        return result
@@ -0,0 +1,388 @@
+"""
+cache.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Provides a content-addressed cache of module build artifacts stored in the project metadata
+directory. Entries are keyed by a hash of everything a build depends on, restored by cloning their
+files with copy-on-write where the filesystem supports it, and evicted least recently used first
+once the cache grows beyond a size bound.
+"""
+
+from pathlib import Path, PurePosixPath
+from typing import Iterable
+import os
+import re
+import json
+import stat
+import shutil as shu
+import tempfile
+import pywbu.filesystem as fs
+
+
+CACHE_DIR_NAME = 'cache'
+"""
+The name of the cache directory within the project metadata directory.
+"""
+
+OBJECTS_DIR_NAME = 'objects'
+"""
+The name of the directory within the cache directory holding one directory per entry.
+"""
+
+ENTRY_MANIFEST_NAME = 'manifest.json'
+"""
+The name of the file in each entry directory listing its artifacts. An entry without a manifest is
+incomplete and is ignored.
+"""
+
+ARTIFACTS_DIR_NAME = 'artifacts'
+"""
+The name of the directory in each entry directory holding the artifacts.
+"""
+
+STATS_FILE_NAME = 'stats.json'
+"""
+The name of the file in the cache directory that counts cache hits and misses.
+"""
+
+DEFAULT_FILE_MODE = 0o644
+"""
+The mode given to restored files whose mode was not recorded when their entry was stored.
+"""
+
+DEFAULT_MAX_SIZE = 1024 ** 3
+"""
+The default maximum total size of the cache in bytes (1 GiB).
+"""
+
+# The multiplier of each size suffix accepted by parse_size.
+_SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+# Matches a size such as "512", "200M", or "1.5G".
+_SIZE_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?', re.IGNORECASE)
+
+
+def parse_size(text: str) -> int:
+    """
+    Parses a size in bytes with an optional K, M, G, or T (binary) suffix.
+    """
+
+    match = _SIZE_PATTERN.fullmatch(text.strip())
+
+    if not match:
+        raise ValueError(f'Invalid size "{text}". Expected a number of bytes with an optional ' \
+                         + 'K, M, G, or T suffix.')
+
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+
+
+def format_size(size: int) -> str:
+    """
+    Formats a size in bytes with the largest binary suffix that keeps the number at least one.
+    """
+
+    for unit in ('T', 'G', 'M', 'K'):
+        if size >= _SIZE_UNITS[unit]:
+            return f'{size / _SIZE_UNITS[unit]:.1f}{unit}'
+
+    return f'{size}B'
+
+
+def check_output_path(output: str) -> PurePosixPath:
+    """
+    Ensures an artifact path is relative and stays within the module directory, returning it as a
+    path.
+    """
+
+    path = PurePosixPath(output)
+
+    if path.is_absolute() or not path.parts or '..' in path.parts:
+        raise ValueError(f'Invalid output path "{output}". Outputs must be relative paths within ' \
+                         + 'the module directory.')
+
+    return path
+
+
+def remove_outputs(target_dir: Path, outputs: Iterable[str]) -> None:
+    """
+    Removes the given outputs of a directory if they exist. Outputs are removed before a build or a
+    restore so no stale files are left among them.
+    """
+
+    for output in outputs:
+        path = target_dir / check_output_path(output)
+        if path.is_dir() and not path.is_symlink():
+            shu.rmtree(path)
+        else:
+            path.unlink(True)
+
+
+class CacheEntry(object):
+    """
+    Describes a complete entry in the cache.
+    """
+
+    key: str
+    """
+    The key of the entry.
+    """
+
+    size: int
+    """
+    The total size of the entry's artifacts in bytes.
+    """
+
+    last_used: int
+    """
+    The time in nanoseconds the entry was last stored or restored.
+    """
+
+
+    def __init__(self, key: str, size: int, last_used: int) -> None:
+        """
+        Creates an entry description.
+        """
+
+        self.key = key
+        self.size = size
+        self.last_used = last_used
+
+
+class ArtifactCache(object):
+    """
+    Stores the build artifacts of modules under content-addressed keys. Stored artifact files are
+    made read-only and their original modes are recorded so restored files get their modes back.
+    Restored files never share an inode with the cache, so editing them in place cannot change the
+    cached copy.
+    """
+
+    root: Path
+    """
+    The canonical path to the cache directory.
+    """
+
+
+    def __init__(self, meta_dir: Path) -> None:
+        """
+        Creates a cache within the given project metadata directory. No files are created until
+        something is stored.
+        """
+
+        self.root = meta_dir / CACHE_DIR_NAME
+
+
+    def __entry_dir(self, key: str) -> Path:
+        """
+        Returns the directory of the entry with the given key. Entries are spread over
+        subdirectories named by the first two characters of their keys.
+        """
+
+        return self.root / OBJECTS_DIR_NAME / key[:2] / key
+
+
+    def __manifest(self, key: str) -> dict:
+        """
+        Reads the manifest of the entry with the given key or returns None if there is no complete
+        entry.
+        """
+
+        try:
+            with open(self.__entry_dir(key) / ENTRY_MANIFEST_NAME, 'r') as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return None
+
+
+    def contains(self, key: str) -> bool:
+        """
+        Determines whether a complete entry with the given key exists.
+        """
+
+        return (self.__entry_dir(key) / ENTRY_MANIFEST_NAME).is_file()
+
+
+    def restore(self, key: str, target_dir: Path) -> str:
+        """
+        Restores the artifacts of the entry with the given key into the target directory, replacing
+        any existing outputs. Files are cloned with copy-on-write where the filesystem supports it
+        and copied otherwise, never hard linked, and then given their recorded modes. Returns the
+        method used for the most files (one of the methods of clone_file or "empty" if the entry has
+        no files) or None if there is no such entry.
+        """
+
+        manifest = self.__manifest(key)
+        if manifest is None:
+            return None
+
+        artifacts = self.__entry_dir(key) / ARTIFACTS_DIR_NAME
+        modes = manifest.get('modes', {})
+        methods = {}
+
+        # Replace each output and recreate its directories then its files.
+        remove_outputs(target_dir, manifest['outputs'])
+        for directory in manifest['dirs']:
+            (target_dir / directory).mkdir(511, True, True)
+        for file in manifest['files']:
+            (target_dir / file).parent.mkdir(511, True, True)
+            method = fs.clone_file(artifacts / file, target_dir / file, False)
+            os.chmod(target_dir / file, modes.get(file, DEFAULT_FILE_MODE))
+            methods[method] = methods.get(method, 0) + 1
+
+        # Mark the entry as recently used for eviction.
+        os.utime(self.__entry_dir(key))
+
+        return max(methods, key=methods.get) if methods else 'empty'
+
+
+    def store(self, key: str, source_dir: Path, outputs: Iterable[str]) -> int:
+        """
+        Stores the given outputs of the source directory under the given key. The entry is
+        assembled in a temporary directory and renamed into place so it appears complete or not at
+        all. Returns the total size of the stored artifacts in bytes.
+        """
+
+        outputs = [str(check_output_path(output)) for output in outputs]
+        objects_dir = self.root / OBJECTS_DIR_NAME
+        objects_dir.mkdir(511, True, True)
+
+        temp_dir = Path(tempfile.mkdtemp(prefix=f'.{key}.', dir=objects_dir))
+        try:
+            artifacts = temp_dir / ARTIFACTS_DIR_NAME
+            files, dirs, modes, size = [], [], {}, 0
+
+            # Copy every output file, cloning where possible, and record its mode. Hard links are
+            # not used because the module's files would be made read-only along with the cached
+            # copies.
+            for output in outputs:
+                source = source_dir / output
+                if not source.exists():
+                    raise FileNotFoundError(f'The build output "{source}" does not exist.')
+
+                items = [source] if source.is_file() else [source] + sorted(source.rglob('*'))
+                for item in items:
+                    relative = item.relative_to(source_dir).as_posix()
+                    if item.is_dir():
+                        dirs.append(relative)
+                        (artifacts / relative).mkdir(511, True, True)
+                    elif item.is_file():
+                        (artifacts / relative).parent.mkdir(511, True, True)
+                        fs.clone_file(item, artifacts / relative, False)
+                        modes[relative] = stat.S_IMODE(item.stat().st_mode)
+                        os.chmod(artifacts / relative, 0o444)
+                        files.append(relative)
+                        size += item.stat().st_size
+
+            # Write the manifest last then move the entry into place. An entry stored concurrently
+            # under the same key holds the same artifacts, so the first one to arrive is kept.
+            with open(temp_dir / ENTRY_MANIFEST_NAME, 'w') as file:
+                json.dump({'outputs': outputs, 'dirs': dirs, 'files': files, 'modes': modes,
+                           'size': size}, file)
+
+            entry_dir = self.__entry_dir(key)
+            entry_dir.parent.mkdir(511, False, True)
+            try:
+                os.rename(temp_dir, entry_dir)
+            except OSError:
+                if not self.contains(key):
+                    raise
+
+        finally:
+            if temp_dir.exists():
+                shu.rmtree(temp_dir)
+
+        return size
+
+
+    def entries(self) -> list[CacheEntry]:
+        """
+        Returns a description of every complete entry from least to most recently used.
+        """
+
+        entries = []
+        objects_dir = self.root / OBJECTS_DIR_NAME
+
+        if not objects_dir.is_dir():
+            return entries
+
+        # Read the manifest of every entry. Temporary and incomplete entries are skipped.
+        for shard in objects_dir.iterdir():
+            if not shard.is_dir() or shard.name.startswith('.'):
+                continue
+            for entry_dir in shard.iterdir():
+                manifest = self.__manifest(entry_dir.name)
+                if manifest is not None:
+                    entries.append(CacheEntry(entry_dir.name, manifest['size'],
+                                              entry_dir.stat().st_mtime_ns))
+
+        return sorted(entries, key=lambda entry: entry.last_used)
+
+
+    def prune(self, max_size: int=DEFAULT_MAX_SIZE) -> tuple[int, int]:
+        """
+        Evicts the least recently used entries until the total size of the cache is at most the
+        given size. Returns the number of entries evicted and the number of bytes freed.
+        """
+
+        entries = self.entries()
+        total = sum(entry.size for entry in entries)
+        evicted, freed = 0, 0
+
+        for entry in entries:
+            if total <= max_size:
+                break
+
+            # Remove the manifest first so the entry is never seen half removed.
+            entry_dir = self.__entry_dir(entry.key)
+            (entry_dir / ENTRY_MANIFEST_NAME).unlink(True)
+            shu.rmtree(entry_dir, True)
+
+            total -= entry.size
+            evicted += 1
+            freed += entry.size
+
+        return evicted, freed
+
+
+    def __counts(self) -> dict:
+        """
+        Reads the recorded hit and miss counts.
+        """
+
+        try:
+            with open(self.root / STATS_FILE_NAME, 'r') as file:
+                counts = json.load(file)
+        except (FileNotFoundError, ValueError):
+            counts = {}
+
+        return {'hits': counts.get('hits', 0), 'misses': counts.get('misses', 0)}
+
+
+    def stats(self) -> dict:
+        """
+        Returns the number of entries, their total size, and the recorded hit and miss counts.
+        """
+
+        entries = self.entries()
+
+        return {
+            'entries': len(entries),
+            'size': sum(entry.size for entry in entries),
+            **self.__counts()
+        }
+
+
+    def record(self, hits: int, misses: int) -> None:
+        """
+        Adds to the recorded hit and miss counts. The counts are informational so concurrent
+        updates may occasionally be lost.
+        """
+
+        counts = self.__counts()
+        self.root.mkdir(511, True, True)
+
+        with fs.atomic_open(self.root / STATS_FILE_NAME) as file:
+            json.dump({'hits': counts['hits'] + hits, 'misses': counts['misses'] + misses}, file)
@@ -0,0 +1,146 @@
+"""
+buildop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line module build operation.
+"""
+
+from pathlib import Path
+from argparse import ArgumentParser, Namespace
+from time import perf_counter
+from pywbu.runtime import EXIT_SUCCESS, EXIT_FAILURE
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+from pywbu.cli.complete import set_completer
+import stax
+from stax.project import *
+from stax.graph import ModuleGraph
+from stax.cache import DEFAULT_MAX_SIZE, parse_size, format_size
+from stax.orchestrate import DEFAULT_JOBS
+from stax.build import BUILD_FILE_NAME, Builder
+
+
+class BuildOperation(Operation):
+    """
+    Represents the command-line module build operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new module build operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='build',
+            help='build the modules of the project',
+            desc=f'Builds each module with a {BUILD_FILE_NAME} file in dependency order, ' \
+                + 'running the modules of each wave concurrently. Modules whose configuration, ' \
+                + 'build file, inputs, and dependencies are unchanged since an earlier build ' \
+                + 'have their outputs restored from the artifact cache by linking instead of ' \
+                + 'being built again.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add an argument to select modules. Every module is selected by default.
+        set_completer(subparser.add_argument(
+            '-m', '--module',
+            action='append',
+            dest='modules',
+            help='a module to build along with the modules it depends on (may be repeated, ' \
+                + 'default all modules)'), 'modules')
+
+        # Add an argument for the number of concurrent builds.
+        subparser.add_argument(
+            '-j', '--jobs',
+            type=int,
+            default=DEFAULT_JOBS,
+            help=f'the maximum number of modules built at once (default {DEFAULT_JOBS})')
+
+        # Add a flag to continue with independent modules after a failure.
+        subparser.add_argument(
+            '-k', '--keep-going',
+            action='store_true',
+            help='keep building the modules that do not depend on a failed module instead of ' \
+                + 'stopping after the first failed wave')
+
+        # Add a flag to ignore cached artifacts.
+        subparser.add_argument(
+            '-f', '--force',
+            action='store_true',
+            help='build every selected module even if its artifacts are cached')
+
+        # Add an argument for the cache size bound.
+        subparser.add_argument(
+            '--max-size',
+            type=parse_size,
+            default=DEFAULT_MAX_SIZE,
+            help='the size the artifact cache is pruned to after building, such as 500M (default ' \
+                + f'{format_size(DEFAULT_MAX_SIZE)})')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing project.
+        proj = enclosing_project(Path(args.path))
+
+        # If the project could not be found display a warning and exit.
+        if not proj:
+            csl.warn(f'No stax project found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        # Try to build the selected modules and the modules they depend on.
+        try:
+            if args.jobs < 1:
+                raise ValueError(f'The number of jobs must be at least 1 but {args.jobs} was ' \
+                                 + 'given.')
+
+            builder = Builder(proj, not args.force, args.max_size)
+            names = None
+            if args.modules:
+                names = ModuleGraph.from_modules(proj.modules()).upstream(args.modules)
+
+            start = perf_counter()
+            result = builder.build(names, args.jobs, not args.keep_going)
+            elapsed = perf_counter() - start
+
+        # If an exception is raised just display a warning message.
+        except Exception as exc:
+            csl.warn_exc(exc)
+            return
+
+        # Display the outcome of each module that has a build.
+        for name, outcome in result.results.items():
+            if outcome.status == 'cached':
+                csl.log(f'{name}: restored from cache ({outcome.method})')
+            elif outcome.status == 'built':
+                csl.log(f'{name}: built in {result.durations[name]:.2f}s')
+        for name, exc in result.errors.items():
+            csl.log(f'{name}: failed: {exc}')
+        for name in result.skipped:
+            csl.log(f'{name}: skipped')
+
+        # Summarize the build and fail if any module did not build.
+        outcomes = list(result.results.values())
+        built = sum(outcome.status == 'built' for outcome in outcomes)
+        cached = sum(outcome.status == 'cached' for outcome in outcomes)
+        csl.log(f'{built} built, {cached} cached, {len(result.errors)} failed, ' \
+                + f'{len(result.skipped)} skipped in {elapsed:.2f}s.')
+
+        if result.errors or result.skipped:
+            csl.warn('Not every module was built.', EXIT_FAILURE)
@@ -0,0 +1,70 @@
+"""
+cacheop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line artifact cache management operation. The operation
+holds its own set of nested operations (e.g. "stax cache stats").
+"""
+
+from argparse import ArgumentParser, Namespace
+from pywbu.annotations import override
+from pywbu.cli.op import Operation
+from pywbu.cli.opset import OperationSet
+import stax
+from stax.cli.cachestatsop import CacheStatsOperation
+from stax.cli.cachepruneop import CachePruneOperation
+
+
+class CacheOperation(Operation):
+    """
+    Represents the command-line artifact cache management operation.
+    """
+
+    __opset: OperationSet
+    """
+    The set of nested cache operations.
+    """
+
+
+    def __init__(self) -> None:
+        """
+        Creates a new artifact cache management operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='cache',
+            help='manage the build artifact cache',
+            desc='Manages the build artifact cache of the project enclosing the current working ' \
+                + 'directory (or a specified directory).',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+        # Create an operation set for the nested cache operation positional argument. Add all the
+        # relevant operation objects to the set.
+        self.__opset = OperationSet('cache_operation')
+        self.__opset.add_operations(CacheStatsOperation(), CachePruneOperation())
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Configure the subparser to use the nested operations in the operation set.
+        self.__opset.configure_parser(subparser, True)
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Allow the nested operation set to perform the proper nested operation.
+        self.__opset.process_args(args)
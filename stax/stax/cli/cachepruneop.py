@@ -0,0 +1,79 @@
+"""
+cachepruneop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line artifact cache pruning operation.
+"""
+
+from pathlib import Path
+from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+import stax
+from stax.project import *
+from stax.cache import DEFAULT_MAX_SIZE, ArtifactCache, parse_size, format_size
+
+
+class CachePruneOperation(Operation):
+    """
+    Represents the command-line artifact cache pruning operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new artifact cache pruning operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='prune',
+            help='evict old entries from the artifact cache',
+            desc='Evicts the least recently used entries from the build artifact cache until its ' \
+                + 'total size is within a bound. A bound of 0 empties the cache.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add an argument for the cache size bound.
+        subparser.add_argument(
+            '-s', '--max-size',
+            type=parse_size,
+            default=DEFAULT_MAX_SIZE,
+            help='the size to prune the cache to, such as 500M (default ' \
+                + f'{format_size(DEFAULT_MAX_SIZE)})')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing project.
+        proj = enclosing_project(Path(args.path))
+
+        # If the project could not be found display a warning and exit.
+        if not proj:
+            csl.warn(f'No stax project found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        # Try to prune the cache.
+        try:
+            evicted, freed = ArtifactCache(proj.meta_dir).prune(args.max_size)
+
+        # If an exception is raised just display a warning message and exit.
+        except Exception as exc:
+            csl.warn_exc(exc, exit_code=EXIT_SUCCESS)
+
+        csl.log(f'Evicted {evicted} entries freeing {format_size(freed)}.')
@@ -0,0 +1,92 @@
+"""
+cachestatsop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line artifact cache statistics operation.
+"""
+
+from pathlib import Path
+import json
+from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+import stax
+from stax.project import *
+from stax.cache import ArtifactCache, format_size
+
+
+JSON_INDENT = 2
+"""
+The level of indent to use for formatting JSON. A value of None will not format the JSON at all. A
+value of 0 will insert newlines but no indentation.
+"""
+
+
+class CacheStatsOperation(Operation):
+    """
+    Represents the command-line artifact cache statistics operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new artifact cache statistics operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='stats',
+            help='display artifact cache statistics',
+            desc='Displays the number of entries in the build artifact cache, their total size, ' \
+                + 'and how many module builds were restored from the cache (hits) or built ' \
+                + '(misses).',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add a flag to output JSON.
+        subparser.add_argument(
+            '-j', '--json',
+            action='store_true',
+            help='display the statistics as JSON')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing project.
+        proj = enclosing_project(Path(args.path))
+
+        # If the project could not be found display a warning and exit.
+        if not proj:
+            csl.warn(f'No stax project found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        stats = ArtifactCache(proj.meta_dir).stats()
+
+        # If the JSON argument is specified, output the statistics as JSON.
+        if args.json:
+            csl.output(json.dumps(stats, indent=JSON_INDENT))
+            return
+
+        # Output each statistic along with the hit rate.
+        lookups = stats['hits'] + stats['misses']
+        rate = f'{stats["hits"] / lookups:.1%}' if lookups else '-'
+        csl.key_values((('Entries', stats['entries']),
+                        ('Size', format_size(stats['size'])),
+                        ('Hits', stats['hits']),
+                        ('Misses', stats['misses']),
+                        ('Hit rate', rate)))
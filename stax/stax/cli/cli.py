@@ -4,7 +4,7 @@ cli.py
 Type:       Python Script
 Author:     Will Brandon
 Created:    June 28, 2023
-Revised:    July 14, 2023
+Revised:    October 19, 2026
 
 The command-line entrypoint for the stax package.
 """
@@ -13,12 +13,9 @@ import os
 from argparse import ArgumentParser, Namespace
 from pywbu.runtime import main, EXIT_SUCCESS
 import pywbu.console as csl
+import pywbu.cli.complete as comp
 from pywbu.cli.opset import OperationSet
 import stax
-from stax.cli.initop import InitOperation
-from stax.cli.dismantleop import DismantleOperation
-from stax.cli.rootop import RootOperation
-from stax.cli.infoop import InfoOperation
 
 
 def configure_top_level_args(parser: ArgumentParser) -> None:
@@ -51,6 +48,26 @@ def configure_top_level_args(parser: ArgumentParser) -> None:
         action='store_true',
         help='disable console output ANSI formatting')
     
+    # Add arguments to set the log levels and to write log records as JSON lines.
+    parser.add_argument(
+        '-L', '--log-level',
+        metavar='LEVELS',
+        help='set log levels as comma-separated level names and name=level pairs, such as ' \
+            + '"debug" or "warning,stax.build=debug"')
+    parser.add_argument(
+        '--log-json',
+        action='store_true',
+        help='write log records as JSON lines for machine ingestion')
+
+    # Add an argument to display the shell command that enables tab completion.
+    parser.add_argument(
+        '--completion-script',
+        action='version',
+        help='display the command that enables tab completion in bash (or zsh with ' \
+            + 'bashcompinit) and exit, such as in a shell profile: eval "$(stax ' \
+            + '--completion-script)"',
+        version=comp.bash_script(stax.PACK_NAME))
+
     # Add an argument to specify a path to execute the command other than the current working
     # directory. By default this is the current working directory.
     parser.add_argument(
@@ -76,12 +93,41 @@ def process_top_level_args(args: Namespace) -> None:
     if args.unformatted:
         csl.formatted_output = False
 
+    # If log levels are specified apply them, displaying a warning and exiting if they are invalid.
+    if args.log_level:
+        try:
+            csl.configure_levels(args.log_level)
+        except ValueError as exc:
+            csl.warn_exc(exc, exit_code=EXIT_SUCCESS)
 
-def parse_args(argv: list[str]) -> None:
+    # If the JSON log flag is specified write log records as JSON lines.
+    if args.log_json:
+        csl.json_logs = True
+
+
+def build_parser() -> tuple[ArgumentParser, OperationSet]:
     """
-    Parses the given list of command-line arguments and performs the appropriate actions.
+    Builds the main argument parser along with the operation set for its operation positional
+    argument. The operation modules are only imported here so that completion requests answered
+    from the cached completion spec never import them.
     """
 
+    from stax.cli.initop import InitOperation
+    from stax.cli.dismantleop import DismantleOperation
+    from stax.cli.rootop import RootOperation
+    from stax.cli.infoop import InfoOperation
+    from stax.cli.statsop import StatsOperation
+    from stax.cli.modulesop import ModulesOperation
+    from stax.cli.storageop import StorageOperation
+    from stax.cli.composeop import ComposeOperation
+    from stax.cli.upop import UpOperation
+    from stax.cli.downop import DownOperation
+    from stax.cli.execop import ExecOperation
+    from stax.cli.buildop import BuildOperation
+    from stax.cli.cacheop import CacheOperation
+    from stax.cli.wsop import WorkspaceOperation
+    from stax.cli.shellop import ShellOperation
+
     # Create the main argument parser.
     parser = ArgumentParser(
         prog=stax.PACK_NAME,
@@ -94,11 +140,37 @@ def parse_args(argv: list[str]) -> None:
     # Create an operation set for the operation positional argument. Add all the relevant operation
     # objects to the set.
     opset = OperationSet('operation')
-    opset.add_operations(InitOperation(), DismantleOperation(), RootOperation(), InfoOperation())
+    opset.add_operations(
+        InitOperation(),
+        DismantleOperation(),
+        RootOperation(),
+        InfoOperation(),
+        StatsOperation(),
+        ModulesOperation(),
+        StorageOperation(),
+        ComposeOperation(),
+        UpOperation(),
+        DownOperation(),
+        ExecOperation(),
+        BuildOperation(),
+        CacheOperation(),
+        WorkspaceOperation(),
+        ShellOperation())
 
     # Configure the parser to use the operations in the operation set.
     opset.configure_parser(parser, True)
 
+    return parser, opset
+
+
+def parse_args(argv: list[str]) -> None:
+    """
+    Parses the given list of command-line arguments and performs the appropriate actions.
+    """
+
+    # Build the argument parser and its operation set.
+    parser, opset = build_parser()
+
     # Parse the arguments into a namespace.
     args = parser.parse_args(argv[1:])
 
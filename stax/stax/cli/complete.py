@@ -0,0 +1,112 @@
+"""
+complete.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+The console script entrypoint for the stax package. Shell completion requests are answered here
+from cached data before the command-line interface is imported. Every other invocation is passed to
+the command-line entrypoint.
+"""
+
+import os
+import stax
+import pywbu.cli.complete as comp
+
+
+COMPLETION_CACHE_FILE_NAME = 'completion.cache'
+"""
+The name of the file caching the completion spec of the command line in the user's cache directory.
+The same name is used for the file caching the module names of a project in its metadata directory.
+"""
+
+# The name of the project metadata directory and the paths within it of the files whose changes may
+# change the module names. These are the files stamped by each storage backend: the JSON file, the
+# database and the write-ahead log that holds writes until they are checkpointed, and the shard
+# manifest and shards directory. They must match the names used by the project, configuration, and
+# module storage modules, which are too slow to import for a completion request.
+_META_DIR_NAME = '.stax'
+_MODULE_SOURCE_PATHS = ('config.json', 'config.db', 'config.db-wal', 'manifest.json', 'shards')
+
+
+def completion_spec() -> dict:
+    """
+    Returns the completion spec of the command line. It is cached in the user's cache directory
+    and rebuilt whenever the package version or any operation module changes.
+    """
+
+    cli_dir = os.path.dirname(__file__)
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    fingerprint = [stax.PACK_VERSION, cli_dir,
+                   max(entry.stat().st_mtime_ns for entry in os.scandir(cli_dir))]
+
+    def build():
+        from stax.cli.cli import build_parser
+        return build_parser()[0]
+
+    return comp.load_spec(os.path.join(cache_dir, stax.PACK_NAME, COMPLETION_CACHE_FILE_NAME),
+                          fingerprint, build)
+
+
+def complete_modules(values: dict[str, str]) -> list[str]:
+    """
+    Returns the module names of the project enclosing the path given by the path option (the
+    current working directory by default). The names are cached in the project metadata directory
+    along with the modification times and sizes of the files they are read from, so the project
+    configuration is only read again once it has changed.
+    """
+
+    # Find the enclosing project.
+    path = os.path.realpath(values.get('--path') or values.get('-p') or os.getcwd())
+    while not os.path.isdir(os.path.join(path, _META_DIR_NAME)):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return []
+        path = parent
+
+    meta_dir = os.path.join(path, _META_DIR_NAME)
+
+    # Stamp the files the module names are read from.
+    stamp = []
+    for source in _MODULE_SOURCE_PATHS:
+        try:
+            stat = os.stat(os.path.join(meta_dir, source))
+            stamp.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            stamp.append(None)
+
+    # Answer from the cache if the files are unchanged.
+    cache_path = os.path.join(meta_dir, COMPLETION_CACHE_FILE_NAME)
+    modules = comp.read_cache(cache_path, stamp)
+
+    # Otherwise read the module names from the project and cache them.
+    if modules is None:
+        from pathlib import Path
+        from stax.project import open_project
+        modules = [module.name for module in open_project(Path(path)).config().iter_modules()]
+        comp.write_cache(cache_path, stamp, modules)
+
+    return modules
+
+
+def main() -> None:
+    """
+    The console script entrypoint for the stax package.
+    """
+
+    # If the shell is requesting completions answer them without importing the command-line
+    # interface.
+    if comp.completion_requested():
+        comp.run_completion(completion_spec, {'modules': complete_modules})
+        return
+
+    # Otherwise run the command line.
+    from stax.cli.cli import main as run
+    run()
+
+
+# Allow the entrypoint to be run as a module during development.
+if __name__ == '__main__':
+    main()
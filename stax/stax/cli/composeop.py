@@ -0,0 +1,117 @@
+"""
+composeop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line Docker Compose generation operation.
+"""
+
+from pathlib import Path
+from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS, EXIT_FAILURE
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+import stax
+from stax.project import *
+from stax.modules import MODULES_DIR_NAME
+from stax.compose import COMPOSE_FILE_NAME, SERVICE_FILE_NAME, DOCKERFILE_NAME, ComposeGenerator
+
+
+class ComposeOperation(Operation):
+    """
+    Represents the command-line Docker Compose generation operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new Docker Compose generation operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='compose',
+            help='generate the Docker Compose file of the project',
+            desc=f'Generates "{COMPOSE_FILE_NAME}" in the project root with one service per ' \
+                + f'module. A module\'s service is built from "{MODULES_DIR_NAME}/<module>" if ' \
+                + f'that directory holds a {DOCKERFILE_NAME}, and any properties in ' \
+                + f'"{MODULES_DIR_NAME}/<module>/{SERVICE_FILE_NAME}" are merged into the ' \
+                + 'service. Each service is cached by a hash of its inputs so only changed ' \
+                + 'modules are rendered again, and files are only rewritten when their content ' \
+                + 'changes.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add an argument for an alternative output path.
+        subparser.add_argument(
+            '-o', '--output',
+            help=f'the path of the generated compose file (default "{COMPOSE_FILE_NAME}" in the ' \
+                + 'project root)')
+
+        # Add a flag to write one compose file per module and include them from the output.
+        subparser.add_argument(
+            '-s', '--split',
+            action='store_true',
+            help='write each service to a compose file in its module directory and include it')
+
+        # Add a flag to only check whether the generated files are up to date.
+        subparser.add_argument(
+            '-c', '--check',
+            action='store_true',
+            help='write nothing and fail if any generated file is out of date')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing project.
+        proj = enclosing_project(Path(args.path))
+
+        # If the project could not be found display a warning and exit.
+        if not proj:
+            csl.warn(f'No stax project found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        # Try to generate the compose files.
+        try:
+            generator = ComposeGenerator(proj, Path(args.output) if args.output else None,
+                                         args.split)
+            result = generator.generate(args.check)
+
+        # If an exception is raised just display a warning message.
+        except Exception as exc:
+            csl.warn_exc(exc)
+            return
+
+        # Explain why each skipped module has no service.
+        for name, reason in result.skipped:
+            csl.warn(f'Skipped module "{name}" because {reason}.')
+
+        # Modules without a directory are expected so they are only counted.
+        if result.undirected:
+            csl.log(f'Skipped {result.undirected} modules without a module directory.')
+
+        # When checking, fail if any file is out of date.
+        if args.check:
+            for path in result.changed:
+                csl.warn(f'Out of date: "{path}".')
+            if result.changed:
+                csl.warn(f'{len(result.changed)} compose files are out of date.', EXIT_FAILURE)
+            csl.log(f'Compose files are up to date with {len(result.services)} services.')
+            return
+
+        csl.log(f'Generated {len(result.services)} services ({result.rendered} rendered, ' \
+                + f'{result.cached} cached) and ' \
+                + f'updated {len(result.changed)} files.')
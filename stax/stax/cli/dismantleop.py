@@ -4,7 +4,7 @@ dismantleop.py
 Type:       Python Script
 Author:     Will Brandon
 Created:    July 2, 2023
-Revised:    July 14, 2023
+Revised:    October 19, 2026
 
 Defines a class that represents the command-line project dismantling operation.
 """
@@ -37,7 +37,8 @@ class DismantleOperation(Operation):
             desc='Removes the stax configuration from a project in the current working directory ' \
                 + '(or at a specified directory) deeming the directory no longer a stax project. ' \
                 + 'All items inside the directory will be left untouched except for the stax ' \
-                + f'metadata subdirectory, "{PROJ_META_DIR_NAME}".',
+                + f'metadata subdirectory, "{PROJ_META_DIR_NAME}". The subdirectory is moved ' \
+                + 'aside at once and deleted in the background.',
             epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
     
 
@@ -53,6 +54,51 @@ class DismantleOperation(Operation):
             action='store_true',
             help='force the dismantling without a confirmation message')
 
+        # Add arguments to dismantle every project beneath the path at once.
+        subparser.add_argument(
+            '-r', '--recursive',
+            action='store_true',
+            help='dismantle every project beneath the path (including nested projects) instead ' \
+                + 'of the enclosing project')
+        subparser.add_argument(
+            '--jobs',
+            type=int,
+            default=DEFAULT_JOBS,
+            help='the maximum number of projects dismantled at once with --recursive (default ' \
+                + f'{DEFAULT_JOBS})')
+
+
+    def __exec_recursive(self, args: Namespace) -> None:
+        """
+        Dismantles every project beneath the path. The projects are confirmed once, their metadata
+        directories are moved aside concurrently, and the moved directories are deleted together
+        in the background.
+        """
+
+        if args.jobs < 1:
+            csl.warn(f'The number of jobs must be at least 1 but {args.jobs} was given.',
+                     EXIT_SUCCESS)
+
+        # Find every project beneath the path.
+        roots = find_projects(Path(args.path))
+        if not roots:
+            csl.warn(f'No stax projects found beneath "{args.path}".', EXIT_SUCCESS)
+
+        # Confirm the whole batch once unless the force flag was specified.
+        if not args.force and not csl.confirm('This will delete project configurations for ' \
+                                              + f'{len(roots)} projects beneath "{args.path}". ' \
+                                              + 'Are you sure?'):
+            return
+
+        # Move the metadata directories aside, then delete them without waiting.
+        trash, errors = dismantle_projects((open_project(root) for root in roots), args.jobs)
+        purge_in_background(trash)
+
+        for root, exc in errors.items():
+            csl.warn(f'Failed to dismantle stax project at "{root}": {exc}')
+
+        csl.log(f'Dismantled {len(trash)} stax projects ({len(errors)} failed).')
+
 
     @override
     def exec(self, args: Namespace) -> None:
@@ -60,6 +106,11 @@ class DismantleOperation(Operation):
         Executes the operation given a namespace of parsed arguments.
         """
 
+        # If every project beneath the path was requested, dismantle them all and return.
+        if args.recursive:
+            self.__exec_recursive(args)
+            return
+
         # Find the enclosing project.
         proj = enclosing_project(Path(args.path))
 
@@ -73,9 +124,10 @@ class DismantleOperation(Operation):
                                               + f'"{proj.root}". Are you sure?'):
             return
 
-        # Try to dismantle the project.
+        # Try to dismantle the project, moving its metadata directory aside and deleting it in the
+        # background.
         try:
-            proj.dismantle()
+            purge_in_background([proj.dismantle(purge=False)])
         
         # If an exception is raised just display a warning message.
         except Exception as exc:
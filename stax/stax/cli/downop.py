@@ -0,0 +1,48 @@
+"""
+downop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line service stopping operation.
+"""
+
+from argparse import Namespace
+from pywbu.annotations import override
+import stax
+from stax.cli.orchestrationop import OrchestrationOperation
+
+
+class DownOperation(OrchestrationOperation):
+    """
+    Represents the command-line service stopping operation.
+    """
+
+    _reverse = True
+
+
+    def __init__(self) -> None:
+        """
+        Creates a new service stopping operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='down',
+            help='stop and remove the module services in parallel',
+            desc='Stops and removes the container of each module service (or of the specified ' \
+                + 'modules). Commands run in parallel and each service is stopped only after the ' \
+                + 'services that depend on it have stopped.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _compose_args(self, args: Namespace, service: str) -> list[str]:
+        """
+        Returns the Docker Compose subcommand and its arguments run for the given service.
+        """
+
+        return ['rm', '--stop', '--force', service]
@@ -0,0 +1,72 @@
+"""
+execop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line service command execution operation.
+"""
+
+import argparse
+from argparse import ArgumentParser, Namespace
+from pywbu.annotations import override
+import stax
+from stax.cli.orchestrationop import OrchestrationOperation
+
+
+class ExecOperation(OrchestrationOperation):
+    """
+    Represents the command-line service command execution operation.
+    """
+
+    _ordered = False
+
+
+    def __init__(self) -> None:
+        """
+        Creates a new service command execution operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='exec',
+            help='run a command in the running module services in parallel',
+            desc='Runs a command inside the running container of each module service (or of the ' \
+                + 'specified modules) at the same time. The output of each service is prefixed ' \
+                + 'with its name.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_command_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments specific to the command of the operation.
+        """
+
+        # Add a positional argument capturing the command and all of its arguments.
+        subparser.add_argument(
+            'service_command',
+            nargs=argparse.REMAINDER,
+            metavar='command',
+            help='the command and arguments to run in each service')
+
+
+    @override
+    def _compose_args(self, args: Namespace, service: str) -> list[str]:
+        """
+        Returns the Docker Compose subcommand and its arguments run for the given service. No
+        terminal is allocated because the output is captured.
+        """
+
+        # Drop the separator that may precede the command.
+        command = args.service_command
+        if command[:1] == ['--']:
+            command = command[1:]
+
+        if not command:
+            raise ValueError('No command was given to run in the services.')
+
+        return ['exec', '-T', service] + command
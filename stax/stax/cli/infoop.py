@@ -4,29 +4,53 @@ infoop.py
 Type:       Python Script
 Author:     Will Brandon
 Created:    July 6, 2023
-Revised:    July 14, 2023
+Revised:    October 19, 2026
 
 Defines a class that represents the command-line project information operation.
 """
 
 from pathlib import Path
+from typing import Iterator
+from contextlib import nullcontext
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from time import perf_counter
 import json
 from argparse import ArgumentParser, Namespace
 from pywbu.runtime import EXIT_SUCCESS
 from pywbu.annotations import override
+from pywbu.exc import MalformedDataException
 import pywbu.console as csl
 from pywbu.cli.op import Operation
 import stax
 from stax.project import *
+from stax.config import Config, JSON_INDENT
+from stax.records import format_date
 
 
-JSON_INDENT = 2
+DEFAULT_JOBS = 8
 """
-The level of indent to use for formatting JSON. A value of None will not format the JSON at all. A
-value of 0 will insert newlines but no indentation.
+The default number of projects read at once when reporting on every project beneath a directory.
 """
 
 
+def summarize_project(root: Path) -> dict:
+    """
+    Reads the project at the given root and returns a summary of it as a dictionary. Defined at the
+    module level so it can be sent to a process pool.
+    """
+
+    record = open_project(root).record()
+
+    return {
+        'location': str(root),
+        'uuid': str(record.uuid),
+        'name': record.name,
+        'author': record.author,
+        'creation_date': format_date(record.creation_date),
+        'modules': len(record.modules)
+    }
+
+
 class InfoOperation(Operation):
     """
     Represents the command-line project information operation.
@@ -58,6 +82,116 @@ class InfoOperation(Operation):
             action='store_true',
             help='display the info model as JSON')
 
+        # Add a flag to report on every project beneath the path instead of the enclosing project.
+        subparser.add_argument(
+            '-a', '--all',
+            action='store_true',
+            help='summarize every project beneath the path (including nested projects) as each ' \
+                + 'is read, followed by totals')
+
+        # Add arguments to control how many projects are read at once and how.
+        subparser.add_argument(
+            '--jobs',
+            type=int,
+            default=DEFAULT_JOBS,
+            help=f'the maximum number of projects read at once with --all (default {DEFAULT_JOBS})')
+        subparser.add_argument(
+            '--processes',
+            action='store_true',
+            help='read projects in a pool of processes instead of threads with --all')
+
+
+    def __output_json(self, config: Config) -> None:
+        """
+        Outputs the configuration model as a formatted JSON string. The configuration file is
+        already stored in this format so once it has been validated its raw bytes are passed
+        straight through to the output stream. The validation is remembered until the file changes.
+        Modules stored by another backend are assembled into the model and serialized instead.
+        """
+
+        # Modules stored by another backend are not in the configuration file so the model must be
+        # assembled and serialized.
+        if config.layout() != 'file':
+            try:
+                csl.output(json.dumps(config.model(), indent=JSON_INDENT))
+            except MalformedDataException as exc:
+                csl.warn_exc(exc, exit_code=EXIT_SUCCESS)
+            return
+
+        # Try to validate the configuration file unless it is unchanged since its last validation.
+        try:
+            if not config.validated():
+                config.validate()
+
+        # If the configuration file is malformed display a warning and exit.
+        except MalformedDataException as exc:
+            csl.warn_exc(exc, exit_code=EXIT_SUCCESS)
+
+        # Pass the file content through to the output stream.
+        csl.output_file(config.path)
+
+
+    def __output_all(self, args: Namespace) -> None:
+        """
+        Summarizes every project beneath the path concurrently. Summaries are displayed in the order
+        their projects are read. JSON lines are displayed at once while table rows are displayed in
+        blocks once the column widths have been sampled. The totals are displayed last.
+        """
+
+        # Find every project beneath the path.
+        roots = find_projects(Path(args.path))
+        if not roots:
+            csl.warn(f'No stax projects found beneath "{args.path}".', EXIT_SUCCESS)
+
+        if args.jobs < 1:
+            csl.warn(f'The number of jobs must be at least 1 but {args.jobs} was given.',
+                     EXIT_SUCCESS)
+
+        start = perf_counter()
+        totals = {'projects': 0, 'modules': 0, 'failed': 0}
+
+        # Report the progress unless JSON lines were requested, so the output stays machine
+        # readable.
+        progress = csl.Progress('Reading projects', len(roots))
+        reporting = nullcontext(progress) if args.json else progress
+
+        # Read the projects over a pool and yield each summary as it finishes.
+        def summaries() -> Iterator[dict]:
+            pool: Executor = ProcessPoolExecutor(args.jobs) if args.processes \
+                else ThreadPoolExecutor(args.jobs)
+            with pool, reporting:
+                futures = {pool.submit(summarize_project, root): root for root in roots}
+                for future in as_completed(futures):
+                    progress.count += 1
+                    try:
+                        summary = future.result()
+                    except Exception as exc:
+                        csl.warn(f'Failed to read project "{futures[future]}": {exc}')
+                        totals['failed'] += 1
+                        continue
+
+                    totals['projects'] += 1
+                    totals['modules'] += summary['modules']
+                    yield summary
+
+        # Display each summary as a JSON line or as a table row.
+        if args.json:
+            for summary in summaries():
+                csl.output(json.dumps(summary))
+        else:
+            csl.table(('LOCATION', 'MODULES', 'CREATED', 'NAME'),
+                      ((summary['location'], summary['modules'], summary['creation_date'],
+                        summary['name']) for summary in summaries()),
+                      '<><<')
+
+        # Display the totals.
+        elapsed = perf_counter() - start
+        if args.json:
+            csl.output(json.dumps({'totals': {**totals, 'seconds': round(elapsed, 3)}}))
+        else:
+            csl.log(f'{totals["projects"]} projects with {totals["modules"]} modules ' \
+                    + f'({totals["failed"]} failed) in {elapsed:.2f}s.')
+
 
     @override
     def exec(self, args: Namespace) -> None:
@@ -65,6 +199,11 @@ class InfoOperation(Operation):
         Executes the operation given a namespace of parsed arguments.
         """
 
+        # If every project beneath the path was requested, summarize them all and return.
+        if args.all:
+            self.__output_all(args)
+            return
+
         # Find the enclosing project.
         proj = enclosing_project(Path(args.path))
 
@@ -72,25 +211,27 @@ class InfoOperation(Operation):
         if not proj:
             csl.warn(f'No stax project found enclosing "{args.path}".', EXIT_SUCCESS)
 
-        # Read the model object from the configuration file.
-        model = proj.config().model()
-
         # If the JSON argument is specified, output the model as a formatted JSON string and return.
         if (args.json):
-            csl.output(json.dumps(model, indent=JSON_INDENT))
+            self.__output_json(proj.config())
             return
+
+        # Try to read the project record from the configuration file.
+        try:
+            record = proj.record()
+
+        # If the configuration file is malformed display a warning and exit.
+        except MalformedDataException as exc:
+            csl.warn_exc(exc, exit_code=EXIT_SUCCESS)
         
-        # Output the json configuration model to the console.
-        csl.output(f'Location: {proj.root}')
-        csl.output(f'UUID:     {model["uuid"]}')
-        csl.output(f'Name:     {model["name"]}')
-        csl.output(f'Modules:  {len(model["modules"])}')
-        csl.output(f'Created:  {model["creation_date"]}')
-        
-        # If an author was specified, display the author.
-        if model['author']:
-            csl.output(f'Author:   {model["author"]}')
+        # Output the project record to the console. The author is omitted if it was not specified.
+        csl.key_values((('Location', proj.root),
+                        ('UUID', record.uuid),
+                        ('Name', record.name),
+                        ('Modules', len(record.modules)),
+                        ('Created', format_date(record.creation_date)),
+                        ('Author', record.author or None)))
         
         # If a description was specified, display the description.
-        if model['desc']:
-            csl.output(f'\n{model["desc"]}')
+        if record.desc:
+            csl.output(f'\n{record.desc}')
@@ -4,13 +4,14 @@ initop.py
 Type:       Python Script
 Author:     Will Brandon
 Created:    July 2, 2023
-Revised:    July 14, 2023
+Revised:    October 19, 2026
 
 Defines a class that represents the command-line project initialization operation.
 """
 
 from pathlib import Path
 from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS
 from pywbu.annotations import override
 import pywbu.console as csl
 from pywbu.cli.op import Operation
@@ -50,6 +51,62 @@ class InitOperation(Operation):
         subparser.add_argument('-a', '--author', default=None, help='the author of the project')
         subparser.add_argument('-d', '--desc', default=None, help='a description of the project')
 
+        # Add arguments to initialize every matching directory beneath the path at once.
+        subparser.add_argument(
+            '-r', '--recursive',
+            action='store_true',
+            help='create a project in every directory beneath the path that matches the pattern ' \
+                + 'and is not already a project, each named after its directory')
+        subparser.add_argument(
+            '-m', '--match',
+            default='*',
+            help='the glob pattern, relative to the path, of the directories to initialize with ' \
+                + '--recursive, such as "services/*" or "**/pkg-*" (default "*")')
+        subparser.add_argument(
+            '-f', '--force',
+            action='store_true',
+            help='initialize the directories without a confirmation message with --recursive')
+        subparser.add_argument(
+            '--jobs',
+            type=int,
+            default=DEFAULT_JOBS,
+            help='the maximum number of projects created at once with --recursive (default ' \
+                + f'{DEFAULT_JOBS})')
+
+
+    def __exec_recursive(self, args: Namespace) -> None:
+        """
+        Creates a project in every directory beneath the path that matches the pattern. Hidden
+        directories and directories that are already projects are skipped. The directories are
+        confirmed once and then initialized concurrently.
+        """
+
+        path = Path(args.path)
+
+        if args.jobs < 1:
+            csl.warn(f'The number of jobs must be at least 1 but {args.jobs} was given.',
+                     EXIT_SUCCESS)
+
+        # Gather the matching directories that are neither hidden nor projects already.
+        roots = sorted(root for root in path.glob(args.match) if root.is_dir()
+                       and not any(part.startswith('.') for part in root.relative_to(path).parts)
+                       and not is_project(root))
+        if not roots:
+            csl.warn(f'No directories to initialize matching "{args.match}" beneath "{path}".',
+                     EXIT_SUCCESS)
+
+        # Confirm the whole batch once unless the force flag was specified.
+        if not args.force and not csl.confirm(f'This will create {len(roots)} stax projects ' \
+                                              + f'beneath "{path}". Are you sure?'):
+            return
+
+        # Create the projects and report any failures.
+        errors = create_projects(roots, args.author, args.desc, args.jobs)
+        for root, exc in errors.items():
+            csl.warn(f'Failed to create stax project at "{root}": {exc}')
+
+        csl.log(f'Created {len(roots) - len(errors)} stax projects ({len(errors)} failed).')
+
 
     @override
     def exec(self, args: Namespace) -> None:
@@ -57,6 +114,11 @@ class InitOperation(Operation):
         Executes the operation given a namespace of parsed arguments.
         """
 
+        # If every matching directory beneath the path was requested, initialize them and return.
+        if args.recursive:
+            self.__exec_recursive(args)
+            return
+
         # Create a path object.
         path = Path(args.path)
 
@@ -0,0 +1,134 @@
+"""
+modulescreateop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line module creation operation.
+"""
+
+from pathlib import Path
+from datetime import date
+from argparse import ArgumentParser, Namespace
+from time import perf_counter
+from pywbu.runtime import EXIT_SUCCESS
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+import stax
+from stax.project import *
+from stax.records import ModuleRecord
+from stax.modules import DEFAULT_CREATE_JOBS, create, expand_pattern, read_manifest
+
+
+class ModulesCreateOperation(Operation):
+    """
+    Represents the command-line module creation operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new module creation operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='create',
+            help='create modules in bulk',
+            desc='Creates modules given by name, by a numbered name pattern, or by a JSON ' \
+                + 'manifest. Each module directory can be cloned from a template directory. The ' \
+                + 'directories are created concurrently and every module is registered with a ' \
+                + 'single configuration write.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add a positional argument for module names.
+        subparser.add_argument('names', nargs='*', help='the names of the modules to create')
+
+        # Add arguments to generate numbered names from a pattern.
+        subparser.add_argument(
+            '-n', '--count',
+            type=int,
+            default=0,
+            help='the number of modules to create from the name pattern')
+        subparser.add_argument(
+            '-P', '--pattern',
+            default='module-{n}',
+            help='the name pattern with an {n} field, such as "web-{n:03}" (default "module-{n}")')
+        subparser.add_argument(
+            '-s', '--start',
+            type=int,
+            default=1,
+            help='the first number substituted into the name pattern (default 1)')
+
+        # Add an argument to read the modules from a manifest.
+        subparser.add_argument(
+            '-m', '--manifest',
+            help='a JSON list of module names or module objects to create')
+
+        # Add arguments for the template and description of the new modules.
+        subparser.add_argument(
+            '-t', '--template',
+            help='a directory whose contents are cloned into each new module directory')
+        subparser.add_argument(
+            '-d', '--desc',
+            help='the description of modules given by name or pattern')
+
+        # Add an argument for the number of concurrent directory creations.
+        subparser.add_argument(
+            '-j', '--jobs',
+            type=int,
+            default=DEFAULT_CREATE_JOBS,
+            help='the maximum number of module directories created at once (default ' \
+                + f'{DEFAULT_CREATE_JOBS})')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing project.
+        proj = enclosing_project(Path(args.path))
+
+        # If the project could not be found display a warning and exit.
+        if not proj:
+            csl.warn(f'No stax project found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        # Try to gather the modules from every source and create them.
+        try:
+            if args.jobs < 1:
+                raise ValueError(f'The number of jobs must be at least 1 but {args.jobs} was ' \
+                                 + 'given.')
+
+            names = args.names + expand_pattern(args.pattern, args.count, args.start)
+            modules = [ModuleRecord(name, date.today(), args.desc) for name in names]
+            if args.manifest:
+                modules += read_manifest(Path(args.manifest))
+
+            if not modules:
+                csl.warn('No modules to create. Give names, a count, or a manifest.', EXIT_SUCCESS)
+
+            start = perf_counter()
+            methods = create(proj.root, modules, Path(args.template) if args.template else None,
+                             args.jobs)
+            elapsed = perf_counter() - start
+
+        # If an exception is raised just display a warning message and exit.
+        except Exception as exc:
+            csl.warn_exc(exc, exit_code=EXIT_SUCCESS)
+
+        # Summarize the modules created and how the template files were cloned.
+        cloned = ', '.join(f'{count} by {method}' for method, count in methods.items())
+        csl.log(f'Created {len(modules)} modules in {elapsed:.2f}s' \
+                + (f' (template files cloned {cloned}).' if cloned else '.'))
@@ -0,0 +1,113 @@
+"""
+modulesdependop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line module dependency setting operation.
+"""
+
+from pathlib import Path
+from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+from pywbu.cli.complete import set_completer
+import stax
+from stax.project import *
+from stax.graph import ModuleGraph
+
+
+class ModulesDependOperation(Operation):
+    """
+    Represents the command-line module dependency setting operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new module dependency setting operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='depend',
+            help='set the modules a module depends on',
+            desc='Adds modules to (or removes them from) the dependencies of a module. The ' \
+                + 'dependencies must exist and must not form a cycle. With no other modules the ' \
+                + 'current dependencies are displayed.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add positional arguments for the dependent module and its dependencies.
+        set_completer(subparser.add_argument(
+            'module', help='the module whose dependencies are changed'), 'modules')
+        set_completer(subparser.add_argument(
+            'dependencies', nargs='*', help='the modules it depends on'), 'modules')
+
+        # Add a flag to remove the given dependencies instead of adding them.
+        subparser.add_argument(
+            '-r', '--remove',
+            action='store_true',
+            help='remove the given dependencies instead of adding them')
+
+        # Add a flag to clear every dependency before adding the given ones.
+        subparser.add_argument(
+            '-c', '--clear',
+            action='store_true',
+            help='remove every current dependency first')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing project.
+        proj = enclosing_project(Path(args.path))
+
+        # If the project could not be found display a warning and exit.
+        if not proj:
+            csl.warn(f'No stax project found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        # Try to update the dependencies.
+        try:
+            config = proj.config()
+            modules = {module.name: module for module in config.iter_modules()}
+
+            # Ensure the module exists.
+            module = modules.get(args.module)
+            if not module:
+                raise ValueError(f'No module named "{args.module}" exists.')
+
+            # Without changes just display the current dependencies.
+            if not args.dependencies and not args.clear:
+                for name in module.depends_on:
+                    csl.output(name)
+                return
+
+            # Compute the new dependencies keeping their order.
+            depends_on = [] if args.clear else list(module.depends_on)
+            if args.remove:
+                depends_on = [name for name in depends_on if name not in args.dependencies]
+            else:
+                depends_on += [name for name in args.dependencies if name not in depends_on]
+
+            # Check the new graph before anything is written.
+            module.depends_on = tuple(depends_on)
+            ModuleGraph.from_modules(modules.values())
+            config.set_module_record(module)
+
+        # If an exception is raised just display a warning message.
+        except Exception as exc:
+            csl.warn_exc(exc)
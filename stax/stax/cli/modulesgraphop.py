@@ -0,0 +1,108 @@
+"""
+modulesgraphop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line module dependency graph operation.
+"""
+
+from pathlib import Path
+import json
+from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+from pywbu.cli.complete import set_completer
+import stax
+from stax.project import *
+from stax.graph import ModuleGraph
+
+
+JSON_INDENT = 2
+"""
+The level of indent to use for formatting JSON. A value of None will not format the JSON at all. A
+value of 0 will insert newlines but no indentation.
+"""
+
+
+class ModulesGraphOperation(Operation):
+    """
+    Represents the command-line module dependency graph operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new module dependency graph operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='graph',
+            help='display the module dependency graph',
+            desc='Displays the modules grouped into waves in dependency order. The modules of a ' \
+                + 'wave depend only on modules in earlier waves so they can be processed ' \
+                + 'concurrently. The longest chain of dependent modules is displayed as the ' \
+                + 'critical path.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add an argument to restrict the graph to the modules downstream of changed modules.
+        set_completer(subparser.add_argument(
+            '-d', '--downstream',
+            nargs='+',
+            metavar='MODULE',
+            help='only include the given modules and every module that depends on them'),
+            'modules')
+
+        # Add a flag to output JSON.
+        subparser.add_argument(
+            '-j', '--json',
+            action='store_true',
+            help='display the waves and critical path as JSON')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing project.
+        proj = enclosing_project(Path(args.path))
+
+        # If the project could not be found display a warning and exit.
+        if not proj:
+            csl.warn(f'No stax project found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        # Try to build the graph and group the selected modules into waves.
+        try:
+            graph = ModuleGraph.from_modules(proj.modules())
+            names = graph.downstream(args.downstream) if args.downstream else None
+            waves = graph.waves(names)
+            path, _ = graph.critical_path(None if names is None else dict.fromkeys(names, 1.0))
+
+        # If an exception is raised just display a warning message and exit.
+        except Exception as exc:
+            csl.warn_exc(exc, exit_code=EXIT_SUCCESS)
+
+        # If the JSON argument is specified, output the waves and critical path as JSON.
+        if args.json:
+            csl.output(json.dumps({'waves': waves, 'critical_path': path}, indent=JSON_INDENT))
+            return
+
+        # Output each wave followed by the critical path.
+        for number, wave in enumerate(waves, 1):
+            csl.output(f'Wave {number}: {", ".join(wave)}')
+        if path:
+            csl.output(f'Critical path: {" -> ".join(path)}')
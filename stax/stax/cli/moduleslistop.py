@@ -0,0 +1,119 @@
+"""
+moduleslistop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line module listing operation.
+"""
+
+from pathlib import Path
+from fnmatch import fnmatchcase
+from itertools import islice
+import json
+from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS
+from pywbu.annotations import override
+from pywbu.exc import MalformedDataException
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+import stax
+from stax.project import *
+from stax.records import format_date
+
+
+class ModulesListOperation(Operation):
+    """
+    Represents the command-line module listing operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new module listing operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='list',
+            help='list the modules of the project',
+            desc='Lists the modules of the project as a table or as JSON lines. Modules are ' \
+                + 'streamed from the configuration file so memory use does not depend on the ' \
+                + 'number of modules.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add optional arguments to paginate the listing.
+        subparser.add_argument(
+            '-l', '--limit',
+            type=int,
+            default=None,
+            help='the maximum number of modules to list')
+        subparser.add_argument(
+            '-o', '--offset',
+            type=int,
+            default=0,
+            help='the number of matching modules to skip before listing')
+
+        # Add an optional argument to filter modules by name.
+        subparser.add_argument(
+            '-f', '--filter',
+            default=None,
+            help='only list modules whose name matches a glob pattern (e.g. "api-*")')
+
+        # Add a flag to output JSON lines instead of a table.
+        subparser.add_argument(
+            '-j', '--json',
+            action='store_true',
+            help='display each module as a line of JSON')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        if args.limit is not None and args.limit < 0:
+            csl.warn(f'The limit must be at least 0 but {args.limit} was given.', EXIT_SUCCESS)
+        if args.offset < 0:
+            csl.warn(f'The offset must be at least 0 but {args.offset} was given.', EXIT_SUCCESS)
+
+        # Find the enclosing project.
+        proj = enclosing_project(Path(args.path))
+
+        # If the project could not be found display a warning and exit.
+        if not proj:
+            csl.warn(f'No stax project found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        # Stream the module records and lazily narrow them by name if a filter was given.
+        modules = proj.config().iter_modules()
+        if args.filter:
+            modules = (module for module in modules if fnmatchcase(module.name, args.filter))
+
+        # Lazily apply the pagination window. The stream is closed once the limit is reached.
+        stop = args.offset + args.limit if args.limit is not None else None
+        modules = islice(modules, args.offset, stop)
+
+        # Try to output each module as a JSON line as soon as it is read, or stream the modules
+        # into a table whose column widths are sampled from the first modules.
+        try:
+            if args.json:
+                for module in modules:
+                    csl.output(json.dumps(module.to_dict()))
+            else:
+                csl.table(('NAME', 'CREATED', 'DESCRIPTION'),
+                          ((module.name, format_date(module.creation_date), module.desc)
+                           for module in modules))
+
+        # If the configuration file is malformed just display a warning message.
+        except MalformedDataException as exc:
+            csl.warn_exc(exc)
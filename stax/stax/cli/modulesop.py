@@ -0,0 +1,75 @@
+"""
+modulesop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line module management operation. The operation holds
+its own set of nested operations (e.g. "stax modules list").
+"""
+
+from argparse import ArgumentParser, Namespace
+from pywbu.annotations import override
+from pywbu.cli.op import Operation
+from pywbu.cli.opset import OperationSet
+import stax
+from stax.cli.moduleslistop import ModulesListOperation
+from stax.cli.modulesqueryop import ModulesQueryOperation
+from stax.cli.modulesdependop import ModulesDependOperation
+from stax.cli.modulesgraphop import ModulesGraphOperation
+from stax.cli.modulescreateop import ModulesCreateOperation
+
+
+class ModulesOperation(Operation):
+    """
+    Represents the command-line module management operation.
+    """
+
+    __opset: OperationSet
+    """
+    The set of nested module operations.
+    """
+
+
+    def __init__(self) -> None:
+        """
+        Creates a new module management operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='modules',
+            help='manage the modules of the project',
+            desc='Manages the web modules of the project enclosing the current working directory ' \
+                + '(or a specified directory).',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+        # Create an operation set for the nested module operation positional argument. Add all the
+        # relevant operation objects to the set.
+        self.__opset = OperationSet('modules_operation')
+        self.__opset.add_operations(ModulesListOperation(), ModulesQueryOperation(),
+                                    ModulesDependOperation(), ModulesGraphOperation(),
+                                    ModulesCreateOperation())
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Configure the subparser to use the nested operations in the operation set.
+        self.__opset.configure_parser(subparser, True)
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Allow the nested operation set to perform the proper nested operation.
+        self.__opset.process_args(args)
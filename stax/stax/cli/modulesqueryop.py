@@ -0,0 +1,111 @@
+"""
+modulesqueryop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line module query operation.
+"""
+
+from pathlib import Path
+import json
+from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS
+from pywbu.annotations import override
+from pywbu.exc import MalformedDataException
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+import stax
+from stax.project import *
+from stax.query import ModuleIndex, parse_query
+
+
+JSON_INDENT = 2
+"""
+The level of indent to use for formatting JSON. A value of None will not format the JSON at all. A
+value of 0 will insert newlines but no indentation.
+"""
+
+
+class ModulesQueryOperation(Operation):
+    """
+    Represents the command-line module query operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new module query operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='query',
+            help='query the modules of the project',
+            desc='Queries the modules of the project using indexes stored in the metadata ' \
+                + 'directory. A query is a list of terms such as "name^=api", "name=gateway", ' \
+                + '"created>=2023-01-01", "created<2023-07-01", "sort=date" (or "sort=-date" ' \
+                + 'for descending), "fields=name,creation_date", and "limit=10".',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add a positional argument for the query terms.
+        subparser.add_argument('terms', nargs='*', help='the query terms (all modules by default)')
+
+        # Add a flag to output JSON instead of a table.
+        subparser.add_argument(
+            '-j', '--json',
+            action='store_true',
+            help='display the results as JSON')
+
+        # Add a flag to display the query plan.
+        subparser.add_argument(
+            '-e', '--explain',
+            action='store_true',
+            help='display how the query is executed before the results')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing project.
+        proj = enclosing_project(Path(args.path))
+
+        # If the project could not be found display a warning and exit.
+        if not proj:
+            csl.warn(f'No stax project found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        # Try to parse the query, load the index, and execute the query.
+        try:
+            query = parse_query(' '.join(args.terms))
+            index = ModuleIndex.for_config(proj.config())
+            plan = index.plan(query)
+            results = index.execute(query, plan)
+
+        # If the query or configuration file is malformed display a warning and exit.
+        except (ValueError, MalformedDataException) as exc:
+            csl.warn_exc(exc, exit_code=EXIT_SUCCESS)
+
+        # If requested, log the query plan.
+        if args.explain:
+            csl.log(f'Plan: {plan}')
+
+        # If the JSON argument is specified, output the results as a formatted JSON string.
+        if args.json:
+            csl.output(json.dumps(results, indent=JSON_INDENT))
+            return
+
+        # Output the results as a table.
+        csl.table([field.upper() for field in query.fields],
+                  [[result[field] for field in query.fields] for result in results])
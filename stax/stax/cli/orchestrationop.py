@@ -0,0 +1,200 @@
+"""
+orchestrationop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines an abstract class that represents a command-line operation running a Docker Compose command
+for each module service in parallel.
+"""
+
+from abc import abstractmethod
+from pathlib import Path
+from argparse import ArgumentParser, Namespace
+from time import perf_counter
+from pywbu.runtime import EXIT_SUCCESS, EXIT_FAILURE
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+from pywbu.cli.complete import set_completer
+from stax.project import *
+from stax.modules import MODULES_DIR_NAME
+from stax.compose import COMPOSE_FILE_NAME, ComposeGenerator, is_split, service_dependencies
+from stax.graph import ModuleGraph
+from stax.orchestrate import DOCKER_ENV_VAR, DEFAULT_JOBS, Task, Orchestrator, docker_binary, \
+    summarize
+
+
+class OrchestrationOperation(Operation):
+    """
+    Represents an abstract command-line operation that runs a Docker Compose command for each
+    selected module service over a bounded pool of subprocesses.
+    """
+
+    _reverse = False
+    """
+    Whether services are ordered after the services that depend on them instead of before the
+    services they depend on.
+    """
+
+    _ordered = True
+    """
+    Whether the commands are ordered by the dependencies between services at all.
+    """
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add an argument to select modules. Every module with a service is selected by default.
+        set_completer(subparser.add_argument(
+            '-m', '--module',
+            action='append',
+            dest='modules',
+            help='a module to run the command for (may be repeated, default all modules)'),
+            'modules')
+
+        # Add a flag to extend the selection to every module downstream of the selected modules.
+        subparser.add_argument(
+            '-d', '--downstream',
+            action='store_true',
+            help='also run the command for every module that depends on a selected module, such ' \
+                + 'as after the selected modules changed')
+
+        # Add an argument for the number of concurrent commands.
+        subparser.add_argument(
+            '-j', '--jobs',
+            type=int,
+            default=DEFAULT_JOBS,
+            help=f'the maximum number of commands run at once (default {DEFAULT_JOBS})')
+
+        # Add a flag to continue with independent services after a failure.
+        subparser.add_argument(
+            '-k', '--keep-going',
+            action='store_true',
+            help='keep running the services that do not depend on a failed service instead of ' \
+                + 'stopping at the first failure')
+
+        # Add a flag to write the output of each service as one block once its command exits.
+        subparser.add_argument(
+            '-g', '--group-output',
+            action='store_true',
+            help='write the output of each service as one block when its command finishes ' \
+                + 'instead of interleaving lines as they are produced')
+
+        # Add an argument to override the Docker executable.
+        subparser.add_argument(
+            '--docker',
+            help=f'the Docker executable to run (default ${DOCKER_ENV_VAR} or "docker")')
+
+        # Configure the arguments specific to the command.
+        self._configure_command_args(subparser)
+
+
+    def _configure_command_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments specific to the command of the operation. None by default.
+        """
+
+        pass
+
+
+    @abstractmethod
+    def _compose_args(self, args: Namespace, service: str) -> list[str]:
+        """
+        Returns the Docker Compose subcommand and its arguments run for the given service.
+        """
+
+        pass
+
+
+    def __tasks(self, proj: Project, args: Namespace) -> list[Task]:
+        """
+        Creates a task for each selected service from the project's generated compose file.
+        """
+
+        # The compose file must have been generated.
+        compose_file = proj.root / COMPOSE_FILE_NAME
+        if not compose_file.is_file():
+            raise FileNotFoundError(f'No compose file exists at "{compose_file}". Generate it ' \
+                                    + 'with "stax compose" first.')
+
+        # Find the services without writing anything and warn if the files are out of date.
+        result = ComposeGenerator(proj, None, is_split(compose_file)).generate(True)
+        if result.changed:
+            csl.warn('The compose files are out of date. Run "stax compose" to regenerate them.')
+
+        # Build the module dependency graph, which also ensures it has no cycle.
+        graph = ModuleGraph.from_modules(proj.modules())
+        services = result.services
+        by_module = {module: service for service, module in services.items()}
+
+        # Select the services of the requested modules and, if requested, of every module downstream
+        # of them that has a service.
+        if args.modules:
+            for module in args.modules:
+                if module not in by_module:
+                    raise ValueError(f'Module "{module}" has no service in the compose file.')
+            modules = graph.downstream(args.modules) if args.downstream else args.modules
+            services = {by_module[module]: module for module in dict.fromkeys(modules)
+                        if module in by_module}
+
+        def depends(module: str) -> list[str]:
+            """
+            Returns the services a module's service depends on through the module's dependencies
+            and the dependencies declared in its service file.
+            """
+
+            return [by_module[name] for name in graph.depends_on[module] if name in by_module] \
+                + service_dependencies(proj.root / MODULES_DIR_NAME / module)
+
+        # Create the task of each service with its dependencies.
+        prefix = [docker_binary(args.docker), 'compose', '-f', str(compose_file)]
+        return [Task(service,
+                     prefix + self._compose_args(args, service),
+                     depends(module) if self._ordered else ())
+                for service, module in services.items()]
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing project.
+        proj = enclosing_project(Path(args.path))
+
+        # If the project could not be found display a warning and exit.
+        if not proj:
+            csl.warn(f'No stax project found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        # Try to create the tasks and run them.
+        try:
+            tasks = self.__tasks(proj, args)
+            if not tasks:
+                csl.warn('No module services to run the command for.', EXIT_SUCCESS)
+
+            start = perf_counter()
+            mode = 'grouped' if args.group_output else 'interleaved'
+            with csl.Progress('Services finished', len(tasks)) as progress:
+                succeeded = Orchestrator(args.jobs, not args.keep_going, proj.root, mode) \
+                    .run(tasks, self._reverse, progress)
+            elapsed = perf_counter() - start
+
+        # If an exception is raised just display a warning message.
+        except Exception as exc:
+            csl.warn_exc(exc)
+            return
+
+        # Display the timing summary and fail if any service did not succeed.
+        for line in summarize(tasks, elapsed):
+            csl.log(line)
+
+        if not succeeded:
+            csl.warn('The command did not succeed for every service.', EXIT_FAILURE)
@@ -0,0 +1,203 @@
+"""
+shellop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line interactive shell operation.
+"""
+
+from pathlib import Path
+from argparse import ArgumentParser, Namespace
+import sys
+import shlex
+from pywbu.annotations import override
+import pywbu.console as csl
+import pywbu.cli.complete as comp
+from pywbu.cli.op import Operation
+import stax
+from stax.project import *
+
+# The readline module is only available on some platforms. Without it the shell has no history or
+# completion.
+try:
+    import readline
+except ImportError:
+    readline = None
+
+
+HISTORY_FILE_NAME = '.stax_history'
+"""
+The name of the file in the user's home directory that keeps the shell command history.
+"""
+
+HISTORY_LENGTH = 1000
+"""
+The maximum number of commands kept in the shell command history.
+"""
+
+EXIT_COMMANDS = ('exit', 'quit')
+"""
+The commands that leave the shell.
+"""
+
+
+class ShellOperation(Operation):
+    """
+    Represents the command-line interactive shell operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new interactive shell operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='shell',
+            help='run stax commands interactively',
+            desc='Runs stax commands read from an interactive prompt in a single process. Each ' \
+                + 'line is a stax command without the program name, such as "modules list". The ' \
+                + 'argument parser, the project, and its parsed configuration are kept between ' \
+                + 'commands, and the configuration is only read again once it changes. Commands ' \
+                + 'are kept in a history and can be completed with tab. Enter ' \
+                + f'{" or ".join(EXIT_COMMANDS)} (or end the input) to leave the shell.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, _: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        pass
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Build the argument parser once. Commands run from the shell's path unless they give
+        # another.
+        from stax.cli.cli import build_parser, process_top_level_args
+        parser, opset = build_parser()
+        parser.set_defaults(path=args.path)
+
+        # Find the enclosing project and read its configuration ahead of the first command.
+        proj = enclosing_project(Path(args.path))
+        if proj:
+            try:
+                proj.record()
+            except Exception as exc:
+                csl.warn_exc(exc)
+
+        interactive = sys.stdin.isatty()
+        if interactive and readline is not None:
+            self.__configure_readline(parser, proj)
+
+        # The console flags and log levels of the shell, restored after each command so flags given
+        # to one command do not affect the next.
+        flags = (csl.warnings_enabled, csl.logging_enabled, csl.formatted_output, csl.json_logs)
+        levels = csl.save_levels()
+
+        # Read and run commands until the input ends or an exit command is entered.
+        while True:
+            try:
+                line = input(self.__prompt(proj) if interactive else '')
+            except EOFError:
+                break
+            except KeyboardInterrupt:
+                csl.output()
+                continue
+
+            try:
+                words = shlex.split(line)
+            except ValueError as exc:
+                csl.warn_exc(exc)
+                continue
+
+            if not words:
+                continue
+            if words[0] in EXIT_COMMANDS:
+                break
+            if words[0] == self.name():
+                csl.warn('The shell is already running.')
+                continue
+
+            # Run the command. Errors and exits (such as from a warning or a help message) end the
+            # command instead of the shell.
+            try:
+                command_args = parser.parse_args(words)
+                process_top_level_args(command_args)
+                opset.process_args(command_args)
+            except SystemExit:
+                pass
+            except KeyboardInterrupt:
+                csl.warn('A keyboard interrupt occured.')
+            except Exception as exc:
+                csl.warn_exc(exc)
+
+            csl.warnings_enabled, csl.logging_enabled, csl.formatted_output, csl.json_logs = flags
+            csl.restore_levels(levels)
+
+        # Save the history of an interactive shell.
+        if interactive and readline is not None:
+            try:
+                readline.write_history_file(Path.home() / HISTORY_FILE_NAME)
+            except OSError:
+                pass
+
+        if interactive:
+            csl.output()
+
+
+    def __prompt(self, proj: Project) -> str:
+        """
+        Returns the prompt, which names the project if there is one.
+        """
+
+        try:
+            return f'{stax.PACK_NAME}:{proj.record().name}> ' if proj else f'{stax.PACK_NAME}> '
+        except Exception:
+            return f'{stax.PACK_NAME}> '
+
+
+    def __configure_readline(self, parser: ArgumentParser, proj: Project) -> None:
+        """
+        Loads the command history and completes commands with tab. Completions come from the spec
+        of the argument parser and module names come from the project's cached configuration.
+        """
+
+        # Load the history kept by earlier shells.
+        try:
+            readline.read_history_file(Path.home() / HISTORY_FILE_NAME)
+        except OSError:
+            pass
+        readline.set_history_length(HISTORY_LENGTH)
+
+        spec = comp.build_spec(parser)
+
+        def modules(values: dict[str, str]) -> list[str]:
+            path = values.get('--path') or values.get('-p')
+            project = enclosing_project(Path(path)) if path else proj
+            return [module.name for module in project.modules()] if project else []
+
+        candidates = []
+
+        def completer(text: str, state: int) -> str:
+            # Compute the completions of the word once, on the first call for it.
+            if state == 0:
+                line = readline.get_line_buffer()[:readline.get_begidx()]
+                candidates[:] = comp.complete(spec, line.split(), text, {'modules': modules})
+            return candidates[state] if state < len(candidates) else None
+
+        # Words are only separated by whitespace so options and paths complete whole.
+        readline.set_completer_delims(' \t\n')
+        readline.set_completer(completer)
+        readline.parse_and_bind('tab: complete')
@@ -0,0 +1,135 @@
+"""
+statsop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line module analytics operation.
+"""
+
+from pathlib import Path
+import json
+from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS
+from pywbu.exc import MalformedDataException
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+import stax
+from stax.project import *
+from stax.records import parse_date
+from stax.table import ModuleTable, numpy_available
+
+
+JSON_INDENT = 2
+"""
+The level of indent to use for formatting JSON. A value of None will not format the JSON at all. A
+value of 0 will insert newlines but no indentation.
+"""
+
+
+class StatsOperation(Operation):
+    """
+    Represents the command-line module analytics operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new module analytics operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='stats',
+            help='show module analytics as JSON',
+            desc='Shows analytics about the modules of the project (and optionally other ' \
+                + 'projects) as JSON such as module counts by creation month, a module age ' \
+                + 'histogram, and module counts by project author. Requires NumPy.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add a positional argument to include additional projects in the analytics.
+        subparser.add_argument(
+            'projects',
+            nargs='*',
+            help='paths within additional projects to include in the analytics')
+
+        # Add optional arguments to restrict the analytics to a creation date range.
+        subparser.add_argument(
+            '-s', '--since',
+            type=parse_date,
+            default=None,
+            help='only include modules created on or after a date (YYYY-MM-DD)')
+        subparser.add_argument(
+            '-t', '--until',
+            type=parse_date,
+            default=None,
+            help='only include modules created on or before a date (YYYY-MM-DD)')
+
+        # Add an optional argument to specify the number of age histogram bins.
+        subparser.add_argument(
+            '-b', '--bins',
+            type=int,
+            default=10,
+            help='the number of bins in the module age histogram (default 10)')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # If NumPy is not installed the columnar view is unavailable so display a warning and exit.
+        if not numpy_available():
+            csl.warn('The stats operation requires NumPy. Install it with "pip3 install numpy".',
+                     EXIT_SUCCESS)
+
+        # Find the project enclosing the working path and each additional path. Each project is only
+        # counted once however many of the paths are within it.
+        records = []
+        roots = set()
+        for path in [args.path] + args.projects:
+            proj = enclosing_project(Path(path))
+
+            # If a project could not be found display a warning and exit.
+            if not proj:
+                csl.warn(f'No stax project found enclosing "{path}".', EXIT_SUCCESS)
+
+            if proj.root in roots:
+                continue
+            roots.add(proj.root)
+
+            # Try to read the project record, displaying a warning and exiting if it is malformed.
+            try:
+                records.append(proj.record())
+            except MalformedDataException as exc:
+                csl.warn_exc(exc, exit_code=EXIT_SUCCESS)
+
+        # Build one columnar table spanning every project and narrow it to the date range.
+        table = ModuleTable.from_projects(records).created_between(args.since, args.until)
+
+        # Compute the age histogram.
+        counts, edges = table.age_histogram(args.bins)
+
+        # Output the analytics as a formatted JSON string.
+        csl.output(json.dumps({
+            'projects': len(records),
+            'modules': len(table),
+            'described': int(table.has_desc.sum()),
+            'by_month': table.counts_by_month(),
+            'by_author': table.counts_by_author(),
+            'age_histogram': {
+                'counts': counts,
+                'edges': edges
+            }
+        }, indent=JSON_INDENT))
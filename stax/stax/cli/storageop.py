@@ -0,0 +1,90 @@
+"""
+storageop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line configuration storage layout operation.
+"""
+
+from pathlib import Path
+from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+import stax
+from stax.project import *
+from stax.config import STORAGE_LAYOUTS
+
+
+class StorageOperation(Operation):
+    """
+    Represents the command-line configuration storage layout operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new configuration storage layout operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='storage',
+            help='show or change how the project configuration is stored',
+            desc='Shows the current configuration storage layout of the project or converts it ' \
+                + 'to another layout. The "file" layout stores every module in the configuration ' \
+                + 'file. The "sharded" layout stores one small file per module plus a manifest in ' \
+                + f'"{PROJ_META_DIR_NAME}" so single module reads and updates touch only that ' \
+                + 'module. The "sqlite" layout stores the modules in an indexed SQLite database ' \
+                + 'in write-ahead logging mode so readers are never blocked by writers. ' \
+                + 'Converting exports the modules from the current layout and imports them into ' \
+                + 'the new one.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add an optional positional argument for the layout to convert to.
+        subparser.add_argument(
+            'layout',
+            nargs='?',
+            choices=STORAGE_LAYOUTS,
+            help='the layout to convert the configuration to (shows the current layout if omitted)')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing project.
+        proj = enclosing_project(Path(args.path))
+
+        # If the project could not be found display a warning and exit.
+        if not proj:
+            csl.warn(f'No stax project found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        config = proj.config()
+
+        # If no layout was given output the current layout and return.
+        if not args.layout:
+            csl.output(config.layout())
+            return
+
+        # Try to convert the configuration to the requested layout.
+        try:
+            count = config.convert(args.layout)
+            csl.log(f'Converted {count} modules to the "{args.layout}" layout.')
+
+        # If an exception is raised just display a warning message.
+        except Exception as exc:
+            csl.warn_exc(exc)
@@ -0,0 +1,59 @@
+"""
+upop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line service starting operation.
+"""
+
+from argparse import ArgumentParser, Namespace
+from pywbu.annotations import override
+import stax
+from stax.cli.orchestrationop import OrchestrationOperation
+
+
+class UpOperation(OrchestrationOperation):
+    """
+    Represents the command-line service starting operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new service starting operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='up',
+            help='start the module services in parallel',
+            desc='Creates and starts the service of each module (or of the specified modules) in ' \
+                + 'the background with one "docker compose up" per service. Commands run in ' \
+                + 'parallel and each service starts once the services it depends on have started.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_command_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments specific to the command of the operation.
+        """
+
+        # Add a flag to build images before starting.
+        subparser.add_argument(
+            '-b', '--build',
+            action='store_true',
+            help='build the images before starting the services')
+
+
+    @override
+    def _compose_args(self, args: Namespace, service: str) -> list[str]:
+        """
+        Returns the Docker Compose subcommand and its arguments run for the given service. Compose
+        is told not to start dependencies itself because they are started by their own commands.
+        """
+
+        return ['up', '--detach', '--no-deps'] + (['--build'] if args.build else []) + [service]
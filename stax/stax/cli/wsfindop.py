@@ -0,0 +1,121 @@
+"""
+wsfindop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line workspace module search operation.
+"""
+
+from pathlib import Path
+import json
+from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+import stax
+from stax.records import parse_date, format_date
+from stax.workspace import enclosing_workspace
+
+
+class WorkspaceFindOperation(Operation):
+    """
+    Represents the command-line workspace module search operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new workspace module search operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='find',
+            help='find modules across the workspace',
+            desc='Finds the modules of every project in the workspace whose names match a glob ' \
+                + 'pattern and that were created within a date range, along with the project ' \
+                + 'that defines each one. The answer comes from the index without reading any ' \
+                + 'project unless a synchronization is requested.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add a positional argument for the module name pattern.
+        subparser.add_argument(
+            'pattern',
+            nargs='?',
+            default=None,
+            help='a glob pattern the module names must match (default every module)')
+
+        # Add optional arguments to restrict the search to a creation date range.
+        subparser.add_argument(
+            '-s', '--since',
+            type=parse_date,
+            default=None,
+            help='only find modules created on or after a date (YYYY-MM-DD)')
+        subparser.add_argument(
+            '-t', '--until',
+            type=parse_date,
+            default=None,
+            help='only find modules created on or before a date (YYYY-MM-DD)')
+
+        # Add a flag to update the index first.
+        subparser.add_argument(
+            '-S', '--sync',
+            action='store_true',
+            help='update the index from the projects whose configuration changed first')
+
+        # Add a flag to output JSON lines instead of a table.
+        subparser.add_argument(
+            '-j', '--json',
+            action='store_true',
+            help='display each module as a line of JSON')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing workspace.
+        workspace = enclosing_workspace(Path(args.path))
+
+        # If the workspace could not be found display a warning and exit.
+        if not workspace:
+            csl.warn(f'No stax workspace found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        # Try to update the index if requested.
+        try:
+            if args.sync:
+                with csl.Progress('Indexing projects') as progress:
+                    result = workspace.sync(progress)
+                for path, exc in result.errors.items():
+                    csl.warn(f'Failed to index project "{path}": {exc}')
+
+        # If an exception is raised just display a warning message and exit.
+        except Exception as exc:
+            csl.warn_exc(exc, exit_code=EXIT_SUCCESS)
+
+        # Output each matching module from the index as a JSON line or as a table row.
+        modules = workspace.find(args.pattern, args.since, args.until)
+        if args.json:
+            for module in modules:
+                csl.output(json.dumps({'name': module.name,
+                                       'creation_date': format_date(module.creation_date),
+                                       'desc': module.desc,
+                                       'project': module.project,
+                                       'path': module.path}))
+        else:
+            csl.table(('NAME', 'CREATED', 'PATH', 'PROJECT'),
+                      ((module.name, format_date(module.creation_date), module.path,
+                        module.project) for module in modules))
@@ -0,0 +1,105 @@
+"""
+wsinfoop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line workspace information operation.
+"""
+
+from pathlib import Path
+import json
+from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+import stax
+from stax.workspace import enclosing_workspace
+
+
+JSON_INDENT = 2
+"""
+The level of indent to use for formatting JSON. A value of None will not format the JSON at all. A
+value of 0 will insert newlines but no indentation.
+"""
+
+
+class WorkspaceInfoOperation(Operation):
+    """
+    Represents the command-line workspace information operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new workspace information operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='info',
+            help='display workspace info',
+            desc='Displays the workspace properties and each indexed project with its module ' \
+                + 'count. The answer comes from the index, which is updated with "stax ws sync".',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add a flag to output JSON.
+        subparser.add_argument(
+            '-j', '--json',
+            action='store_true',
+            help='display the workspace info as JSON')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing workspace.
+        workspace = enclosing_workspace(Path(args.path))
+
+        # If the workspace could not be found display a warning and exit.
+        if not workspace:
+            csl.warn(f'No stax workspace found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        # Try to read the workspace properties and index.
+        try:
+            properties = workspace.properties()
+            index = workspace.index()
+
+        # If an exception is raised just display a warning message and exit.
+        except Exception as exc:
+            csl.warn_exc(exc, exit_code=EXIT_SUCCESS)
+
+        projects = [{'path': path, 'uuid': entry['uuid'], 'name': entry['name'],
+                     'modules': len(entry['modules'])}
+                    for path, entry in sorted(index.items())]
+
+        # If the JSON argument is specified, output the info as JSON.
+        if args.json:
+            csl.output(json.dumps({'location': str(workspace.root), **properties,
+                                   'projects': projects}, indent=JSON_INDENT))
+            return
+
+        # Output the workspace properties followed by a row for each project.
+        csl.key_values((('Location', workspace.root),
+                        ('Name', properties.get('name')),
+                        ('Projects', len(projects)),
+                        ('Modules', sum(project['modules'] for project in projects))))
+        if projects:
+            csl.output()
+            csl.table(('PATH', 'MODULES', 'NAME'),
+                      [(project['path'], project['modules'], project['name'])
+                       for project in projects],
+                      '<><')
@@ -0,0 +1,74 @@
+"""
+wsinitop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line workspace initialization operation.
+"""
+
+from pathlib import Path
+from argparse import ArgumentParser, Namespace
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+import stax
+from stax.workspace import WORKSPACE_FILE_NAME, create_workspace, is_workspace
+
+
+class WorkspaceInitOperation(Operation):
+    """
+    Represents the command-line workspace initialization operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new workspace initialization operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='init',
+            help='create a new workspace',
+            desc='Creates a stax workspace in the current working directory (or at a specified ' \
+                + f'directory) by writing a "{WORKSPACE_FILE_NAME}" file, then indexes every ' \
+                + 'project beneath it.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Add an optional argument to specify a workspace name.
+        subparser.add_argument('-n', '--name', default=None, help='the title of the workspace')
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Create a path object.
+        path = Path(args.path)
+
+        # If the path already points to a workspace display a warning and return immediately.
+        if is_workspace(path):
+            csl.warn(f'The given path already points to a stax workspace: "{path}".')
+            return
+
+        # Try to create the workspace and report how many projects were indexed.
+        try:
+            workspace = create_workspace(path, args.name)
+            csl.log(f'Created workspace "{workspace.root}" with {len(workspace.index())} ' \
+                    + 'projects.')
+
+        # If an exception is raised just display a warning message.
+        except Exception as exc:
+            csl.warn_exc(exc)
@@ -0,0 +1,75 @@
+"""
+wsop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line workspace management operation. The operation holds
+its own set of nested operations (e.g. "stax ws find").
+"""
+
+from argparse import ArgumentParser, Namespace
+from pywbu.annotations import override
+from pywbu.cli.op import Operation
+from pywbu.cli.opset import OperationSet
+import stax
+from stax.cli.wsinitop import WorkspaceInitOperation
+from stax.cli.wssyncop import WorkspaceSyncOperation
+from stax.cli.wsinfoop import WorkspaceInfoOperation
+from stax.cli.wsfindop import WorkspaceFindOperation
+
+
+class WorkspaceOperation(Operation):
+    """
+    Represents the command-line workspace management operation.
+    """
+
+    __opset: OperationSet
+    """
+    The set of nested workspace operations.
+    """
+
+
+    def __init__(self) -> None:
+        """
+        Creates a new workspace management operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='ws',
+            help='manage a workspace of projects',
+            desc='Manages the stax workspace enclosing the current working directory (or a ' \
+                + 'specified directory). A workspace groups the projects beneath it and keeps an ' \
+                + 'index of their modules so questions spanning projects are answered without ' \
+                + 'reading each project.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+        # Create an operation set for the nested workspace operation positional argument. Add all
+        # the relevant operation objects to the set.
+        self.__opset = OperationSet('ws_operation')
+        self.__opset.add_operations(WorkspaceInitOperation(), WorkspaceSyncOperation(),
+                                    WorkspaceInfoOperation(), WorkspaceFindOperation())
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        # Configure the subparser to use the nested operations in the operation set.
+        self.__opset.configure_parser(subparser, True)
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Allow the nested operation set to perform the proper nested operation.
+        self.__opset.process_args(args)
@@ -0,0 +1,77 @@
+"""
+wssyncop.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines a class that represents the command-line workspace index synchronization operation.
+"""
+
+from pathlib import Path
+from argparse import ArgumentParser, Namespace
+from pywbu.runtime import EXIT_SUCCESS
+from pywbu.annotations import override
+import pywbu.console as csl
+from pywbu.cli.op import Operation
+import stax
+from stax.workspace import enclosing_workspace
+
+
+class WorkspaceSyncOperation(Operation):
+    """
+    Represents the command-line workspace index synchronization operation.
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new workspace index synchronization operation object.
+        """
+
+        # Construct the operation parent class with an option name, brief help message, long
+        # description, and epilogue.
+        super().__init__(
+            name='sync',
+            help='update the workspace index',
+            desc='Updates the workspace index with the projects beneath the workspace. Only ' \
+                + 'projects whose configuration changed since they were last indexed are read.',
+            epilog=f'{stax.PACK_AUTHOR} | {stax.PACK_CREATION}')
+
+
+    @override
+    def _configure_args(self, subparser: ArgumentParser) -> None:
+        """
+        Configures the arguments of the subparser.
+        """
+
+        pass
+
+
+    @override
+    def exec(self, args: Namespace) -> None:
+        """
+        Executes the operation given a namespace of parsed arguments.
+        """
+
+        # Find the enclosing workspace.
+        workspace = enclosing_workspace(Path(args.path))
+
+        # If the workspace could not be found display a warning and exit.
+        if not workspace:
+            csl.warn(f'No stax workspace found enclosing "{args.path}".', EXIT_SUCCESS)
+
+        # Try to synchronize the index.
+        try:
+            with csl.Progress('Indexing projects') as progress:
+                result = workspace.sync(progress)
+
+        # If an exception is raised just display a warning message and exit.
+        except Exception as exc:
+            csl.warn_exc(exc, exit_code=EXIT_SUCCESS)
+
+        # Warn about each project that could not be indexed and summarize the changes.
+        for path, exc in result.errors.items():
+            csl.warn(f'Failed to index project "{path}": {exc}')
+        csl.log(f'{result.added} added, {result.updated} updated, {result.removed} removed, ' \
+                + f'{result.unchanged} unchanged.')
@@ -0,0 +1,477 @@
+"""
+compose.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Generates Docker Compose files from the modules of a stax project. Each module is rendered as one
+service fragment that is cached by a hash of everything it is rendered from, so regenerating after a
+change only renders the fragments of the modules that changed.
+"""
+
+from pathlib import Path
+from typing import Any
+import os
+import re
+import json
+import hashlib
+from json.encoder import encode_basestring_ascii
+import pywbu.filesystem as fs
+from pywbu.exc import MalformedDataException
+from stax.project import Project
+from stax.modules import MODULES_DIR_NAME
+from stax.records import ModuleRecord, format_date
+
+
+COMPOSE_FILE_NAME = 'docker-compose.yml'
+"""
+The name of the generated compose file in the project root and, when the output is split, in each
+module directory.
+"""
+
+SERVICE_FILE_NAME = 'compose.json'
+"""
+The name of the optional file in a module directory holding extra service properties (such as an
+image, ports, or environment variables) that are merged into the generated service.
+"""
+
+DOCKERFILE_NAME = 'Dockerfile'
+"""
+The name of the file whose presence in a module directory makes the directory the service's build
+context.
+"""
+
+CACHE_DIR_NAME = 'compose'
+"""
+The name of the directory in the project metadata directory that holds cached service fragments.
+"""
+
+FRAGMENT_VERSION = 1
+"""
+The version of the fragment rendering. Changing it invalidates every cached fragment.
+"""
+
+GENERATED_HEADER = '# Generated by stax from the project configuration. Edits will be overwritten.'
+"""
+The comment placed at the top of every generated compose file.
+"""
+
+# Matches the keys that can be written as plain YAML scalars without quoting.
+_PLAIN_KEY = re.compile(r'[A-Za-z_][A-Za-z0-9_.-]*')
+
+# Plain keys that YAML 1.1 parsers would read as something other than a string.
+_RESERVED_KEYS = ('y', 'n', 'yes', 'no', 'on', 'off', 'true', 'false', 'null')
+
+# Matches the characters that are not permitted in a compose service name.
+_SERVICE_UNSAFE = re.compile(r'[^a-z0-9_.-]+')
+
+
+class ComposeResult(object):
+    """
+    Summarizes a compose generation.
+    """
+
+    services: dict[str, str]
+    """
+    The name of the module of each generated service keyed by service name, in module order.
+    """
+
+    rendered: int
+    """
+    The number of service fragments rendered because no cached fragment matched.
+    """
+
+    cached: int
+    """
+    The number of service fragments reused from the cache.
+    """
+
+    undirected: int
+    """
+    The number of modules skipped because they have no module directory.
+    """
+
+    skipped: list[tuple[str, str]]
+    """
+    The name of each module with a module directory that produced no service and the reason why.
+    """
+
+    changed: list[Path]
+    """
+    The compose files whose content changed (or would change when checking).
+    """
+
+
+    def __init__(self) -> None:
+        """
+        Creates an empty result.
+        """
+
+        self.services = {}
+        self.rendered = 0
+        self.cached = 0
+        self.undirected = 0
+        self.skipped = []
+        self.changed = []
+
+
+def service_name(module_name: str) -> str:
+    """
+    Returns the compose service name of a module. Compose only permits lowercase letters, digits,
+    and the characters "_", ".", and "-" so any other run of characters is replaced with "-".
+    """
+
+    name = _SERVICE_UNSAFE.sub('-', module_name.lower()).strip('-._')
+    return name if name else 'module'
+
+
+def _yaml_scalar(value: Any) -> str:
+    """
+    Encodes a scalar as YAML. Strings are always double quoted with JSON escapes, which YAML reads
+    identically, so no string can be mistaken for another type.
+    """
+
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+
+    return json.dumps(value)
+
+
+def _yaml_key(key: str) -> str:
+    """
+    Encodes a mapping key as YAML, quoting it only when it would not be read back as the same
+    string.
+    """
+
+    if _PLAIN_KEY.fullmatch(key) and key.lower() not in _RESERVED_KEYS:
+        return key
+
+    return encode_basestring_ascii(key)
+
+
+def _yaml_lines(value: Any, level: int) -> list[str]:
+    """
+    Encodes a mapping or sequence as block style YAML lines at the given indentation level.
+    """
+
+    indent = '  ' * level
+    lines = []
+
+    # Encode each mapping entry, nesting non-empty containers on the following lines.
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list)) and item:
+                lines.append(f'{indent}{_yaml_key(str(key))}:')
+                lines += _yaml_lines(item, level + 1)
+            else:
+                lines.append(f'{indent}{_yaml_key(str(key))}: {_yaml_inline(item)}')
+
+    # Encode each sequence item. A nested container starts on the item's own line.
+    else:
+        for item in value:
+            if isinstance(item, (dict, list)) and item:
+                nested = _yaml_lines(item, level + 1)
+                nested[0] = f'{indent}- {nested[0][len(indent) + 2:]}'
+                lines += nested
+            else:
+                lines.append(f'{indent}- {_yaml_inline(item)}')
+
+    return lines
+
+
+def _yaml_inline(value: Any) -> str:
+    """
+    Encodes a scalar or an empty container on a single line.
+    """
+
+    if isinstance(value, dict):
+        return '{}'
+    if isinstance(value, list):
+        return '[]'
+
+    return _yaml_scalar(value)
+
+
+def _parse_service(service_bytes: bytes, source: Path) -> dict:
+    """
+    Parses the raw bytes of a service file into its object of extra service properties.
+    """
+
+    try:
+        extra = json.loads(service_bytes)
+    except ValueError as exc:
+        raise MalformedDataException(f'Malformed service file "{source}": {exc}.')
+
+    if not isinstance(extra, dict):
+        raise MalformedDataException(f'Malformed service file "{source}": expected an object.')
+
+    return extra
+
+
+def service_dependencies(module_dir: Path) -> list[str]:
+    """
+    Returns the names of the services the service of the module in the given directory depends on,
+    as declared by "depends_on" in its service file. Compose accepts either a list of service names
+    or an object keyed by service name.
+    """
+
+    # A module without a service file has no dependencies.
+    source = module_dir / SERVICE_FILE_NAME
+    try:
+        depends_on = _parse_service(source.read_bytes(), source).get('depends_on', [])
+    except FileNotFoundError:
+        return []
+
+    if isinstance(depends_on, dict):
+        return list(depends_on)
+    if isinstance(depends_on, list) and all(isinstance(name, str) for name in depends_on):
+        return depends_on
+
+    raise MalformedDataException(f'Malformed service file "{source}": expected "depends_on" to ' \
+                                 + 'be a list of service names or an object.')
+
+
+def is_split(path: Path) -> bool:
+    """
+    Determines whether the generated compose file at the given path includes per-module compose
+    files rather than holding the services itself.
+    """
+
+    try:
+        with open(path, 'r') as file:
+            return file.read(len(GENERATED_HEADER) + 9) == f'{GENERATED_HEADER}\ninclude:'
+    except FileNotFoundError:
+        return False
+
+
+def _relative(path: Path, start: Path) -> str:
+    """
+    Returns a path relative to a directory in the form compose expects, starting with "./" unless
+    it leaves the directory.
+    """
+
+    relative = Path(os.path.relpath(path, start)).as_posix()
+    return relative if relative.startswith('.') else f'./{relative}'
+
+
+class ComposeGenerator(object):
+    """
+    Generates the compose files of a project. Service fragments are cached in the project metadata
+    directory under the hash of their inputs: the module's configuration entry, the build context,
+    and the files in the module directory the service is rendered from.
+    """
+
+    project: Project
+    """
+    The project the compose files are generated for.
+    """
+
+    output: Path
+    """
+    The path of the top-level compose file.
+    """
+
+    split: bool
+    """
+    Whether each service is written to its own compose file in its module directory and included
+    by the top-level compose file.
+    """
+
+    cache_dir: Path
+    """
+    The canonical path to the directory of cached service fragments.
+    """
+
+
+    def __init__(self, project: Project, output: Path=None, split: bool=False) -> None:
+        """
+        Creates a generator for the given project. By default the top-level compose file is written
+        to the project root.
+        """
+
+        self.project = project
+        self.output = fs.canonical_path(output) if output else project.root / COMPOSE_FILE_NAME
+        self.split = split
+        self.cache_dir = project.meta_dir / CACHE_DIR_NAME
+
+
+    def __module_inputs(self, module_dir: Path) -> tuple[bool, bytes]:
+        """
+        Reads the files in a module directory a service is rendered from. Returns whether the
+        directory holds a Dockerfile and the raw bytes of its service file or None.
+        """
+
+        try:
+            service_bytes = (module_dir / SERVICE_FILE_NAME).read_bytes()
+        except FileNotFoundError:
+            service_bytes = None
+
+        return (module_dir / DOCKERFILE_NAME).is_file(), service_bytes
+
+
+    def __render(self,
+                 module: ModuleRecord,
+                 service: str,
+                 context: str,
+                 dockerfile: bool,
+                 service_bytes: bytes) -> str:
+        """
+        Renders the service fragment of a module as YAML nested under "services". Returns None if
+        the service would have neither a build context nor an image.
+        """
+
+        # Parse the extra service properties if the module has any.
+        extra = {}
+        if service_bytes is not None:
+            source = self.project.root / MODULES_DIR_NAME / module.name / SERVICE_FILE_NAME
+            extra = _parse_service(service_bytes, source)
+
+        # Build from the module directory if it has a Dockerfile.
+        body = {}
+        if dockerfile:
+            body['build'] = {'context': context}
+
+        # Label the service with its module so containers can be traced back to the project.
+        labels = {'stax.module': module.name, 'stax.created': format_date(module.creation_date)}
+        if module.desc:
+            labels['stax.desc'] = module.desc
+
+        # The extra properties override the generated ones, except that labels are merged.
+        if isinstance(extra.get('labels'), dict):
+            labels.update(extra['labels'])
+        body.update(extra)
+        body['labels'] = labels
+
+        # A service needs something to run.
+        if 'build' not in body and 'image' not in body:
+            return None
+
+        return '\n'.join(_yaml_lines({service: body}, 1)) + '\n'
+
+
+    def __fragment(self, module: ModuleRecord, service: str, context: str, check: bool,
+                   result: ComposeResult, used: set[str]) -> str:
+        """
+        Returns the service fragment of a module from the cache, rendering and caching it if no
+        cached fragment matches its inputs. When checking a rendered fragment is not cached. Returns
+        None if the module produces no service.
+        """
+
+        module_dir = self.project.root / MODULES_DIR_NAME / module.name
+        dockerfile, service_bytes = self.__module_inputs(module_dir)
+
+        # Hash every input the fragment is rendered from.
+        digest = hashlib.sha256(json.dumps(
+            [FRAGMENT_VERSION, service, context, module.to_dict(), dockerfile],
+            sort_keys=True).encode())
+        digest.update(service_bytes if service_bytes is not None else b'\0')
+        key = digest.hexdigest()
+        used.add(f'{key}.yml')
+
+        # Try to reuse the cached fragment.
+        cache_path = self.cache_dir / f'{key}.yml'
+        try:
+            fragment = cache_path.read_text()
+            result.cached += 1
+            return fragment if fragment else None
+        except FileNotFoundError:
+            pass
+
+        # Render the fragment and cache it unless checking. Modules without a service are cached as
+        # empty files.
+        fragment = self.__render(module, service, context, dockerfile, service_bytes)
+        result.rendered += 1
+        if not check:
+            with fs.atomic_open(cache_path) as file:
+                file.write(fragment or '')
+
+        return fragment
+
+
+    def __write(self, path: Path, content: str, check: bool, result: ComposeResult) -> None:
+        """
+        Writes the content to a file only if it differs from the current content. When checking
+        nothing is written and the file is only recorded as changed.
+        """
+
+        # Compare with the current content so unchanged files keep their modification times.
+        try:
+            if path.read_text() == content:
+                return
+        except FileNotFoundError:
+            pass
+
+        result.changed.append(path)
+
+        if not check:
+            with fs.atomic_open(path) as file:
+                file.write(content)
+
+
+    def generate(self, check: bool=False) -> ComposeResult:
+        """
+        Generates the compose files and writes those whose content changed. When checking nothing
+        is written and the result lists the files that are out of date.
+        """
+
+        # When checking the cache is only read, so its directory is not created.
+        result = ComposeResult()
+        if not check:
+            self.cache_dir.mkdir(511, False, True)
+
+        services = result.services
+        used = set()
+        includes = []
+        fragments = []
+
+        for module in self.project.modules():
+            module_dir = self.project.root / MODULES_DIR_NAME / module.name
+
+            # A module needs a directory of its own to hold its build context or service file.
+            if Path(module.name).name != module.name or not module_dir.is_dir():
+                result.undirected += 1
+                continue
+
+            # Service names must be unique after being made safe for compose.
+            service = service_name(module.name)
+            if service in services:
+                result.skipped.append((module.name, f'its service name "{service}" is already ' \
+                                       + f'used by module "{services[service]}"'))
+                continue
+
+            # Split files live in the module directory so their build context is that directory.
+            context = '.' if self.split else _relative(module_dir, self.output.parent)
+            fragment = self.__fragment(module, service, context, check, result, used)
+
+            if fragment is None:
+                result.skipped.append((module.name, f'it has neither a {DOCKERFILE_NAME} nor ' \
+                                       + f'an image in its {SERVICE_FILE_NAME}'))
+                continue
+
+            services[service] = module.name
+
+            # Write each split service file or collect the fragment for the single file.
+            if self.split:
+                module_file = module_dir / COMPOSE_FILE_NAME
+                self.__write(module_file, f'{GENERATED_HEADER}\nservices:\n{fragment}', check,
+                             result)
+                includes.append(f'  - {_yaml_scalar(_relative(module_file, self.output.parent))}')
+            else:
+                fragments.append(fragment)
+
+        # Assemble the top-level compose file from the fragments or the includes.
+        if self.split:
+            body = 'include:\n' + '\n'.join(includes) + '\n' if includes else 'include: []\n'
+        else:
+            body = 'services:\n' + ''.join(fragments) if fragments else 'services: {}\n'
+        self.__write(self.output, f'{GENERATED_HEADER}\n{body}', check, result)
+
+        # Remove cached fragments that no module uses anymore.
+        if not check:
+            for item in self.cache_dir.iterdir():
+                if item.name not in used:
+                    item.unlink(True)
+
+        return result
@@ -4,27 +4,34 @@ config.py
 Type:       Python Script
 Author:     Will Brandon
 Created:    July 6, 2023
-Revised:    July 14, 2023
+Revised:    October 19, 2026
 
 Provides a class that produces objects to manage a stax project configuration file.
 """
 
 from pathlib import Path
+from typing import Iterator, Iterable
 from uuid import UUID
 from datetime import date
 import json
 import pywbu.filesystem as fs
+from stax.records import ModuleRecord, ProjectRecord
+from stax.schema import validate_header, validate_model, validate_module, load_record
+from stax.storage import JSON_INDENT, StorageBackend, FileBackend, transfer
+from stax.encoder import write_model
+from stax.shards import ShardedBackend
+from stax.sqlite import SqliteBackend
 
 
-DATE_FORMAT = '%Y-%m-%d'
+VALIDATION_FILE_NAME = 'validated.json'
 """
-The format used to store dates in the configuration file.
+The name of the file, stored alongside the configuration file, that records the modification time
+and size of the configuration file when it was last validated.
 """
 
-JSON_INDENT = 2
+STORAGE_LAYOUTS = ('file', 'sharded', 'sqlite')
 """
-The level of indent to use for formatting JSON. A value of None will not format the JSON at all. A
-value of 0 will insert newlines but no indentation.
+The names of the supported module storage layouts.
 """
 
 
@@ -38,6 +45,24 @@ class Config(object):
     The canonical path to the configuration file.
     """
 
+    file: FileBackend
+    """
+    The backend that reads and writes the configuration file. It holds the project properties in
+    every layout and the modules in the default layout.
+    """
+
+    backends: dict[str, StorageBackend]
+    """
+    The module storage backend of each layout keyed by layout name. The backends are kept in the
+    configuration file's directory.
+    """
+
+    validation_path: Path
+    """
+    The canonical path to the file recording the state of the configuration file when it was last
+    validated.
+    """
+
 
     def __init__(self, path: Path) -> None:
         """
@@ -51,74 +76,202 @@ class Config(object):
         # Initialize the path property with the canonical version of the path.
         self.path = fs.canonical_path(path)
 
+        # The storage backends and validation record are kept beside the configuration file.
+        self.file = FileBackend(self.path)
+        self.backends = {
+            'file': self.file,
+            'sharded': ShardedBackend(self.path.parent),
+            'sqlite': SqliteBackend(self.path.parent)
+        }
+        self.validation_path = self.path.parent / VALIDATION_FILE_NAME
+
 
-    def __model_template(
-            self,
-            uuid: UUID,
-            name: str,
-            creation_date: date,
-            author: str=None,
-            desc: str=None) -> dict:
+    def __read(self) -> dict:
         """
-        Returns a dictionary object representing the start of a configuration model. A project UUID,
-        name, and creation date, optional author, and optional description will be placed in the model.
+        Reads the configuration file into a configuration model object.
         """
 
-        return {
-            "uuid": str(uuid),
-            "name": name,
-            "creation_date": date.strftime(creation_date, DATE_FORMAT),
-            "author": author,
-            "desc": desc,
-            "modules": []
-        }
+        return self.file.read()
 
 
-    def __module_template(self, name: str, creation_date: date, desc: str=None) -> dict:
+    def __write(self, model: dict) -> None:
         """
-        Returns a dictionary object representing a module a configuration model. A module name,
-        creation date, and optional description will be placed in the model.
+        Writes a model dictionary object to the configuration file. The file must already exist.
         """
+    
+        self.file.write(model)
+    
 
-        return {
-            "name": name,
-            "creation_date": date.strftime(creation_date, DATE_FORMAT),
-            "desc": desc
-        }
+    def backend(self) -> StorageBackend:
+        """
+        Returns the backend that currently stores the modules. An SQLite database takes precedence
+        over shards, which take precedence over the configuration file.
+        """
 
+        # Check for the data of each optional backend in order of precedence.
+        for layout in ('sqlite', 'sharded'):
+            if self.backends[layout].exists():
+                return self.backends[layout]
 
-    def __read(self) -> dict:
+        return self.file
+
+
+    def layout(self) -> str:
         """
-        Reads the configuration file into a configuration model object.
+        Returns the name of the layout that currently stores the modules.
         """
 
-        # Open the configuration file for reading in an auto-closeable block.
-        with open(self.path, 'r') as file:
+        return self.backend().layout
 
-            # Read the model object from the JSON in the configuration file.
-            return json.load(file)
 
+    def model(self) -> dict:
+        """
+        Returns the model dictionary object. The model is validated unless the configuration is
+        unchanged since its last validation.
+        """
 
-    def __write(self, model: dict) -> None:
+        # Capture the stamp before reading so a concurrent rewrite is never recorded as validated.
+        stamp = self.stamp()
+        model = self.__read()
+
+        # Validate the model read from the configuration file if it may have changed.
+        backend = self.backend()
+        if not self.validated(stamp):
+            if backend is self.file:
+                validate_model(model, self.path)
+            else:
+                validate_header(model, self.path)
+            self.__record_validation(stamp)
+
+        # If the modules are stored elsewhere, fill in the modules list from their backend. Their
+        # backends validate each module as it is read.
+        if backend is not self.file:
+            model['modules'] = [module.to_dict() for module in backend.iter()]
+
+        return model
+
+
+    def stamp(self) -> list[int]:
         """
-        Writes a model dictionary object to the configuration file. The file must already exist.
+        Returns the modification time in nanoseconds and size of the configuration file followed by
+        the stamp of the module backend if the modules are stored elsewhere. The stamp changes
+        whenever the configuration file or any module is rewritten.
         """
-    
-        # Open the configuration file for writing in an auto-closeable block.
-        with self.path.open('w') as file:
 
-            # Write the model object as JSON into the configuration file.
-            json.dump(model, file, indent=JSON_INDENT)
-    
+        # Start with the configuration file stamp.
+        stamp = self.file.stamp()
 
-    def model(self) -> dict:
+        # Include the backend stamp when the modules are stored elsewhere.
+        backend = self.backend()
+        if backend is not self.file:
+            stamp += backend.stamp()
+
+        return stamp
+
+
+    def validated(self, stamp: list[int]=None) -> bool:
         """
-        Returns the model dictionary object.
+        Determines whether the configuration is unchanged since it was last validated. A stamp
+        captured earlier may be given to compare instead of the current stamp.
         """
+
+        # Try to read the recorded stamp and compare it with the current stamp.
+        try:
+            with open(self.validation_path, 'r') as file:
+                return json.load(file) == (stamp if stamp is not None else self.stamp())
         
-        return self.__read()
+        # A missing or unreadable record means the file must be validated again.
+        except (OSError, ValueError):
+            return False
+
+
+    def __record_validation(self, stamp: list[int]) -> None:
+        """
+        Records the given stamp as the state of the configuration when it was last validated. The
+        record is only an optimization so failing to write it is ignored.
+        """
+
+        try:
+            with fs.atomic_open(self.validation_path) as file:
+                json.dump(stamp, file)
+        except OSError:
+            pass
+
+
+    def validate(self) -> None:
+        """
+        Validates the configuration against the schema and records its stamp so later calls to
+        validated succeed until the configuration changes. Raises a malformed data exception naming
+        the first invalid value if the configuration is malformed.
+        """
+
+        # Capture the stamp before reading so a concurrent rewrite is never recorded as validated.
+        stamp = self.stamp()
+
+        # Validating the whole record checks the configuration file and every stored module.
+        self.record()
+        self.__record_validation(stamp)
+
+
+    def record(self) -> ProjectRecord:
+        """
+        Returns the model as a compact project record with parsed dates and module records. Modules
+        in the configuration file are validated as they are converted and modules stored elsewhere
+        are validated by their backend as they are read. Raises a malformed data exception if the
+        configuration is malformed.
+        """
+
+        # Validate and convert the configuration file in a single pass.
+        record = load_record(self.__read(), self.path)
+
+        # If the modules are stored elsewhere, fill in the module records from their backend.
+        backend = self.backend()
+        if backend is not self.file:
+            record.modules = list(backend.iter())
+
+        return record
+
+
+    def iter_modules(self) -> Iterator[ModuleRecord]:
+        """
+        Streams the module records one at a time without loading the whole model into memory.
+        """
+
+        return self.backend().iter()
+
+
+    def module(self, name: str) -> ModuleRecord:
+        """
+        Returns the record of the module with the given name or None if no such module exists.
+        """
+
+        return self.backend().get(name)
+
+
+    def convert(self, layout: str) -> int:
+        """
+        Converts the configuration to the given module storage layout. The modules are exported
+        from the current backend and imported into the target backend before the current backend's
+        data is removed, so the modules are never lost. Returns the number of modules converted.
+        """
+
+        # Ensure the layout is recognized.
+        if layout not in self.backends:
+            raise ValueError(f'Unknown storage layout "{layout}". Expected one of ' \
+                             + f'{", ".join(STORAGE_LAYOUTS)}.')
+
+        # Nothing needs to be done if the modules are already stored in the layout.
+        source, target = self.backend(), self.backends[layout]
+        if source is target:
+            return 0
+
+        # Import the modules into the target then remove them from the source.
+        count = transfer(source, target)
+        source.destroy()
+
+        return count
+
 
-    
     def reset(self,
               uuid: UUID,
               name: str,
@@ -129,47 +282,78 @@ class Config(object):
         Resets the configuration file content to a new model object with the given properties.
         """
 
-        # Create a template data model object to insert into the configuration file.
-        model = self.__model_template(uuid, name, creation_date, author, desc)
+        # Create a record for the new model to insert into the configuration file.
+        record = ProjectRecord(uuid, name, creation_date, author, desc)
+
+        # A reset model has no modules so any modules stored elsewhere are removed.
+        for layout in ('sqlite', 'sharded'):
+            self.backends[layout].destroy()
 
         # Write the model to the configuration file at the given path.
-        self.__write(model)
+        self.__write(record.to_dict())
     
 
-    def set_module(self, name: str, creation_date: str, desc: str=None) -> bool:
+    def set_module(self, name: str, creation_date: date, desc: str=None) -> bool:
         """
         Sets the given module data in the configuration file. If a module with the given name
         already exists the properties of that module are updated and true is returned.
         """
 
-        # Create a model for a module.
-        module_model = self.__module_template(name, creation_date, desc)
+        # Delegate to the record setter with a new module record.
+        return self.set_module_record(ModuleRecord(name, creation_date, desc))
 
-        # Read the current model.
-        model = self.__read()
 
-        # Check to see if a module with the given name already exists and keep track of its index
-        # within the modules list in the model.
-        for i, module in enumerate(model['modules']):
-        
-            # If a module with the given name already exists, modify the entry.
-            if module['name'] == name:
-                
-                # Set the module model at the given index to the new updated model.
-                model['modules'][i] = module_model
+    def set_module_record(self, module: ModuleRecord) -> bool:
+        """
+        Sets the given module record in the configuration file. If a module with the same name
+        already exists the properties of that module are updated and true is returned. Only the
+        given module is validated, so a configuration that was valid before the change remains
+        recorded as valid afterwards without checking the other modules again.
+        """
+
+        # Validate the changed module before anything is written.
+        validate_module(module.to_dict(), f'modules[{module.name!r}]', self.path)
 
-                # Write the model to the configuration file and return true indicating that the
-                # module already exists and was updated.
-                self.__write(model)
-                return True
+        # Determine whether the rest of the configuration was valid before the change.
+        was_valid = self.validated()
 
-        # Create the new module model in the new updated model.
-        model['modules'].append(module_model)
+        # Delegate to the backend that currently stores the modules.
+        existed = self.backend().set(module)
 
-        # Write the model to the configuration file and return false indicating that the module did
-        # not already exist and was created.
-        self.__write(model)
-        return False
+        # Carry the validation forward to the new state of the configuration.
+        if was_valid:
+            self.__record_validation(self.stamp())
+
+        return existed
+
+
+    def set_modules(self, modules: Iterable[ModuleRecord]) -> int:
+        """
+        Sets every given module record with a single write to the backend that stores the modules
+        instead of one write per module. Every module is validated before anything is written and
+        the names must be distinct. Returns the number of modules that already existed.
+        """
+
+        # Validate each module and ensure no name is repeated before anything is written.
+        modules = list(modules)
+        names = set()
+        for module in modules:
+            validate_module(module.to_dict(), f'modules[{module.name!r}]', self.path)
+            if module.name in names:
+                raise ValueError(f'Module "{module.name}" is given more than once.')
+            names.add(module.name)
+
+        # Determine whether the rest of the configuration was valid before the change.
+        was_valid = self.validated()
+
+        # Commit the whole batch to the backend that currently stores the modules.
+        existed = self.backend().set_many(modules)
+
+        # Carry the validation forward to the new state of the configuration.
+        if was_valid:
+            self.__record_validation(self.stamp())
+
+        return existed
 
 
 def create_config(
@@ -178,24 +362,26 @@ def create_config(
         name: str,
         creation_date: date,
         author: str=None,
-        desc: str=None) -> Config:
+        desc: str=None,
+        modules: Iterable[ModuleRecord]=()) -> Config:
     """
     Creates a new configuration file at the given path. The given project UUID, name, creation date,
-    optional author, and optional description will be placed in the JSON model. A configuration
-    manager object is returned.
+    optional author, optional description, and initial modules will be placed in the JSON model. The
+    file is written once. A configuration manager object is returned.
     """
 
     # If the configuration file already exists raise an exception.
     if path.is_file():
         raise FileExistsError(f'Failed to create configuration file at "{path}" because the file ' \
                               + 'already exists.')
-    
-    # Create the configuration file with the proper permissions.
-    path.touch(438, False)
 
-    # Create a configuration manager object and use it to reset the content to new starting content.
-    config = Config(path)
-    config.reset(uuid, name, creation_date, author, desc)
+    # Create a record for the new model to insert into the configuration file.
+    record = ProjectRecord(uuid, name, creation_date, author, desc)
+
+    # Create the configuration file with the proper permissions and write the model in one pass.
+    # Exclusive creation ensures a file created concurrently is never overwritten.
+    with open(path, 'x') as file:
+        write_model(file, record.header_dict(), modules)
 
-    # Return the configuration manager object.
-    return config
+    # Return a configuration manager object for the new file.
+    return Config(path)
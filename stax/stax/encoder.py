@@ -0,0 +1,113 @@
+"""
+encoder.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Provides a streaming JSON encoder for stax project configuration models. The output is byte-for-byte
+identical to json.dump with an indent of 2 but modules are encoded one at a time from an iterator so
+memory use does not depend on the number of modules.
+"""
+
+from typing import Iterator, Iterable, IO, Any
+import json
+from json.encoder import encode_basestring_ascii
+from stax.records import ModuleRecord
+
+
+JSON_INDENT = 2
+"""
+The level of indent the encoder reproduces. This matches the indent of the configuration file.
+"""
+
+SCALAR_TYPES = (str, int, float, bool, type(None))
+"""
+The types that are encoded as a single JSON token.
+"""
+
+
+def _encode_scalar(value: Any) -> str:
+    """
+    Encodes a single scalar value exactly as json.dumps does. Strings and the JSON literals are
+    encoded directly, bypassing the per-call setup of json.dumps.
+    """
+
+    # Strings are encoded with the same (C accelerated) function json.dumps uses.
+    if value.__class__ is str:
+        return encode_basestring_ascii(value)
+
+    # The JSON literals have fixed encodings.
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+
+    # Numbers and subclasses of the scalar types use the standard encoder.
+    return json.dumps(value)
+
+
+def encode_value(value: Any, level: int) -> str:
+    """
+    Encodes a value as it would appear nested at the given indentation level in the output of
+    json.dumps with the configured indent. Flat objects, the shape of every module, are encoded
+    directly from their scalar tokens which avoids the slower pure-Python indenting encoder.
+    """
+
+    # Scalars are encoded as a single token.
+    if isinstance(value, SCALAR_TYPES):
+        return _encode_scalar(value)
+
+    # Flat objects are assembled from their encoded keys and scalar values.
+    if isinstance(value, dict) and value \
+            and all(isinstance(key, str) and isinstance(item, SCALAR_TYPES)
+                    for key, item in value.items()):
+        inner = '\n' + ' ' * ((level + 1) * JSON_INDENT)
+        outer = '\n' + ' ' * (level * JSON_INDENT)
+        items = f',{inner}'.join(f'{_encode_scalar(key)}: {_encode_scalar(item)}'
+                                 for key, item in value.items())
+        return f'{{{inner}{items}{outer}}}'
+
+    # Anything else is encoded by the standard encoder and shifted to the nesting level.
+    return json.dumps(value, indent=JSON_INDENT).replace('\n', '\n' + ' ' * (level * JSON_INDENT))
+
+
+def iter_encode_model(header: dict, modules: Iterable[Any]) -> Iterator[str]:
+    """
+    Encodes a configuration model as a sequence of text chunks. The header properties are encoded
+    first followed by a "modules" list encoded one module at a time. Modules may be module records
+    or dictionaries in the configuration file JSON schema.
+    """
+
+    # Open the top-level object and encode each header property.
+    yield '{'
+    first = True
+    for key, value in header.items():
+        yield f'{"" if first else ","}\n  {_encode_scalar(str(key))}: {encode_value(value, 1)}'
+        first = False
+
+    # Open the modules list.
+    yield f'{"" if first else ","}\n  "modules": ['
+
+    # Encode each module as it is drawn from the iterator.
+    empty = True
+    for module in modules:
+        if isinstance(module, ModuleRecord):
+            module = module.to_dict()
+        yield f'{"" if empty else ","}\n    {encode_value(module, 2)}'
+        empty = False
+
+    # Close the modules list and the top-level object. An empty list stays on one line.
+    yield ']\n}' if empty else '\n  ]\n}'
+
+
+def write_model(file: IO, header: dict, modules: Iterable[Any]) -> None:
+    """
+    Writes a configuration model to an open text file with the streaming encoder.
+    """
+
+    for chunk in iter_encode_model(header, modules):
+        file.write(chunk)
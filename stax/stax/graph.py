@@ -0,0 +1,332 @@
+"""
+graph.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Provides the dependency graph of the modules of a stax project and a scheduler that runs a task for
+each module in topological waves over a pool of threads or processes.
+"""
+
+from typing import Any, Callable, Iterable, Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from time import perf_counter
+from stax.records import ModuleRecord
+
+
+def find_cycle(prerequisites: Mapping[str, Iterable[str]]) -> list[str]:
+    """
+    Finds a cycle in a graph given the prerequisites of each node. Returns the nodes of the cycle in
+    order with the first node repeated at the end, or None if the graph is acyclic. Prerequisites
+    that are not nodes of the graph are ignored.
+    """
+
+    # Depth-first search from every node, tracking the nodes on the current path. The search is
+    # iterative so long dependency chains cannot exceed the recursion limit.
+    done = set()
+    for root in prerequisites:
+        if root in done:
+            continue
+
+        path = [root]
+        on_path = {root}
+        stack = [iter(prerequisites[root])]
+
+        while stack:
+            for node in stack[-1]:
+                if node not in prerequisites or node in done:
+                    continue
+
+                # Reaching a node on the current path closes a cycle.
+                if node in on_path:
+                    return path[path.index(node):] + [node]
+
+                path.append(node)
+                on_path.add(node)
+                stack.append(iter(prerequisites[node]))
+                break
+
+            # Every prerequisite of the deepest node has been searched.
+            else:
+                stack.pop()
+                on_path.discard(path[-1])
+                done.add(path.pop())
+
+    return None
+
+
+def check_acyclic(prerequisites: Mapping[str, Iterable[str]]) -> None:
+    """
+    Raises an exception describing a cycle if the graph given by the prerequisites of each node
+    contains one.
+    """
+
+    cycle = find_cycle(prerequisites)
+
+    if cycle:
+        raise ValueError(f'Dependency cycle: {" -> ".join(cycle)}.')
+
+
+class ModuleGraph(object):
+    """
+    Represents the dependencies between the modules of a project. Modules are kept in configuration
+    order, which is also the order of modules within each wave.
+    """
+
+    depends_on: dict[str, tuple[str]]
+    """
+    The names of the modules each module depends on keyed by module name.
+    """
+
+    dependents: dict[str, list[str]]
+    """
+    The names of the modules that depend on each module keyed by module name.
+    """
+
+
+    def __init__(self, depends_on: Mapping[str, Iterable[str]]) -> None:
+        """
+        Creates a graph given the names of the modules each module depends on. Raises an exception
+        if a module depends on a module that does not exist or if the dependencies contain a cycle.
+        """
+
+        self.depends_on = {name: tuple(names) for name, names in depends_on.items()}
+        self.dependents = {name: [] for name in self.depends_on}
+
+        # Link each module to its dependencies, which must exist.
+        for name, depends_on in self.depends_on.items():
+            for dependency in depends_on:
+                if dependency not in self.depends_on:
+                    raise ValueError(f'Module "{name}" depends on "{dependency}" which does not ' \
+                                     + 'exist.')
+                self.dependents[dependency].append(name)
+
+        check_acyclic(self.depends_on)
+
+
+    @classmethod
+    def from_modules(cls, modules: Iterable[ModuleRecord]) -> 'ModuleGraph':
+        """
+        Creates the graph of the given module records.
+        """
+
+        return cls({module.name: module.depends_on for module in modules})
+
+
+    def __len__(self) -> int:
+        """
+        Returns the number of modules in the graph.
+        """
+
+        return len(self.depends_on)
+
+
+    def __closure(self, names: Iterable[str], edges: dict[str, Iterable[str]]) -> list[str]:
+        """
+        Returns the given modules and every module reachable from them along the given edges, in
+        configuration order.
+        """
+
+        # Ensure every starting module exists.
+        stack = list(names)
+        for name in stack:
+            if name not in self.depends_on:
+                raise ValueError(f'No module named "{name}" exists.')
+
+        reached = set(stack)
+        while stack:
+            for other in edges[stack.pop()]:
+                if other not in reached:
+                    reached.add(other)
+                    stack.append(other)
+
+        return [name for name in self.depends_on if name in reached]
+
+
+    def upstream(self, names: Iterable[str]) -> list[str]:
+        """
+        Returns the given modules and every module they transitively depend on.
+        """
+
+        return self.__closure(names, self.depends_on)
+
+
+    def downstream(self, names: Iterable[str]) -> list[str]:
+        """
+        Returns the given modules and every module that transitively depends on them. These are the
+        modules that must be run again when the given modules change.
+        """
+
+        return self.__closure(names, self.dependents)
+
+
+    def waves(self, names: Iterable[str]=None) -> list[list[str]]:
+        """
+        Groups the modules into waves so every module is in a later wave than each module it depends
+        on. The modules of a wave can run concurrently. If names are given only those modules are
+        grouped and dependencies on other modules are ignored.
+        """
+
+        selected = set(self.depends_on if names is None else names)
+        order = {name: index for index, name in enumerate(self.depends_on)}
+
+        # Count the unfinished dependencies of each selected module.
+        remaining = {name: sum(dependency in selected for dependency in self.depends_on[name])
+                     for name in self.depends_on if name in selected}
+
+        # Peel off the modules without unfinished dependencies one wave at a time.
+        waves = []
+        wave = [name for name, count in remaining.items() if not count]
+        while wave:
+            waves.append(wave)
+            following = []
+            for name in wave:
+                for dependent in self.dependents[name]:
+                    if dependent in remaining:
+                        remaining[dependent] -= 1
+                        if not remaining[dependent]:
+                            following.append(dependent)
+
+            # Keep configuration order within the next wave.
+            wave = sorted(following, key=order.get)
+
+        return waves
+
+
+    def critical_path(self, durations: Mapping[str, float]=None) -> tuple[list[str], float]:
+        """
+        Returns the chain of dependent modules with the greatest total duration and that duration.
+        No schedule can finish faster than this chain. If no durations are given every module counts
+        as one unit. Otherwise only the modules with a duration are considered.
+        """
+
+        # Only consider the modules with a duration when durations are given.
+        names = list(self.depends_on) if durations is None else \
+            [name for name in self.depends_on if name in durations]
+        weight = (lambda name: 1.0) if durations is None else (lambda name: durations[name])
+
+        # Find the longest chain ending at each module in dependency order.
+        best: dict[str, float] = {}
+        previous: dict[str, str] = {}
+        for wave in self.waves(names):
+            for name in wave:
+                before = max((dependency for dependency in self.depends_on[name]
+                              if dependency in best),
+                             key=best.get, default=None)
+                best[name] = weight(name) + (best[before] if before else 0.0)
+                previous[name] = before
+
+        if not best:
+            return [], 0.0
+
+        # Walk back from the module where the longest chain ends.
+        name = max(best, key=best.get)
+        total = best[name]
+        path = []
+        while name:
+            path.append(name)
+            name = previous[name]
+
+        return path[::-1], total
+
+
+class WaveResult(object):
+    """
+    Summarizes a run of the wave scheduler.
+    """
+
+    results: dict[str, Any]
+    """
+    The return value of the task of each module that succeeded keyed by module name.
+    """
+
+    errors: dict[str, BaseException]
+    """
+    The exception raised by the task of each module that failed keyed by module name.
+    """
+
+    skipped: list[str]
+    """
+    The modules that were not run because a module they depend on failed.
+    """
+
+    durations: dict[str, float]
+    """
+    The number of seconds the task of each module that ran took, keyed by module name.
+    """
+
+    waves: list[list[str]]
+    """
+    The waves the modules were run in.
+    """
+
+
+    def __init__(self, waves: list[list[str]]) -> None:
+        """
+        Creates an empty result for the given waves.
+        """
+
+        self.results = {}
+        self.errors = {}
+        self.skipped = []
+        self.durations = {}
+        self.waves = waves
+
+
+def _timed(task: Callable[[str], Any], name: str) -> tuple[Any, float]:
+    """
+    Calls a task for a module and returns its result and the number of seconds it took. Defined at
+    the module level so it can be sent to a process pool.
+    """
+
+    start = perf_counter()
+    result = task(name)
+    return result, perf_counter() - start
+
+
+def run_waves(graph: ModuleGraph,
+              task: Callable[[str], Any],
+              names: Iterable[str]=None,
+              jobs: int=None,
+              processes: bool=False,
+              fail_fast: bool=False) -> WaveResult:
+    """
+    Calls the task with the name of each module (or each given module) in topological waves. The
+    modules of a wave run concurrently over a pool of threads, or of processes if requested (in
+    which case the task must be picklable), and each wave starts once the previous one finishes.
+    Modules that depend on a failed module are skipped. When failing fast no further wave starts
+    after a failure.
+    """
+
+    result = WaveResult(graph.waves(names))
+    failed = set()
+
+    pool: Executor = ProcessPoolExecutor(jobs) if processes else ThreadPoolExecutor(jobs)
+    with pool:
+        for wave in result.waves:
+
+            # Stop before the next wave if failing fast.
+            if failed and fail_fast:
+                result.skipped += wave
+                continue
+
+            # Skip the modules that depend on a failed module and submit the rest.
+            futures = {}
+            for name in wave:
+                if any(dependency in failed for dependency in graph.depends_on[name]):
+                    failed.add(name)
+                    result.skipped.append(name)
+                else:
+                    futures[name] = pool.submit(_timed, task, name)
+
+            # Wait for the whole wave, recording each outcome.
+            for name, future in futures.items():
+                try:
+                    result.results[name], result.durations[name] = future.result()
+                except Exception as exc:
+                    result.errors[name] = exc
+                    failed.add(name)
+
+    return result
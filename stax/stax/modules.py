@@ -4,13 +4,25 @@ modules.py
 Type:       Python Script
 Author:     Will Brandon
 Created:    July 6, 2023
-Revised:    July 14, 2023
+Revised:    October 19, 2026
 
 Manages stax project web modules.
 """
 
 from pathlib import Path
-import config as cfg
+from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+import os
+import json
+import shutil as shu
+import pywbu.filesystem as fs
+from pywbu.exc import MalformedDataException
+import stax.config as cfg
+import stax.project as proj
+from stax.records import DATE_FORMAT, ModuleRecord
+from stax.schema import load_module
+from stax.graph import ModuleGraph
 
 
 MODULES_DIR_NAME = 'modules'
@@ -18,6 +30,11 @@ MODULES_DIR_NAME = 'modules'
 The name of the directory that holds the module configurations.
 """
 
+DEFAULT_CREATE_JOBS = 8
+"""
+The default number of module directories scaffolded at once when creating modules in bulk.
+"""
+
 
 def modules(root: Path):
     return cfg.read_in_proj(root)['modules']
@@ -55,6 +72,179 @@ def init(root: Path) -> bool:
     
 
 
-def create(root: Path, name: str) -> None:
-    pass
+def check_module_name(name: str) -> None:
+    """
+    Ensures a module name can be used as the name of its directory in the modules directory.
+    """
+
+    if not name or name.startswith('.') or '/' in name or (os.altsep and os.altsep in name) \
+            or os.sep in name:
+        raise ValueError(f'Invalid module name "{name}". Module names cannot be blank, start ' \
+                         + 'with a dot, or contain path separators.')
+
+
+def expand_pattern(pattern: str, count: int, start: int=1) -> list[str]:
+    """
+    Expands a module name pattern into the given number of names. The pattern holds an "{n}" field,
+    optionally with a format specification such as "{n:03}", which is replaced by consecutive
+    numbers beginning at the start number.
+    """
+
+    # Ensure the pattern numbers the names so they are distinct.
+    if '{n' not in pattern:
+        raise ValueError(f'Invalid name pattern "{pattern}". Patterns must contain an "{{n}}" ' \
+                         + 'field such as "web-{n:03}".')
+    if count < 0:
+        raise ValueError(f'The number of modules cannot be negative but {count} was given.')
+
+    # Format each name, reporting a malformed pattern as a single error.
+    try:
+        return [pattern.format(n=n) for n in range(start, start + count)]
+    except (KeyError, IndexError, ValueError) as exc:
+        raise ValueError(f'Invalid name pattern "{pattern}": {exc}.')
+
+
+def read_manifest(path: Path, creation_date: date=None) -> list[ModuleRecord]:
+    """
+    Reads a module manifest, a JSON list whose items are module names or module objects with a
+    "name" and optional "creation_date", "desc", and "depends_on" properties. Modules without a
+    creation date are created on the given date (today by default).
+    """
+
+    # Read the manifest.
+    try:
+        with open(path, 'r') as file:
+            data = json.load(file)
+    except ValueError as exc:
+        raise MalformedDataException(f'Malformed module manifest "{path}": {exc}.')
+
+    if not isinstance(data, list):
+        raise MalformedDataException(f'Malformed module manifest "{path}": expected a list.')
+
+    # Fill in the defaults of each item and validate it as a module object.
+    default_date = (creation_date or date.today()).strftime(DATE_FORMAT)
+    records = []
+    for index, item in enumerate(data):
+        item = {'name': item} if isinstance(item, str) else item
+        if isinstance(item, dict):
+            item = {'creation_date': default_date, **item}
+        records.append(load_module(item, f'modules[{index}]', path))
+
+    return records
+
+
+def clone_tree(template: Path, target: Path) -> dict[str, int]:
+    """
+    Recreates the template directory tree at the target, which must not exist. Files are cloned
+    with copy-on-write or an in-kernel copy where the filesystem supports it. They are never hard
+    linked since each module's files are edited independently. Symbolic links are recreated as
+    links. Returns the number of files cloned by each method.
+    """
+
+    methods = {}
+    target.mkdir(511, False, False)
+
+    # Walk the template, recreating each directory before the files within it.
+    for dir_path, dir_names, file_names in os.walk(template):
+        source_dir = Path(dir_path)
+        target_dir = target / source_dir.relative_to(template)
+
+        for name in dir_names + file_names:
+            source = source_dir / name
+            if source.is_symlink():
+                os.symlink(os.readlink(source), target_dir / name)
+            elif source.is_dir():
+                (target_dir / name).mkdir(511, False, False)
+            else:
+                method = fs.clone_file(source, target_dir / name, False)
+                methods[method] = methods.get(method, 0) + 1
+
+    return methods
+
+
+def create(root: Path,
+           modules: Iterable[ModuleRecord],
+           template: Path=None,
+           jobs: int=DEFAULT_CREATE_JOBS) -> dict[str, int]:
+    """
+    Creates the given modules in the project at the given root. A directory is scaffolded for each
+    module, as a clone of the template directory if one is given, over a pool of threads. Every
+    module is then registered with a single configuration write. Nothing is created unless every
+    module is new and the dependencies remain valid, and the directories are removed again if any
+    step fails. Returns the number of template files cloned by each method.
+    """
+
+    modules = list(modules)
+    config = proj.open_project(root).config()
+    modules_dir = fs.canonical_path(root) / MODULES_DIR_NAME
+
+    # Ensure every module is new and every name is usable as a directory name.
+    existing = list(config.iter_modules())
+    names = {module.name for module in existing}
+    for module in modules:
+        check_module_name(module.name)
+        if module.name in names:
+            raise FileExistsError(f'Module "{module.name}" already exists.')
+        if (modules_dir / module.name).exists():
+            raise FileExistsError(f'Failed to create module "{module.name}" because ' \
+                                  + f'"{modules_dir / module.name}" already exists.')
+        names.add(module.name)
+
+    # Ensure the dependencies of the new modules exist and do not form a cycle.
+    ModuleGraph.from_modules(existing + modules)
+
+    # Ensure the template is a directory.
+    if template is not None:
+        template = fs.canonical_path(template)
+        if not template.is_dir():
+            raise NotADirectoryError(f'The module template "{template}" is not a directory.')
+
+    # If the intended path for the modules directory points to a file instead raise an exception.
+    if modules_dir.is_file():
+        raise FileExistsError(f'Failed to create modules at "{root}" because the ' \
+                              + f'"{MODULES_DIR_NAME}" item already exists and is a file instead ' \
+                              + 'of a directory.')
+    modules_dir.mkdir(511, False, True)
+
+    def scaffold(module: ModuleRecord) -> dict[str, int]:
+        """
+        Creates the directory of a module, removing it again if cloning the template fails.
+        """
+
+        target = modules_dir / module.name
+        if template is None:
+            target.mkdir(511, False, False)
+            return {}
+
+        try:
+            return clone_tree(template, target)
+        except BaseException:
+            if target.is_dir():
+                shu.rmtree(target, True)
+            raise
+
+    # Scaffold the directories concurrently, collecting the outcome of every module so the
+    # directories that were created can be removed if any failed.
+    created, errors, methods = [], [], {}
+    with ThreadPoolExecutor(jobs) as pool:
+        futures = [(module, pool.submit(scaffold, module)) for module in modules]
+        for module, future in futures:
+            try:
+                for method, count in future.result().items():
+                    methods[method] = methods.get(method, 0) + count
+                created.append(modules_dir / module.name)
+            except Exception as exc:
+                errors.append(exc)
+
+    # Register every module with one configuration write, or undo the scaffolding on failure.
+    try:
+        if errors:
+            raise errors[0]
+        config.set_modules(modules)
+    except BaseException:
+        for path in created:
+            shu.rmtree(path, True)
+        raise
+
+    return methods
 
@@ -0,0 +1,352 @@
+"""
+orchestrate.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Runs per-service Docker Compose commands for the modules of a stax project over a bounded pool of
+subprocesses. Services are started only after the services they depend on have succeeded and the
+output of every subprocess is multiplexed to the console with the name of its service as a prefix.
+"""
+
+from pathlib import Path
+from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from time import perf_counter
+import os
+import threading
+import subprocess
+import pywbu.console as csl
+from stax.graph import ModuleGraph, check_acyclic
+
+
+DOCKER_ENV_VAR = 'STAX_DOCKER'
+"""
+The name of the environment variable that overrides the path of the Docker executable. Pointing it
+at a stub executable allows orchestration to be exercised without Docker installed.
+"""
+
+DEFAULT_DOCKER = 'docker'
+"""
+The Docker executable used when no other is configured. It is looked up on the search path.
+"""
+
+DEFAULT_JOBS = 4
+"""
+The default maximum number of subprocesses that run at once.
+"""
+
+TASK_STATUSES = ('pending', 'running', 'succeeded', 'failed', 'skipped', 'cancelled')
+"""
+The statuses of a task. Skipped tasks depended on a failed task. Cancelled tasks were never started
+(or were stopped) because another task failed while failing fast.
+"""
+
+
+def docker_binary(override: str=None) -> str:
+    """
+    Returns the Docker executable to run. An explicit override takes precedence over the
+    environment variable, which takes precedence over the default.
+    """
+
+    return override or os.environ.get(DOCKER_ENV_VAR) or DEFAULT_DOCKER
+
+
+class Task(object):
+    """
+    Represents the command run for one service.
+    """
+
+    service: str
+    """
+    The name of the service the command is run for.
+    """
+
+    args: list[str]
+    """
+    The command-line arguments of the subprocess including the executable.
+    """
+
+    depends: list[str]
+    """
+    The names of the services that must succeed before this task starts. Services without a task in
+    the same run are ignored.
+    """
+
+    status: str
+    """
+    The status of the task. One of the task statuses.
+    """
+
+    returncode: int
+    """
+    The exit code of the subprocess or None if it never finished.
+    """
+
+    duration: float
+    """
+    The number of seconds the subprocess ran for.
+    """
+
+
+    def __init__(self, service: str, args: list[str], depends: Iterable[str]=()) -> None:
+        """
+        Creates a pending task for the given service.
+        """
+
+        self.service = service
+        self.args = args
+        self.depends = list(depends)
+        self.status = 'pending'
+        self.returncode = None
+        self.duration = 0.0
+
+
+class Orchestrator(object):
+    """
+    Runs tasks over a bounded pool of subprocesses in dependency order.
+    """
+
+    jobs: int
+    """
+    The maximum number of subprocesses that run at once.
+    """
+
+    fail_fast: bool
+    """
+    Whether the first failure cancels every task that has not finished. Otherwise only the tasks
+    that depend on a failed task are skipped.
+    """
+
+    cwd: Path
+    """
+    The working directory of the subprocesses.
+    """
+
+    output_mode: str
+    """
+    How the output of concurrent subprocesses is combined. Either "interleaved", where lines are
+    written as they are produced, or "grouped", where the output of each subprocess is written as
+    one block once it exits.
+    """
+
+    __lock: threading.Lock
+    """
+    Serializes access to the running processes.
+    """
+
+    __processes: dict[str, subprocess.Popen]
+    """
+    The running subprocess of each service.
+    """
+
+    __stopping: bool
+    """
+    Whether a failure is cancelling the remaining tasks.
+    """
+
+
+    def __init__(self,
+                 jobs: int=DEFAULT_JOBS,
+                 fail_fast: bool=True,
+                 cwd: Path=None,
+                 output_mode: str='interleaved') -> None:
+        """
+        Creates an orchestrator. The number of jobs must be at least one.
+        """
+
+        if jobs < 1:
+            raise ValueError(f'The number of jobs must be at least 1 but {jobs} was given.')
+        if output_mode not in csl.OUTPUT_MODES:
+            raise ValueError(f'Unknown output mode "{output_mode}". Expected one of ' \
+                             + f'{", ".join(csl.OUTPUT_MODES)}.')
+
+        self.jobs = jobs
+        self.fail_fast = fail_fast
+        self.cwd = cwd
+        self.output_mode = output_mode
+        self.__lock = threading.Lock()
+        self.__processes = {}
+        self.__stopping = False
+
+
+    def __execute(self, task: Task, width: int) -> None:
+        """
+        Runs the subprocess of a task, forwarding each line it outputs to the console with the
+        service name as a prefix.
+        """
+
+        with csl.TaskOutput(f'{task.service:<{width}} | ', self.output_mode) as output:
+            self.__run_task(task, output)
+
+
+    def __run_task(self, task: Task, output: csl.TaskOutput) -> None:
+        """
+        Runs the subprocess of a task, writing its output to the given task output.
+        """
+
+        start = perf_counter()
+
+        # Start the subprocess unless the run is being cancelled. Standard error is merged into
+        # standard output so lines keep their relative order.
+        with self.__lock:
+            if self.__stopping:
+                task.status = 'cancelled'
+                return
+
+            try:
+                process = subprocess.Popen(task.args, cwd=self.cwd, stdin=subprocess.DEVNULL,
+                                           stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                           text=True, errors='replace', bufsize=1)
+            except OSError as exc:
+                output.line(str(exc))
+                task.status, task.returncode = 'failed', None
+                return
+
+            self.__processes[task.service] = process
+            task.status = 'running'
+
+        # Forward every line as it is produced. The task output commits whole lines so the output
+        # of concurrent services never interleaves within a line.
+        for line in process.stdout:
+            output.line(line.rstrip())
+
+        # Record the outcome.
+        task.returncode = process.wait()
+        task.duration = perf_counter() - start
+
+        with self.__lock:
+            del self.__processes[task.service]
+            if task.returncode == 0:
+                task.status = 'succeeded'
+            else:
+                task.status = 'cancelled' if self.__stopping else 'failed'
+
+
+    def __cancel(self) -> None:
+        """
+        Stops every running subprocess and prevents any other from starting.
+        """
+
+        with self.__lock:
+            self.__stopping = True
+            for process in self.__processes.values():
+                process.terminate()
+
+
+    def run(self, tasks: list[Task], reverse: bool=False, progress: csl.Progress=None) -> bool:
+        """
+        Runs the given tasks. Each task starts once every task it depends on has succeeded, or,
+        when reversed, once every task that depends on it has succeeded (so services are stopped
+        before the services they rely on). If a progress report is given it is advanced as each
+        task finishes. Returns true if and only if every task succeeded.
+        """
+
+        by_service = {task.service: task for task in tasks}
+
+        # Build the edges between the tasks of this run in the direction they must be ordered.
+        prerequisites = {task.service: set() for task in tasks}
+        for task in tasks:
+            for dependency in task.depends:
+                if dependency in by_service and dependency != task.service:
+                    if reverse:
+                        prerequisites[dependency].add(task.service)
+                    else:
+                        prerequisites[task.service].add(dependency)
+
+        dependents = {service: [] for service in by_service}
+        for service, required in prerequisites.items():
+            for prerequisite in required:
+                dependents[prerequisite].append(service)
+
+        # Refuse to start anything if the dependencies contain a cycle.
+        check_acyclic(prerequisites)
+
+        remaining = {service: len(required) for service, required in prerequisites.items()}
+        width = max((len(service) for service in by_service), default=0)
+
+        def skip_dependents(service: str) -> None:
+            """
+            Marks every task that transitively waits on the given service as skipped.
+            """
+
+            for dependent in dependents[service]:
+                if by_service[dependent].status == 'pending':
+                    by_service[dependent].status = 'skipped'
+                    skip_dependents(dependent)
+
+        # Submit the tasks without prerequisites then submit each waiting task once its last
+        # prerequisite succeeds. The pool bounds the number of concurrent subprocesses.
+        with ThreadPoolExecutor(self.jobs) as pool:
+            running: dict[Future, Task] = {}
+
+            def submit(task: Task) -> None:
+                running[pool.submit(self.__execute, task, width)] = task
+
+            for task in tasks:
+                if not remaining[task.service]:
+                    submit(task)
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    task = running.pop(future)
+                    future.result()
+                    if progress is not None:
+                        progress.count += 1
+
+                    # Release the tasks waiting on a success.
+                    if task.status == 'succeeded':
+                        for dependent in dependents[task.service]:
+                            remaining[dependent] -= 1
+                            if not remaining[dependent] and not self.__stopping:
+                                submit(by_service[dependent])
+
+                    # A failure either cancels everything or skips the tasks that depend on it.
+                    elif task.status == 'failed':
+                        if self.fail_fast:
+                            self.__cancel()
+                        else:
+                            skip_dependents(task.service)
+
+        # Tasks that were never submitted because of a failure are cancelled.
+        for task in tasks:
+            if task.status == 'pending':
+                task.status = 'cancelled'
+
+        return all(task.status == 'succeeded' for task in tasks)
+
+
+def summarize(tasks: list[Task], elapsed: float) -> list[str]:
+    """
+    Returns the lines of a timing summary of the given finished tasks and the wall-clock time the
+    whole run took.
+    """
+
+    width = max([len(task.service) for task in tasks] + [len('SERVICE')])
+    lines = [f'{"SERVICE":<{width}} {"STATUS":<9} {"TIME":>8}']
+
+    for task in tasks:
+        time = f'{task.duration:.2f}s' if task.returncode is not None else '-'
+        lines.append(f'{task.service:<{width}} {task.status:<9} {time:>8}')
+
+    # Compare the total time of every subprocess with the wall-clock time to show the parallelism.
+    busy = sum(task.duration for task in tasks)
+    counts = {status: sum(task.status == status for task in tasks) for status in TASK_STATUSES}
+    lines.append(f'{len(tasks)} services in {elapsed:.2f}s ({busy:.2f}s of commands): ' \
+                 + ', '.join(f'{count} {status}' for status, count in counts.items() if count))
+
+    # Report the longest chain of dependent commands, which bounds how fast the run could finish.
+    services = {task.service for task in tasks}
+    graph = ModuleGraph({task.service: [name for name in task.depends
+                                         if name in services and name != task.service]
+                         for task in tasks})
+    path, total = graph.critical_path({task.service: task.duration for task in tasks
+                                       if task.returncode is not None})
+    if len(path) > 1:
+        lines.append(f'Critical path ({total:.2f}s): {" -> ".join(path)}')
+
+    return lines
@@ -4,17 +4,24 @@ init.py
 Type:       Python Script
 Author:     Will Brandon
 Created:    June 30, 2023
-Revised:    July 14, 2023
+Revised:    October 19, 2026
 
 Manages stax projects.
 """
 
 from pathlib import Path
-from uuid import uuid1
+from typing import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID, uuid1
 from datetime import date
+import os
+import sys
 import shutil as shu
+import subprocess
 import pywbu.filesystem as fs
 from stax.config import Config, create_config
+from stax.records import ModuleRecord, ProjectRecord
+import stax.modules as mods
 
 
 PROJ_META_DIR_NAME = '.stax'
@@ -28,8 +35,37 @@ PROJ_CONFIG_FILE_NAME = 'config.json'
 The name of the configuration file.
 """
 
+TRASH_PREFIX = '.stax-trash-'
+"""
+The prefix of the name a metadata directory is renamed to when its project is dismantled. The
+renamed directory is hidden so it is never mistaken for a project while it is being deleted.
+"""
+
+DEFAULT_JOBS = 8
+"""
+The default number of projects created or dismantled at once by the batch operations.
+"""
+
+# The script run by a detached interpreter to delete dismantled metadata directories. Each path is
+# given as an argument.
+_PURGE_SCRIPT = 'import shutil, sys\nfor path in sys.argv[1:]: shutil.rmtree(path, True)'
+
+SKIPPED_DIR_NAMES = frozenset(('node_modules', '__pycache__'))
+"""
+The names of directories that are never searched for projects in addition to hidden directories.
+"""
+
+# The shared session with each project opened in the process keyed by canonical root path.
+_sessions: dict[Path, 'Project'] = {}
+
 
 class Project(object):
+    """
+    Represents a session with a stax project. The configuration manager is created once and the
+    data derived from the configuration and the modules directory is cached until the files it was
+    read from change on disk, so each file is parsed at most once while it is unchanged. Cached
+    records and models are shared between callers and must not be modified.
+    """
 
     root: Path
     """
@@ -41,22 +77,46 @@ class Project(object):
     The canonical path to the metadata directory in the project.
     """
 
-    def __init__(self, root: Path) -> None:
+    __config: Config
+    """
+    The configuration manager or None until first requested.
+    """
+
+    __cache: dict[str, tuple[object, object]]
+    """
+    The cached value of each derived property keyed by property name along with the stamp of the
+    files it was derived from.
+    """
+
+
+    def __init__(self, root: Path, resolved: bool=False) -> None:
+        """
+        Creates a session with the project at the given root. If the root is already known to be
+        the canonical path to a project (such as when found by enclosing_project) it is resolved
+        and checked again only if resolved is false.
+        """
 
         # Ensure the root directory is a stax project.
-        if not is_project(root):
-            raise FileNotFoundError(f'No stax project exists at "{root}".')
+        if not resolved:
+            if not is_project(root):
+                raise FileNotFoundError(f'No stax project exists at "{root}".')
+            root = fs.canonical_path(root)
 
         # Initialize the root directory and metadata directory canonical path.
-        self.root = fs.canonical_path(root)
+        self.root = root
         self.meta_dir = self.root / PROJ_META_DIR_NAME
-    
+        self.__config = None
+        self.__cache = {}
+
 
-    def dismantle(self) -> None:
+    def dismantle(self, purge: bool=True) -> Path:
         """
         Deinitializes (dismantle) the stax project. This simply removes the metadata directory.
-        After the project has been dismantled do not attempt to use more functionality on the
-        object as it will result in undefined behavior.
+        The directory is first renamed to a hidden trash name, so the project stops being a project
+        at once, and then deleted unless purge is false, in which case the caller is responsible
+        for deleting it (such as with purge_in_background). Returns the trash path. After the
+        project has been dismantled do not attempt to use more functionality on the object as it
+        will result in undefined behavior.
         """
 
         # If the metadata directory does not exist within the given directory raise an exception becayse
@@ -65,27 +125,129 @@ class Project(object):
             raise FileNotFoundError(f'Failed to dismantle stax project at "{self.root}" because ' \
                                     + 'the directory is not a stax project.')
 
-        # Remove the metadata directory.
-        shu.rmtree(self.meta_dir)
+        # Close this thread's database connection, if any, before the directory is moved.
+        if self.__config is not None:
+            self.__config.backends['sqlite'].close()
+
+        # Move the metadata directory to a unique trash name within the project, which is a single
+        # rename on the same filesystem, then remove it if requested.
+        trash = self.root / f'{TRASH_PREFIX}{uuid1().hex}'
+        os.rename(self.meta_dir, trash)
+        if purge:
+            shu.rmtree(trash)
+
+        # Forget the session.
+        self.invalidate()
+        if _sessions.get(self.root) is self:
+            del _sessions[self.root]
+
+        return trash
+
+
+    def config(self) -> Config:
+        """
+        Returns the configuration manager for the project's configuration file. The manager is
+        created on the first call and reused afterwards.
+        """
+
+        # Create a configuration object for the configuration file within the project metadata
+        # directory. The object constructor will raise an exception if the file doesn't exist.
+        if self.__config is None:
+            self.__config = Config(self.meta_dir / PROJ_CONFIG_FILE_NAME)
+
+        return self.__config
+
+
+    def __cached(self, key: str, stamp: object, load: Callable[[], object]) -> object:
+        """
+        Returns the cached value of a derived property if it was derived from files with the given
+        stamp. Otherwise the value is loaded and cached with the stamp.
+        """
+
+        cached = self.__cache.get(key)
+        if cached is not None and cached[1] == stamp:
+            return cached[0]
+
+        value = load()
+        self.__cache[key] = (value, stamp)
+        return value
+
+
+    def record(self) -> ProjectRecord:
+        """
+        Returns the validated project record, reading the configuration again only if it changed
+        since it was last read.
+        """
+
+        config = self.config()
+        return self.__cached('record', config.stamp(), config.record)
+
+
+    def model(self) -> dict:
+        """
+        Returns the validated model dictionary object, reading the configuration again only if it
+        changed since it was last read.
+        """
+
+        config = self.config()
+        return self.__cached('model', config.stamp(), config.model)
+
+
+    def modules(self) -> list[ModuleRecord]:
+        """
+        Returns the module records in configuration order.
+        """
+
+        return self.record().modules
+
+
+    def module_count(self) -> int:
+        """
+        Returns the number of modules in the configuration.
+        """
 
+        return len(self.modules())
 
-    def config(self, path: Path=fs.cwd()) -> Config:
+
+    def module_dirs(self) -> list[str]:
         """
-        Returns the configuration manager for the project's configuration file.
+        Returns the names of the subdirectories of the modules directory in sorted order, listing
+        the directory again only if it changed since it was last listed. An empty list is returned
+        if there is no modules directory.
         """
 
-        # Create a path to the configuration file within the project metadata directory.
-        path = self.meta_dir / PROJ_CONFIG_FILE_NAME
+        modules_dir = self.root / mods.MODULES_DIR_NAME
+
+        # The directory's modification time changes whenever an entry is added or removed.
+        try:
+            stamp = modules_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        return self.__cached('module_dirs', stamp, lambda: sorted(
+            entry.name for entry in os.scandir(modules_dir) if entry.is_dir()))
+
+
+    def invalidate(self) -> None:
+        """
+        Discards every cached property and the configuration manager so they are all read again
+        on next use.
+        """
 
-        # Return a configuration object for a configuration file at the given path. The object
-        # constructor will raise an exception if the file doesn't exist.
-        return Config(path)
+        self.__config = None
+        self.__cache.clear()
 
 
-def create_project(root: Path, name: str=None, author: str=None, desc: str=None) -> None:
+def create_project(root: Path,
+                   name: str=None,
+                   author: str=None,
+                   desc: str=None,
+                   uuid: UUID=None,
+                   creation_date: date=None) -> None:
     """
     Creates a stax project in the given directory. If the directory does not already exist it is
-    recursively created. This also creates a metadata directory within the project.
+    recursively created. This also creates a metadata directory within the project. A new UUID and
+    today's date are used unless they are given.
     """
 
     # Ensure the root path is canonical.
@@ -117,16 +279,84 @@ def create_project(root: Path, name: str=None, author: str=None, desc: str=None)
     # directory also if it does not already exist.) Assign the proper permissions.
     meta_dir.mkdir(511, True, True)
 
-    # Create a new universal unique identifier for the project.
-    uuid = uuid1()
+    # Create a new universal unique identifier for the project unless one was given and use today
+    # as the creation date unless one was given.
+    uuid = uuid or uuid1()
+    creation_date = creation_date or date.today()
 
     # Create a path to the configuration file within the project metadata directory.
     config_path = meta_dir / PROJ_CONFIG_FILE_NAME
 
-    # Initialize the configuration file with todays date as the project creation date.
-    config = create_config(config_path, uuid, name, date.today(), author, desc)
+    # Initialize the configuration file, including the starter module, with a single write.
+    create_config(config_path, uuid, name, creation_date, author, desc,
+                  [ModuleRecord('hello', creation_date, 'test module')])
+
+
+def create_projects(roots: Iterable[Path],
+                    author: str=None,
+                    desc: str=None,
+                    jobs: int=DEFAULT_JOBS) -> dict[Path, Exception]:
+    """
+    Creates a stax project in each of the given directories, each named after its directory, over
+    a pool of threads. The UUIDs are generated up front in one batch and every project shares the
+    same creation date. Returns the exception raised creating each project that failed keyed by
+    its directory.
+    """
+
+    roots = list(roots)
+    uuids = [uuid1() for _ in roots]
+    today = date.today()
+    errors = {}
+
+    # Create the projects concurrently, collecting the failures.
+    with ThreadPoolExecutor(jobs) as pool:
+        futures = {root: pool.submit(create_project, root, None, author, desc, uuid, today)
+                   for root, uuid in zip(roots, uuids)}
+        for root, future in futures.items():
+            try:
+                future.result()
+            except Exception as exc:
+                errors[root] = exc
+
+    return errors
+
+
+def dismantle_projects(projects: Iterable[Project],
+                       jobs: int=DEFAULT_JOBS) -> tuple[list[Path], dict[Path, Exception]]:
+    """
+    Dismantles each of the given projects over a pool of threads by renaming their metadata
+    directories to trash names without deleting them. Returns the trash paths, which should then be
+    deleted (such as with purge_in_background), and the exception raised dismantling each project
+    that failed keyed by its root.
+    """
+
+    trash, errors = [], {}
+
+    # Rename the metadata directories concurrently, collecting the failures.
+    with ThreadPoolExecutor(jobs) as pool:
+        futures = {project.root: pool.submit(project.dismantle, False) for project in projects}
+        for root, future in futures.items():
+            try:
+                trash.append(future.result())
+            except Exception as exc:
+                errors[root] = exc
 
-    config.set_module('hello', date.today(), 'test module')
+    return trash, errors
+
+
+def purge_in_background(paths: Iterable[Path]) -> None:
+    """
+    Deletes the given directories in a detached process that outlives the current process, so the
+    caller never waits on the deletion.
+    """
+
+    paths = [str(path) for path in paths]
+    if not paths:
+        return
+
+    subprocess.Popen([sys.executable, '-c', _PURGE_SCRIPT, *paths],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, start_new_session=True)
 
 
 def is_project(root: Path) -> bool:
@@ -141,24 +371,60 @@ def is_project(root: Path) -> bool:
     return meta_dir.is_dir()
 
 
-def enclosing_project(path: Path=fs.cwd()) -> Project:
+def find_projects(root: Path) -> list[Path]:
+    """
+    Finds the root of every project beneath the given directory (including the directory itself
+    and nested projects) in sorted order. Hidden directories and the directories of skipped names
+    are not searched.
+    """
+
+    roots = []
+
+    for dir_path, dir_names, _ in os.walk(fs.canonical_path(root)):
+        if PROJ_META_DIR_NAME in dir_names:
+            roots.append(Path(dir_path))
+
+        # Prune the directories that are never searched. Pruning in place stops the walk from
+        # descending into them.
+        dir_names[:] = sorted(name for name in dir_names
+                              if not name.startswith('.') and name not in SKIPPED_DIR_NAMES)
+
+    return sorted(roots)
+
+
+def open_project(root: Path) -> Project:
+    """
+    Returns the session with the project at the given root. Sessions are shared within the process
+    so every caller opening the same project shares its cached data.
+    """
+
+    # Use the canonical equivalent of the root, which only needs to be resolved once. An open
+    # session is returned without checking the project again.
+    root = fs.canonical_path(root)
+    if root not in _sessions:
+        if not is_project(root):
+            raise FileNotFoundError(f'No stax project exists at "{root}".')
+        _sessions[root] = Project(root, True)
+
+    return _sessions[root]
+
+
+def enclosing_project(path: Path=None) -> Project:
     """
     Finds the project enclosing the given path. If an enclosing project does not exist None is
     returned. If there are nested projects the bottommost project in the tree is found. By default
     the current working directory is used to determine the enclosing project in the working session.
+    The session with the project is shared within the process.
     """
 
-    # Use the canonical equivalent of the path.
-    path = fs.canonical_path(path)
-    
-    # If the path is a project return a project object. This is recursive base case #1.
-    if is_project(path):
-        return Project(path)
-    
-    # If the path is the root return None as no project could be found (both compared paths are
-    # already anonical). This is recursive base case #2.
-    if path == fs.ROOT:
-        return None
+    # Use the canonical equivalent of the path, which only needs to be resolved once.
+    path = fs.canonical_path(path if path is not None else fs.cwd())
+
+    # Check the path and then each of its ancestors up to the root for a project.
+    for candidate in (path, *path.parents):
+        if is_project(candidate):
+            if candidate not in _sessions:
+                _sessions[candidate] = Project(candidate, True)
+            return _sessions[candidate]
 
-    # Recursively check the parent directory to see if it is a stax project.
-    return enclosing_project(path.parent)
+    return None
@@ -0,0 +1,463 @@
+"""
+query.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Provides a small query language and engine over the modules of a stax project. Queries are planned
+against persistent name and date indexes stored in the project metadata directory so selective
+queries only visit the modules in the matching index range.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+import json
+import pywbu.filesystem as fs
+from stax.config import Config
+from stax.records import ModuleRecord, parse_date, format_date
+
+
+INDEX_FILE_NAME = 'index.json'
+"""
+The name of the module index file stored alongside the configuration file.
+"""
+
+INDEX_VERSION = 1
+"""
+The version of the index file format. Index files with a different version are rebuilt.
+"""
+
+QUERY_FIELDS = ('name', 'creation_date', 'desc')
+"""
+The module fields that may be selected by a query.
+"""
+
+QUERY_SORT_KEYS = ('name', 'date')
+"""
+The keys that query results may be sorted by.
+"""
+
+
+class Query(object):
+    """
+    Represents a query over the modules of a project.
+    """
+
+    prefix: str
+    """
+    Only modules whose name starts with this prefix match. None matches every name.
+    """
+
+    name: str
+    """
+    Only the module with exactly this name matches. None matches every name.
+    """
+
+    since: date
+    """
+    Only modules created on or after this date match. None leaves the range open.
+    """
+
+    until: date
+    """
+    Only modules created on or before this date match. None leaves the range open.
+    """
+
+    sort: str
+    """
+    The key results are sorted by. Either "name" or "date".
+    """
+
+    reverse: bool
+    """
+    Whether results are sorted in descending order.
+    """
+
+    fields: tuple[str]
+    """
+    The module fields included in each result.
+    """
+
+    limit: int
+    """
+    The maximum number of results. None returns every result.
+    """
+
+
+    def __init__(
+            self,
+            prefix: str=None,
+            name: str=None,
+            since: date=None,
+            until: date=None,
+            sort: str='name',
+            reverse: bool=False,
+            fields: tuple[str]=QUERY_FIELDS,
+            limit: int=None) -> None:
+        """
+        Creates a new query. Every criterion is optional and an empty query matches every module.
+        """
+
+        # Ensure the sort key and fields are recognized.
+        if sort not in QUERY_SORT_KEYS:
+            raise ValueError(f'Unknown query sort key "{sort}". Expected one of ' \
+                             + f'{", ".join(QUERY_SORT_KEYS)}.')
+
+        for field in fields:
+            if field not in QUERY_FIELDS:
+                raise ValueError(f'Unknown query field "{field}". Expected one of ' \
+                                 + f'{", ".join(QUERY_FIELDS)}.')
+
+        self.prefix = prefix
+        self.name = name
+        self.since = since
+        self.until = until
+        self.sort = sort
+        self.reverse = reverse
+        self.fields = tuple(fields)
+        self.limit = limit
+
+
+    def matches(self, module: ModuleRecord) -> bool:
+        """
+        Determines whether a module record satisfies every criterion of the query.
+        """
+
+        return (self.name is None or module.name == self.name) \
+            and (self.prefix is None or module.name.startswith(self.prefix)) \
+            and (self.since is None or module.creation_date >= self.since) \
+            and (self.until is None or module.creation_date <= self.until)
+
+
+def parse_query(text: str) -> Query:
+    """
+    Parses a query string into a query object. A query string is a whitespace separated list of
+    terms, each of which is one of:
+
+        name=NAME               the module name is exactly NAME
+        name^=PREFIX            the module name starts with PREFIX
+        created>=YYYY-MM-DD     the module was created on or after a date (also >, <=, <, =)
+        sort=name|date          sort ascending by a key (prefix the key with "-" for descending)
+        fields=FIELD,...        include only the given fields (name, creation_date, desc)
+        limit=N                 return at most N results
+
+    For example: "name^=api created>=2023-01-01 created<2023-07-01 sort=date fields=name".
+    """
+
+    # Collect the keyword arguments of the query as terms are parsed.
+    kwargs = {}
+
+    for term in text.split():
+
+        # Match the term against each supported operator. Longer operators are checked first so
+        # that e.g. ">=" is not mistaken for "=".
+        for op in ('^=', '>=', '<=', '=', '>', '<'):
+            key, sep, value = term.partition(op)
+            if sep and key and value and key.isidentifier():
+                break
+        else:
+            raise ValueError(f'Malformed query term "{term}".')
+
+        # Interpret the term based on its key and operator.
+        match (key, op):
+
+            case ('name', '='): kwargs['name'] = value
+            case ('name', '^='): kwargs['prefix'] = value
+
+            case ('created', '='): kwargs['since'] = kwargs['until'] = _term_date(term, value)
+            case ('created', '>='): kwargs['since'] = _term_date(term, value)
+            case ('created', '>'): kwargs['since'] = _term_date(term, value, 1)
+            case ('created', '<='): kwargs['until'] = _term_date(term, value)
+            case ('created', '<'): kwargs['until'] = _term_date(term, value, -1)
+
+            case ('sort', '='):
+                kwargs['reverse'] = value.startswith('-')
+                kwargs['sort'] = value.lstrip('-')
+
+            case ('fields', '='): kwargs['fields'] = tuple(value.split(','))
+            case ('limit', '='): kwargs['limit'] = _term_int(term, value)
+
+            case _:
+                raise ValueError(f'Unsupported query term "{term}".')
+
+    return Query(**kwargs)
+
+
+def _term_date(term: str, value: str, offset: int=0) -> date:
+    """
+    Parses the date value of a query term and offsets it by a number of days. Raises an exception
+    naming the term if the value is not a valid date.
+    """
+
+    try:
+        return date.fromordinal(parse_date(value).toordinal() + offset)
+    except ValueError as exc:
+        raise ValueError(f'Malformed query term "{term}": {exc}.')
+
+
+def _term_int(term: str, value: str) -> int:
+    """
+    Parses the integer value of a query term. Raises an exception naming the term if the value is
+    not a valid integer.
+    """
+
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise ValueError(f'Malformed query term "{term}": {exc}.')
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """
+    Returns the smallest string that is greater than every string starting with the given prefix,
+    or None if no such string exists.
+    """
+
+    # Increment the last character that can be incremented and drop everything after it.
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+
+    return None
+
+
+class QueryPlan(object):
+    """
+    Describes how a query is executed against a module index.
+    """
+
+    access: str
+    """
+    The access path used to find candidate rows: "name", "date", or "scan".
+    """
+
+    rows: range
+    """
+    The range of positions within the access path order that contains every candidate row.
+    """
+
+    sorted: bool
+    """
+    Whether the access path order already satisfies the requested result order.
+    """
+
+
+    def __init__(self, access: str, rows: range, sorted: bool) -> None:
+        """
+        Creates a new query plan.
+        """
+
+        self.access = access
+        self.rows = rows
+        self.sorted = sorted
+
+
+    def __str__(self) -> str:
+        """
+        Returns a human readable explanation of the plan.
+        """
+
+        return f'access={self.access} candidates={len(self.rows)} ' \
+            + f'sort={"index" if self.sorted else "explicit"}'
+
+
+class ModuleIndex(object):
+    """
+    Holds name and date indexes over the modules of a project. Rows are stored column-wise in name
+    order and a secondary permutation orders the rows by creation date. The index is persisted
+    next to the configuration file and is rebuilt whenever the configuration file changes.
+    """
+
+    names: list[str]
+    """
+    The module names in ascending order.
+    """
+
+    ordinals: list[int]
+    """
+    The creation date ordinal of each row in name order.
+    """
+
+    descs: list[str]
+    """
+    The description of each row in name order.
+    """
+
+    by_date: list[int]
+    """
+    The row positions ordered by ascending creation date then name.
+    """
+
+    date_keys: list[int]
+    """
+    The creation date ordinals in date order. Parallel to by_date and used for range searches.
+    """
+
+
+    def __init__(
+            self,
+            names: list[str],
+            ordinals: list[int],
+            descs: list[str],
+            by_date: list[int]) -> None:
+        """
+        Creates an index from existing columns.
+        """
+
+        self.names = names
+        self.ordinals = ordinals
+        self.descs = descs
+        self.by_date = by_date
+        self.date_keys = [ordinals[row] for row in by_date]
+
+
+    def __len__(self) -> int:
+        """
+        Returns the number of indexed modules.
+        """
+
+        return len(self.names)
+
+
+    @classmethod
+    def build(cls, modules: list[ModuleRecord]) -> 'ModuleIndex':
+        """
+        Builds an index over the given module records.
+        """
+
+        # Order the records by name and split them into columns.
+        modules = sorted(modules, key=lambda module: module.name)
+        names = [module.name for module in modules]
+        ordinals = [module.ordinal for module in modules]
+        descs = [module.desc for module in modules]
+
+        # Order the row positions by creation date. Rows are already in name order so a stable
+        # sort breaks date ties by name.
+        by_date = sorted(range(len(modules)), key=ordinals.__getitem__)
+
+        return cls(names, ordinals, descs, by_date)
+
+
+    @classmethod
+    def for_config(cls, config: Config) -> 'ModuleIndex':
+        """
+        Returns the index for the given configuration. The persisted index is used if it is up to
+        date, otherwise the index is rebuilt from the configuration file and persisted.
+        """
+
+        # Identify the state of the configuration by its stamp.
+        index_path = config.path.parent / INDEX_FILE_NAME
+        stamp = config.stamp()
+
+        # Try to load the persisted index if it was built from the current configuration file.
+        try:
+            with open(index_path, 'r') as file:
+                data = json.load(file)
+
+            if data['version'] == INDEX_VERSION and data['stamp'] == stamp:
+                return cls(data['names'], data['ordinals'], data['descs'], data['by_date'])
+
+        # A missing or unreadable index is simply rebuilt.
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        # Build a new index by streaming the module records from the configuration file.
+        index = cls.build(list(config.iter_modules()))
+
+        # Persist the index through a temporary file so readers never see a partial index.
+        with fs.atomic_open(index_path) as file:
+            json.dump({
+                'version': INDEX_VERSION,
+                'stamp': stamp,
+                'names': index.names,
+                'ordinals': index.ordinals,
+                'descs': index.descs,
+                'by_date': index.by_date
+            }, file, separators=(',', ':'))
+
+        return index
+
+
+    def plan(self, query: Query) -> QueryPlan:
+        """
+        Chooses the access path for a query. The name and date index ranges are both found by
+        binary search and the narrower one is used. A full scan is only used when neither index
+        narrows the candidates.
+        """
+
+        # Find the range of rows in name order matching the name criteria.
+        name_range = None
+        if query.name is not None:
+            lo = bisect_left(self.names, query.name)
+            name_range = range(lo, bisect_right(self.names, query.name, lo))
+        elif query.prefix:
+            lo = bisect_left(self.names, query.prefix)
+            bound = _prefix_upper_bound(query.prefix)
+            hi = bisect_left(self.names, bound, lo) if bound is not None else len(self)
+            name_range = range(lo, hi)
+
+        # Find the range of rows in date order matching the date criteria.
+        date_range = None
+        if query.since is not None or query.until is not None:
+            lo = bisect_left(self.date_keys, query.since.toordinal()) if query.since else 0
+            hi = bisect_right(self.date_keys, query.until.toordinal()) if query.until \
+                else len(self)
+            date_range = range(lo, max(lo, hi))
+
+        # Use the narrower index range. Ties favor the index that matches the sort order.
+        candidates = [('name', name_range), ('date', date_range)]
+        candidates = [(access, rows) for access, rows in candidates if rows is not None]
+        if candidates:
+            access, rows = min(candidates, key=lambda c: (len(c[1]), c[0] != query.sort))
+            return QueryPlan(access, rows, access == query.sort)
+
+        # With no criteria scan every row in the order that satisfies the sort.
+        return QueryPlan('scan', range(len(self)), True)
+
+
+    def execute(self, query: Query, plan: QueryPlan=None) -> list[dict]:
+        """
+        Executes a query and returns a list of result dictionaries holding the selected fields.
+        """
+
+        # Plan the query if no plan was given.
+        plan = plan or self.plan(query)
+
+        # Translate the candidate positions into row positions in name order.
+        rows = self.by_date[plan.rows.start:plan.rows.stop] if plan.access == 'date' \
+            or (plan.access == 'scan' and query.sort == 'date') else plan.rows
+
+        # Apply the criteria not enforced by the chosen index to the candidate rows.
+        since = query.since.toordinal() if query.since else None
+        until = query.until.toordinal() if query.until else None
+        names, ordinals = self.names, self.ordinals
+        rows = [row for row in rows
+                if (query.name is None or names[row] == query.name)
+                and (query.prefix is None or names[row].startswith(query.prefix))
+                and (since is None or ordinals[row] >= since)
+                and (until is None or ordinals[row] <= until)]
+
+        # Sort the matches explicitly if the access path order differs from the requested order.
+        if not plan.sorted:
+            key = (lambda row: (ordinals[row], names[row])) if query.sort == 'date' else None
+            rows.sort(key=key)
+
+        # Apply the requested direction and limit.
+        if query.reverse:
+            rows.reverse()
+        if query.limit is not None:
+            rows = rows[:query.limit]
+
+        # Build the result dictionaries with only the selected fields.
+        getters = {
+            'name': lambda row: names[row],
+            'creation_date': lambda row: format_date(date.fromordinal(ordinals[row])),
+            'desc': lambda row: self.descs[row]
+        }
+        selected = [(field, getters[field]) for field in query.fields]
+
+        return [{field: getter(row) for field, getter in selected} for row in rows]
@@ -0,0 +1,285 @@
+"""
+records.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines compact record classes that represent the data in a stax project configuration model.
+"""
+
+from sys import intern
+from uuid import UUID
+from datetime import date
+
+
+DATE_FORMAT = '%Y-%m-%d'
+"""
+The format used to store dates in the configuration file. This is the ISO 8601 calendar date format
+so dates can be parsed with the fast date.fromisoformat constructor instead of date.strptime.
+"""
+
+
+def parse_date(text: str) -> date:
+    """
+    Parses a date string stored in the configuration file into a date object.
+    """
+
+    return date.fromisoformat(text)
+
+
+def format_date(value: date) -> str:
+    """
+    Formats a date object into the string representation stored in the configuration file.
+    """
+
+    return value.strftime(DATE_FORMAT)
+
+
+class ModuleRecord(object):
+    """
+    Represents a single module entry in a stax project configuration model.
+    """
+
+    __slots__ = ('name', 'creation_date', 'desc', 'depends_on')
+
+    name: str
+    """
+    The interned name of the module.
+    """
+
+    creation_date: date
+    """
+    The date the module was created.
+    """
+
+    desc: str
+    """
+    An optional description of the module. None if no description was given.
+    """
+
+    depends_on: tuple[str]
+    """
+    The interned names of the modules this module depends on. Empty if it depends on none.
+    """
+
+
+    def __init__(self,
+                 name: str,
+                 creation_date: date,
+                 desc: str=None,
+                 depends_on: tuple[str]=()) -> None:
+        """
+        Creates a new module record given a name, creation date, optional description, and optional
+        names of the modules it depends on.
+        """
+
+        # Intern the names so records sharing a name (and lookups against them) share one string.
+        self.name = intern(name)
+        self.creation_date = creation_date
+        self.desc = desc
+        self.depends_on = tuple(map(intern, depends_on)) if depends_on else ()
+
+
+    def __repr__(self) -> str:
+        """
+        Returns a debugging representation of the record.
+        """
+
+        return f'ModuleRecord({self.name!r}, {self.creation_date!r}, {self.desc!r}, ' \
+            + f'{self.depends_on!r})'
+
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Determines whether two module records hold identical data.
+        """
+
+        # Records are only comparable with other module records.
+        if not isinstance(other, ModuleRecord):
+            return NotImplemented
+
+        return self.name == other.name \
+            and self.creation_date == other.creation_date \
+            and self.desc == other.desc \
+            and self.depends_on == other.depends_on
+
+
+    @property
+    def ordinal(self) -> int:
+        """
+        The proleptic Gregorian ordinal of the creation date. Useful for cheap comparisons.
+        """
+
+        return self.creation_date.toordinal()
+
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ModuleRecord':
+        """
+        Creates a module record from a dictionary in the configuration file JSON schema.
+        """
+
+        return cls(data['name'], parse_date(data['creation_date']), data.get('desc'),
+                   data.get('depends_on') or ())
+
+
+    def to_dict(self) -> dict:
+        """
+        Returns a dictionary representing the record in the configuration file JSON schema. The
+        dependencies are only included when there are any so existing files are unchanged.
+        """
+
+        data = {
+            'name': self.name,
+            'creation_date': format_date(self.creation_date),
+            'desc': self.desc
+        }
+
+        if self.depends_on:
+            data['depends_on'] = list(self.depends_on)
+
+        return data
+
+
+class ProjectRecord(object):
+    """
+    Represents the top-level data in a stax project configuration model.
+    """
+
+    __slots__ = ('uuid', 'name', 'creation_date', 'author', 'desc', 'modules')
+
+    uuid: UUID
+    """
+    The universal unique identifier of the project.
+    """
+
+    name: str
+    """
+    The interned name of the project.
+    """
+
+    creation_date: date
+    """
+    The date the project was created.
+    """
+
+    author: str
+    """
+    The optional author of the project. None if no author was given.
+    """
+
+    desc: str
+    """
+    An optional description of the project. None if no description was given.
+    """
+
+    modules: list[ModuleRecord]
+    """
+    The records of each module in the project in configuration file order.
+    """
+
+
+    def __init__(
+            self,
+            uuid: UUID,
+            name: str,
+            creation_date: date,
+            author: str=None,
+            desc: str=None,
+            modules: list[ModuleRecord]=None) -> None:
+        """
+        Creates a new project record given a UUID, name, creation date, optional author, optional
+        description, and optional list of module records.
+        """
+
+        self.uuid = uuid
+        self.name = intern(name)
+        self.creation_date = creation_date
+        self.author = author
+        self.desc = desc
+        self.modules = modules if modules is not None else []
+
+
+    def __repr__(self) -> str:
+        """
+        Returns a debugging representation of the record.
+        """
+
+        return f'ProjectRecord({self.uuid!r}, {self.name!r}, {len(self.modules)} modules)'
+
+
+    def module(self, name: str) -> ModuleRecord:
+        """
+        Returns the record of the module with the given name or None if no such module exists.
+        """
+
+        # Search the modules linearly since the list preserves configuration file order.
+        for module in self.modules:
+            if module.name == name:
+                return module
+
+        return None
+
+
+    def set_module(self, module: ModuleRecord) -> bool:
+        """
+        Sets the given module record in the project. If a module with the same name already exists
+        it is replaced and true is returned. Otherwise the record is appended and false is returned.
+        """
+
+        # Replace an existing module with the same name if one is present.
+        for i, existing in enumerate(self.modules):
+            if existing.name == module.name:
+                self.modules[i] = module
+                return True
+
+        # Otherwise append the new module record.
+        self.modules.append(module)
+        return False
+
+
+    def header_dict(self) -> dict:
+        """
+        Returns a dictionary of the project properties in the configuration file JSON schema without
+        the modules list.
+        """
+
+        return {
+            'uuid': str(self.uuid),
+            'name': self.name,
+            'creation_date': format_date(self.creation_date),
+            'author': self.author,
+            'desc': self.desc
+        }
+
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ProjectRecord':
+        """
+        Creates a project record from a dictionary in the configuration file JSON schema.
+        """
+
+        # Convert each module dictionary into a compact record.
+        modules = [ModuleRecord.from_dict(module) for module in data['modules']]
+
+        return cls(
+            UUID(data['uuid']),
+            data['name'],
+            parse_date(data['creation_date']),
+            data.get('author'),
+            data.get('desc'),
+            modules)
+
+
+    def to_dict(self) -> dict:
+        """
+        Returns a dictionary representing the record in the configuration file JSON schema.
+        """
+
+        # Start with the header properties then append the serialized modules list.
+        data = self.header_dict()
+        data['modules'] = [module.to_dict() for module in self.modules]
+
+        return data
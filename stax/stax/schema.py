@@ -0,0 +1,274 @@
+"""
+schema.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Provides validation of stax project configuration models. The schema is compiled once at import
+time into specialized Python checking functions so documents are checked by straight-line code
+rather than by interpreting the schema for every value.
+"""
+
+from pathlib import Path
+from typing import Callable, Iterable
+from datetime import date
+from uuid import UUID
+from pywbu.exc import MalformedDataException
+from stax.records import ModuleRecord, ProjectRecord
+
+
+MODULE_SCHEMA = {
+    'name': 'name',
+    'creation_date': 'date',
+    'desc': 'optional_str',
+    'depends_on': 'optional_names'
+}
+"""
+The schema of a module object mapping each property to its kind. Properties not in the schema are
+permitted so newer configuration files remain readable.
+"""
+
+HEADER_SCHEMA = {
+    'uuid': 'uuid',
+    'name': 'name',
+    'creation_date': 'date',
+    'author': 'optional_str',
+    'desc': 'optional_str'
+}
+"""
+The schema of the project properties of a configuration model mapping each property to its kind.
+"""
+
+# The source code template of the check performed for each kind of property. Each template reads
+# the property value from "v", calls "fail" with a description of the expected value, and stores the
+# converted value in the variable named by "var". Templates are indented by "ind".
+_KIND_CHECKS = {
+    'name': """
+{ind}if v.__class__ is not str or not v:
+{ind}    fail(source, {path}, 'expected a non-empty string')
+{ind}{var} = v""",
+    'optional_str': """
+{ind}if v is not None and v.__class__ is not str:
+{ind}    fail(source, {path}, 'expected a string or null')
+{ind}{var} = v""",
+    'date': """
+{ind}if v.__class__ is not str or len(v) != 10 or v[4] != '-' or v[7] != '-' \\
+{ind}        or not v.isascii() or not (v[:4] + v[5:7] + v[8:]).isdigit():
+{ind}    fail(source, {path}, 'expected a YYYY-MM-DD date string')
+{ind}try:
+{ind}    {var} = fromisoformat(v)
+{ind}except ValueError:
+{ind}    fail(source, {path}, 'expected a YYYY-MM-DD date string')""",
+    'optional_names': """
+{ind}if v is None:
+{ind}    {var} = ()
+{ind}elif v.__class__ is not list:
+{ind}    fail(source, {path}, 'expected a list of module names')
+{ind}else:
+{ind}    for n in v:
+{ind}        if n.__class__ is not str or not n:
+{ind}            fail(source, {path}, 'expected a list of module names')
+{ind}    {var} = v""",
+    'uuid': """
+{ind}if v.__class__ is not str:
+{ind}    fail(source, {path}, 'expected a UUID string')
+{ind}try:
+{ind}    {var} = UUID(v)
+{ind}except ValueError:
+{ind}    fail(source, {path}, 'expected a UUID string')"""
+}
+
+# The kinds of properties that may be omitted entirely.
+_OPTIONAL_KINDS = ('optional_str', 'optional_names')
+
+
+class _Missing(object):
+    """
+    A sentinel type for properties that are absent from an object.
+    """
+
+    pass
+
+
+_MISSING = _Missing()
+
+
+def _fail(source: Path, path: str, expected: str) -> None:
+    """
+    Raises an exception describing a malformed value at the given path within a source document.
+    """
+
+    raise MalformedDataException(f'Malformed configuration file "{source}" at "{path}": ' \
+                                 + f'{expected}.')
+
+
+def _object_lines(schema: dict, path: str, ind: str) -> list[str]:
+    """
+    Generates the source lines that check the object in the variable "obj" against an object
+    schema. The converted value of each property is left in a variable named "p_" followed by the
+    property name. The path is a source expression evaluated only when a check fails.
+    """
+
+    # Check that the value is an object.
+    lines = [
+        f'{ind}if obj.__class__ is not dict:',
+        f'{ind}    fail(source, {path}, \'expected an object\')'
+    ]
+
+    # Append the specialized check for each property.
+    for key, kind in schema.items():
+        prop_path = f'({path}) + ".{key}" if {path} else "{key}"'
+
+        # Missing required properties are reported before the kind is checked. Missing optional
+        # properties are treated as null.
+        if kind in _OPTIONAL_KINDS:
+            lines.append(f'{ind}v = obj.get({key!r})')
+        else:
+            lines.append(f'{ind}v = obj.get({key!r}, MISSING)')
+            lines.append(f'{ind}if v is MISSING:')
+            lines.append(f'{ind}    fail(source, {prop_path}, \'missing required property\')')
+
+        lines.append(_KIND_CHECKS[kind].format(ind=ind, path=prop_path, var=f'p_{key}')
+                     .strip('\n'))
+
+    return lines
+
+
+def _compile(name: str, lines: list[str]) -> Callable:
+    """
+    Compiles generated source lines defining a function of the given name and returns the function
+    bound to the helpers it references.
+    """
+
+    namespace = {
+        'MISSING': _MISSING,
+        'fromisoformat': date.fromisoformat,
+        'UUID': UUID,
+        'ModuleRecord': ModuleRecord,
+        'fail': _fail
+    }
+    exec(compile('\n'.join(lines), f'<stax schema {name}>', 'exec'), namespace)
+
+    return namespace[name]
+
+
+# A function with the signature (obj, path, source) that checks a single module object.
+_check_module = _compile('check_module', [
+    'def check_module(obj, path, source):',
+    *_object_lines(MODULE_SCHEMA, 'path', '    ')
+])
+
+# A function with the signature (obj, path, source) that checks the project properties.
+_check_header = _compile('check_header', [
+    'def check_header(obj, path, source):',
+    *_object_lines(HEADER_SCHEMA, 'path', '    ')
+])
+
+# A function with the signature (obj, path, source) that checks a single module object and returns
+# it converted to a module record.
+_load_module = _compile('load_module', [
+    'def load_module(obj, path, source):',
+    *_object_lines(MODULE_SCHEMA, 'path', '    '),
+    '    return ModuleRecord(p_name, p_creation_date, p_desc, p_depends_on)'
+])
+
+# A function with the signature (modules, source, start) that checks every module object of an
+# iterable with the checks inlined in the loop body.
+_check_modules = _compile('check_modules', [
+    'def check_modules(modules, source, start):',
+    '    for i, obj in enumerate(modules, start):',
+    *_object_lines(MODULE_SCHEMA, 'f"modules[{i}]"', '        ')
+])
+
+# A function with the signature (modules, source) that checks every module object of a list and
+# converts it to a module record in the same pass, so each date is parsed only once.
+_load_modules = _compile('load_modules', [
+    'def load_modules(modules, source):',
+    '    records = []',
+    '    append = records.append',
+    '    for i, obj in enumerate(modules):',
+    *_object_lines(MODULE_SCHEMA, 'f"modules[{i}]"', '        '),
+    '        append(ModuleRecord(p_name, p_creation_date, p_desc, p_depends_on))',
+    '    return records'
+])
+
+
+def validate_module(module: dict, path: str, source: Path) -> None:
+    """
+    Validates a single module object found at the given path within a source document. Raises a
+    malformed data exception naming the precise path of the first invalid value.
+    """
+
+    _check_module(module, path, source)
+
+
+def load_module(module: dict, path: str, source: Path) -> ModuleRecord:
+    """
+    Validates a single module object found at the given path within a source document and converts
+    it to a module record in the same pass.
+    """
+
+    return _load_module(module, path, source)
+
+
+def validate_modules(modules: Iterable[dict], source: Path, start: int=0) -> None:
+    """
+    Validates each module object of an iterable. Indices in error paths begin at the given start
+    index so a batch of changed modules can be checked in the context of the whole list.
+    """
+
+    _check_modules(modules, source, start)
+
+
+def validate_header(model: dict, source: Path) -> None:
+    """
+    Validates the project properties of a configuration model without checking its modules.
+    """
+
+    _check_header(model, '', source)
+
+
+def _modules_list(model: dict, source: Path) -> list:
+    """
+    Returns the modules list of a configuration model, raising an exception if it is missing or is
+    not a list.
+    """
+
+    modules = model.get('modules', _MISSING)
+
+    if modules is _MISSING:
+        _fail(source, 'modules', 'missing required property')
+    if modules.__class__ is not list:
+        _fail(source, 'modules', 'expected a list')
+
+    return modules
+
+
+def validate_model(model: dict, source: Path) -> None:
+    """
+    Validates an entire configuration model including every module.
+    """
+
+    validate_header(model, source)
+    validate_modules(_modules_list(model, source), source)
+
+
+def load_record(model: dict, source: Path) -> ProjectRecord:
+    """
+    Validates an entire configuration model and converts it to a project record in a single pass.
+    Raises a malformed data exception naming the precise path of the first invalid value.
+    """
+
+    # Validate the project properties and the type of the modules list.
+    validate_header(model, source)
+    modules = _modules_list(model, source)
+
+    return ProjectRecord(
+        UUID(model['uuid']),
+        model['name'],
+        date.fromisoformat(model['creation_date']),
+        model.get('author'),
+        model.get('desc'),
+        _load_modules(modules, source))
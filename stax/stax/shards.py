@@ -0,0 +1,284 @@
+"""
+shards.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Provides a storage backend that stores the modules of a stax project configuration as one small
+shard file per module plus a compact manifest that records the module order.
+"""
+
+from pathlib import Path
+from typing import Iterator, Iterable
+from urllib.parse import quote
+import json
+import shutil as shu
+import fcntl
+import pywbu.filesystem as fs
+from pywbu.exc import MalformedDataException
+from pywbu.annotations import override
+from stax.records import ModuleRecord
+from stax.schema import load_module
+from stax.storage import StorageBackend
+
+
+MANIFEST_FILE_NAME = 'manifest.json'
+"""
+The name of the manifest file that lists every sharded module. Its presence in the metadata
+directory indicates that the project uses the sharded layout.
+"""
+
+MANIFEST_LOCK_FILE_NAME = 'manifest.lock'
+"""
+The name of the lock file used to serialize changes to the manifest.
+"""
+
+SHARDS_DIR_NAME = 'shards'
+"""
+The name of the directory within the metadata directory that holds the module shard files.
+"""
+
+MANIFEST_VERSION = 1
+"""
+The version of the manifest file format.
+"""
+
+
+def shard_name(module_name: str) -> str:
+    """
+    Returns the name of the shard file holding the module with the given name. The name is derived
+    from the module name alone so a module's shard can be found without reading the manifest.
+    Uppercase letters are percent-encoded too, so names differing only in case (such as "Api" and
+    "api") get distinct shards on case-insensitive file systems.
+    """
+
+    # Percent-encode anything that is unsafe in a file name, including uppercase letters and a
+    # leading dot. Escapes use uppercase hex digits and no other uppercase letters remain, so the
+    # encoding stays unique when case is ignored.
+    encoded = ''.join(f'%{ord(char):02X}' if 'A' <= char <= 'Z' else quote(char, safe='')
+                      for char in module_name)
+    if encoded.startswith('.'):
+        encoded = '%2E' + encoded[1:]
+
+    return f'{encoded}.json'
+
+
+class ShardedBackend(StorageBackend):
+    """
+    Stores module records in shard files within a project metadata directory. Each
+    module is stored in its own shard file so reading or updating one module touches only that
+    module's bytes and independent modules can be updated concurrently. The manifest maps each
+    module name to its shard and the shard's modification time when the entry was written. The
+    manifest is only rewritten when a module is added.
+    """
+
+    layout = 'sharded'
+
+    meta_dir: Path
+    """
+    The canonical path to the metadata directory holding the manifest and shards.
+    """
+
+    manifest_path: Path
+    """
+    The canonical path to the manifest file.
+    """
+
+    shards_dir: Path
+    """
+    The canonical path to the directory holding the shard files.
+    """
+
+
+    def __init__(self, meta_dir: Path) -> None:
+        """
+        Creates a sharded backend for the given metadata directory. No files are created.
+        """
+
+        self.meta_dir = meta_dir
+        self.manifest_path = meta_dir / MANIFEST_FILE_NAME
+        self.shards_dir = meta_dir / SHARDS_DIR_NAME
+
+
+    @override
+    def exists(self) -> bool:
+        """
+        Determines whether the metadata directory uses the sharded layout.
+        """
+
+        return self.manifest_path.is_file()
+
+
+    @override
+    def stamp(self) -> list[int]:
+        """
+        Returns the modification times in nanoseconds of the manifest and the shards directory.
+        Shards are written by renaming a temporary file into the shards directory which updates
+        the directory's modification time, so the stamp changes whenever any module changes
+        without statting every shard.
+        """
+
+        return [self.manifest_path.stat().st_mtime_ns, self.shards_dir.stat().st_mtime_ns]
+
+
+    def __manifest(self) -> dict:
+        """
+        Reads the manifest into a dictionary mapping module names to their entries.
+        """
+
+        # Open the manifest for reading in an auto-closeable block.
+        with open(self.manifest_path, 'r') as file:
+            data = json.load(file)
+
+        # Ensure the manifest is in a recognized format.
+        if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION:
+            raise MalformedDataException(f'Malformed manifest file "{self.manifest_path}".')
+
+        return data['modules']
+
+
+    def __write_manifest(self, entries: dict) -> None:
+        """
+        Atomically writes the given dictionary of module entries as the manifest.
+        """
+
+        with fs.atomic_open(self.manifest_path) as file:
+            json.dump({'version': MANIFEST_VERSION, 'modules': entries}, file,
+                      separators=(',', ':'))
+
+
+    def __write_shard(self, module: ModuleRecord) -> int:
+        """
+        Atomically writes the given module record to its shard file. Returns the modification time
+        of the shard in nanoseconds.
+        """
+
+        path = self.shards_dir / shard_name(module.name)
+
+        with fs.atomic_open(path) as file:
+            json.dump(module.to_dict(), file)
+
+        return path.stat().st_mtime_ns
+
+
+    def names(self) -> list[str]:
+        """
+        Returns the names of every module in manifest order.
+        """
+
+        return list(self.__manifest())
+
+
+    @override
+    def get(self, name: str) -> ModuleRecord:
+        """
+        Returns the record of the module with the given name or None if no such module exists. Only
+        the module's shard is read.
+        """
+
+        # Try to read and validate the shard file derived from the module name.
+        path = self.shards_dir / shard_name(name)
+        try:
+            with open(path, 'r') as file:
+                return load_module(json.load(file), 'module', path)
+
+        # A missing shard means the module does not exist.
+        except FileNotFoundError:
+            return None
+
+
+    @override
+    def iter(self) -> Iterator[ModuleRecord]:
+        """
+        Streams the module records one shard at a time in manifest order.
+        """
+
+        for name, entry in self.__manifest().items():
+            path = self.shards_dir / entry['shard']
+            with open(path, 'r') as file:
+                yield load_module(json.load(file), 'module', path)
+
+
+    @override
+    def set(self, module: ModuleRecord) -> bool:
+        """
+        Sets the given module record. If the module already exists only its shard is rewritten and
+        true is returned. Otherwise the shard is written, the module is appended to the manifest
+        under an exclusive lock, and false is returned.
+        """
+
+        # An existing module only needs its own shard replaced.
+        shard_path = self.shards_dir / shard_name(module.name)
+        if shard_path.is_file():
+            self.__write_shard(module)
+            return True
+
+        # Hold the manifest lock while adding so concurrent additions are not lost.
+        with open(self.meta_dir / MANIFEST_LOCK_FILE_NAME, 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            # Write the shard and then register it in a freshly read manifest.
+            mtime = self.__write_shard(module)
+            entries = self.__manifest()
+            existed = module.name in entries
+            entries[module.name] = {'shard': shard_path.name, 'mtime': mtime}
+            self.__write_manifest(entries)
+
+        return existed
+
+
+    @override
+    def set_many(self, modules: Iterable[ModuleRecord]) -> int:
+        """
+        Sets each of the given module records, which must have distinct names. Every shard is
+        written and then the new modules are registered with a single manifest rewrite under the
+        exclusive lock. Returns the number of modules that already existed.
+        """
+
+        # Hold the manifest lock for the whole batch so concurrent additions are not lost.
+        with open(self.meta_dir / MANIFEST_LOCK_FILE_NAME, 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+
+            # Write each shard and register it in a freshly read manifest.
+            entries = self.__manifest()
+            found = 0
+            for module in modules:
+                found += module.name in entries
+                entries[module.name] = {'shard': shard_name(module.name),
+                                        'mtime': self.__write_shard(module)}
+
+            self.__write_manifest(entries)
+
+        return found
+
+
+    @override
+    def create(self, modules: Iterable[ModuleRecord]) -> None:
+        """
+        Creates the sharded layout holding the given module records. Any existing layout is
+        replaced.
+        """
+
+        # Create the shards directory and write each shard.
+        self.shards_dir.mkdir(511, False, True)
+        entries = {}
+        for module in modules:
+            entries[module.name] = {'shard': shard_name(module.name),
+                                    'mtime': self.__write_shard(module)}
+
+        # Write the manifest last since its presence enables the layout.
+        self.__write_manifest(entries)
+
+
+    @override
+    def destroy(self) -> None:
+        """
+        Removes the sharded layout. The manifest is removed first so the layout is disabled before
+        the shards are deleted.
+        """
+
+        self.manifest_path.unlink(True)
+        (self.meta_dir / MANIFEST_LOCK_FILE_NAME).unlink(True)
+        shu.rmtree(self.shards_dir, ignore_errors=True)
@@ -0,0 +1,312 @@
+"""
+sqlite.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Provides a storage backend that stores the modules of a stax project configuration in an SQLite
+database within the project metadata directory.
+"""
+
+from pathlib import Path
+from typing import Iterator, Iterable
+from datetime import date
+import os
+import json
+import sqlite3
+import threading
+from pywbu.annotations import override
+from stax.records import ModuleRecord
+from stax.storage import StorageBackend
+
+
+DATABASE_FILE_NAME = 'config.db'
+"""
+The name of the SQLite database file. Its presence in the metadata directory indicates that the
+project uses the SQLite layout.
+"""
+
+BUSY_TIMEOUT = 30.0
+"""
+The number of seconds a connection waits for another writer to release the database lock.
+"""
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS modules (
+        seq INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE,
+        creation_date INTEGER NOT NULL,
+        desc TEXT,
+        depends_on TEXT
+    );
+    CREATE INDEX IF NOT EXISTS modules_creation_date ON modules (creation_date);
+    PRAGMA user_version = 1;
+'''
+"""
+The database schema. Rows are kept in insertion order by the integer primary key, names are
+indexed by the uniqueness constraint, and creation dates (stored as ordinals) have their own index.
+Dependencies are stored as a JSON list of module names or null if there are none.
+"""
+
+SCHEMA_VERSION = 1
+"""
+The version of the database schema, stored in the database's user version. Databases created before
+the dependencies column existed have version 0 and are migrated when first opened.
+"""
+
+MIGRATIONS = {
+    0: 'ALTER TABLE modules ADD COLUMN depends_on TEXT; PRAGMA user_version = 1;'
+}
+"""
+The script that migrates a database from each old schema version to the next version.
+"""
+
+# The statements used by the backend. They are constant strings so the sqlite3 module compiles each
+# one once per connection and reuses the prepared statement from its statement cache.
+SELECT_ALL = 'SELECT name, creation_date, desc, depends_on FROM modules ORDER BY seq'
+SELECT_ONE = 'SELECT name, creation_date, desc, depends_on FROM modules WHERE name = ?'
+SELECT_EXISTS = 'SELECT 1 FROM modules WHERE name = ?'
+SELECT_COUNT = 'SELECT COUNT(*) FROM modules'
+UPSERT = 'INSERT INTO modules (name, creation_date, desc, depends_on) VALUES (?, ?, ?, ?) ' \
+    + 'ON CONFLICT (name) DO UPDATE SET creation_date = excluded.creation_date, ' \
+    + 'desc = excluded.desc, depends_on = excluded.depends_on'
+
+
+def _record(row: tuple) -> ModuleRecord:
+    """
+    Converts a database row into a module record.
+    """
+
+    return ModuleRecord(row[0], date.fromordinal(row[1]), row[2],
+                        json.loads(row[3]) if row[3] else ())
+
+
+def _row(module: ModuleRecord) -> tuple:
+    """
+    Converts a module record into database row parameters.
+    """
+
+    return (module.name, module.ordinal, module.desc,
+            json.dumps(module.depends_on) if module.depends_on else None)
+
+
+class SqliteBackend(StorageBackend):
+    """
+    Stores module records in an SQLite database. The database runs in write-ahead logging mode so
+    readers are never blocked by a writer, and each thread uses its own connection.
+    """
+
+    layout = 'sqlite'
+
+    path: Path
+    """
+    The canonical path to the database file.
+    """
+
+    __local: threading.local
+    """
+    Holds the database connection of each thread.
+    """
+
+
+    def __init__(self, meta_dir: Path) -> None:
+        """
+        Creates an SQLite backend for the given metadata directory. No files are created.
+        """
+
+        self.path = meta_dir / DATABASE_FILE_NAME
+        self.__local = threading.local()
+
+
+    def __connect(self, path: Path) -> sqlite3.Connection:
+        """
+        Opens and configures a connection to the database at the given path.
+        """
+
+        # Use autocommit mode so transactions are controlled explicitly.
+        connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None)
+
+        # Use write-ahead logging so readers proceed concurrently with a writer. Synchronizing only
+        # at checkpoints is durable across application crashes in this mode.
+        connection.execute('PRAGMA journal_mode = WAL')
+        connection.execute('PRAGMA synchronous = NORMAL')
+
+        return connection
+
+
+    def __connection(self) -> sqlite3.Connection:
+        """
+        Returns the calling thread's connection to the database, opening it if necessary.
+        """
+
+        connection = getattr(self.__local, 'connection', None)
+
+        if connection is None:
+            connection = self.__local.connection = self.__connect(self.path)
+            self.__migrate(connection)
+
+        return connection
+
+
+    def __migrate(self, connection: sqlite3.Connection) -> None:
+        """
+        Migrates the database to the current schema version if it was created by an older version.
+        """
+
+        # Check the version cheaply before taking the write lock.
+        if connection.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+            return
+
+        # Apply each migration in order within one write transaction, checking the version again
+        # in case another connection migrated the database first.
+        with connection:
+            connection.execute('BEGIN IMMEDIATE')
+            version = connection.execute('PRAGMA user_version').fetchone()[0]
+            while version < SCHEMA_VERSION:
+                for statement in MIGRATIONS[version].split(';'):
+                    if statement.strip():
+                        connection.execute(statement)
+                version += 1
+
+
+    def close(self) -> None:
+        """
+        Closes the calling thread's connection to the database if it is open.
+        """
+
+        connection = getattr(self.__local, 'connection', None)
+
+        if connection is not None:
+            connection.close()
+            self.__local.connection = None
+
+
+    @override
+    def exists(self) -> bool:
+        """
+        Determines whether the database file exists.
+        """
+
+        return self.path.is_file()
+
+
+    @override
+    def stamp(self) -> list[int]:
+        """
+        Returns the modification times in nanoseconds and sizes of the database file and its
+        write-ahead log. Every committed write changes the log (or the database after a
+        checkpoint).
+        """
+
+        stamp = []
+
+        for path in (self.path, self.path.with_name(self.path.name + '-wal')):
+            try:
+                stat = path.stat()
+                stamp += [stat.st_mtime_ns, stat.st_size]
+            except FileNotFoundError:
+                stamp += [0, 0]
+
+        return stamp
+
+
+    @override
+    def iter(self) -> Iterator[ModuleRecord]:
+        """
+        Streams the module records in insertion order.
+        """
+
+        for row in self.__connection().execute(SELECT_ALL):
+            yield _record(row)
+
+
+    @override
+    def get(self, name: str) -> ModuleRecord:
+        """
+        Returns the record of the module with the given name or None if no such module exists. The
+        lookup uses the name index.
+        """
+
+        row = self.__connection().execute(SELECT_ONE, (name,)).fetchone()
+        return _record(row) if row else None
+
+
+    @override
+    def set(self, module: ModuleRecord) -> bool:
+        """
+        Sets the given module record with a single upsert. An existing module keeps its position.
+        Returns true if the module already existed.
+        """
+
+        connection = self.__connection()
+
+        # Check for an existing module and upsert within one write transaction.
+        with connection:
+            connection.execute('BEGIN IMMEDIATE')
+            existed = connection.execute(SELECT_EXISTS, (module.name,)).fetchone() is not None
+            connection.execute(UPSERT, _row(module))
+
+        return existed
+
+
+    @override
+    def set_many(self, modules: Iterable[ModuleRecord]) -> int:
+        """
+        Sets every given module record, which must have distinct names, within a single
+        transaction. Returns the number of modules that already existed, found from the growth of
+        the table.
+        """
+
+        connection = self.__connection()
+        rows = list(map(_row, modules))
+
+        with connection:
+            connection.execute('BEGIN IMMEDIATE')
+            before = connection.execute(SELECT_COUNT).fetchone()[0]
+            connection.executemany(UPSERT, rows)
+            after = connection.execute(SELECT_COUNT).fetchone()[0]
+
+        return len(rows) - (after - before)
+
+
+    @override
+    def create(self, modules: Iterable[ModuleRecord]) -> None:
+        """
+        Creates the database holding the given module records. The database is built under a
+        temporary name and renamed into place so it only becomes active once complete.
+        """
+
+        # Remove any leftovers of an interrupted creation.
+        temp_path = self.path.with_name(f'.{self.path.name}.tmp')
+        for suffix in ('', '-wal', '-shm'):
+            Path(f'{temp_path}{suffix}').unlink(True)
+
+        # Build the database and insert every module in one transaction.
+        connection = self.__connect(temp_path)
+        try:
+            connection.executescript(SCHEMA)
+            with connection:
+                connection.execute('BEGIN IMMEDIATE')
+                connection.executemany(UPSERT, map(_row, modules))
+
+        # Closing the last connection checkpoints and removes the write-ahead log.
+        finally:
+            connection.close()
+
+        # Close this thread's connection to any replaced database and move the new one into place.
+        self.close()
+        os.replace(temp_path, self.path)
+
+
+    @override
+    def destroy(self) -> None:
+        """
+        Removes the database file and its write-ahead log.
+        """
+
+        self.close()
+
+        for suffix in ('', '-wal', '-shm'):
+            Path(f'{self.path}{suffix}').unlink(True)
@@ -0,0 +1,324 @@
+"""
+storage.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Defines the abstract interface of the backends that store the modules of a stax project
+configuration as well as the default backend that stores them in the configuration file itself.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterator, Iterable
+import json
+from pywbu.annotations import override
+import pywbu.filesystem as fs
+from stax.records import ModuleRecord
+from stax.stream import iter_modules, iter_module_dicts, read_header
+from stax.encoder import JSON_INDENT, write_model
+
+
+class StorageBackend(ABC):
+    """
+    Represents an abstract backend that stores the module records of a project configuration. The
+    project properties always remain in the configuration file. Each backend keeps its data in the
+    project metadata directory and the presence of that data determines which backend is active.
+    """
+
+    layout: str
+    """
+    The name of the storage layout implemented by the backend.
+    """
+
+
+    @abstractmethod
+    def exists(self) -> bool:
+        """
+        Determines whether the backend's data exists in the metadata directory.
+        """
+
+        pass
+
+
+    @abstractmethod
+    def stamp(self) -> list[int]:
+        """
+        Returns a list of integers that changes whenever any stored module changes. The stamp must
+        be cheap to compute and must not require reading every module.
+        """
+
+        pass
+
+
+    @abstractmethod
+    def iter(self) -> Iterator[ModuleRecord]:
+        """
+        Streams the stored module records in their stored order.
+        """
+
+        pass
+
+
+    @abstractmethod
+    def get(self, name: str) -> ModuleRecord:
+        """
+        Returns the record of the module with the given name or None if no such module exists.
+        """
+
+        pass
+
+
+    @abstractmethod
+    def set(self, module: ModuleRecord) -> bool:
+        """
+        Sets the given module record. If a module with the same name already exists it is replaced
+        in place and true is returned. Otherwise the module is appended and false is returned.
+        """
+
+        pass
+
+
+    def set_many(self, modules: Iterable[ModuleRecord]) -> int:
+        """
+        Sets each of the given module records, which must have distinct names. Returns the number
+        of modules that already existed. Backends override this to write the whole batch at once.
+        """
+
+        return sum(self.set(module) for module in modules)
+
+
+    @abstractmethod
+    def create(self, modules: Iterable[ModuleRecord]) -> None:
+        """
+        Creates the backend's data holding exactly the given module records, replacing any existing
+        data.
+        """
+
+        pass
+
+
+    @abstractmethod
+    def destroy(self) -> None:
+        """
+        Removes the backend's data. Missing data is ignored.
+        """
+
+        pass
+
+
+class FileBackend(StorageBackend):
+    """
+    Stores the module records in the "modules" list of the configuration file. This is the default
+    backend and is active whenever no other backend's data exists.
+    """
+
+    layout = 'file'
+
+    path: Path
+    """
+    The canonical path to the configuration file.
+    """
+
+
+    def __init__(self, path: Path) -> None:
+        """
+        Creates a file backend for the configuration file at the given path.
+        """
+
+        self.path = path
+
+
+    def read(self) -> dict:
+        """
+        Reads the configuration file into a configuration model object.
+        """
+
+        # Open the configuration file for reading in an auto-closeable block.
+        with open(self.path, 'r') as file:
+
+            # Read the model object from the JSON in the configuration file.
+            return json.load(file)
+
+
+    def write(self, model: dict) -> None:
+        """
+        Writes a model dictionary object to the configuration file. The file must already exist.
+        """
+
+        # Split the modules list from the header properties and stream both to the file.
+        header = {key: value for key, value in model.items() if key != 'modules'}
+        self.write_stream(header, model.get('modules', []))
+
+
+    def write_stream(self, header: dict, modules: Iterable) -> None:
+        """
+        Writes the given header properties followed by each module drawn from an iterable of module
+        records or dictionaries. Modules are encoded one at a time into a temporary file which then
+        atomically replaces the configuration file, so the iterable may lazily read the current
+        configuration file. The output is identical to json.dump with the configured indent.
+        """
+
+        with fs.atomic_open(self.path) as file:
+            write_model(file, header, modules)
+
+
+    @override
+    def exists(self) -> bool:
+        """
+        Determines whether the configuration file exists.
+        """
+
+        return self.path.is_file()
+
+
+    @override
+    def stamp(self) -> list[int]:
+        """
+        Returns the modification time in nanoseconds and size of the configuration file.
+        """
+
+        stat = self.path.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+
+
+    @override
+    def iter(self) -> Iterator[ModuleRecord]:
+        """
+        Streams the module records from the configuration file without loading the whole model.
+        """
+
+        return iter_modules(self.path)
+
+
+    @override
+    def get(self, name: str) -> ModuleRecord:
+        """
+        Returns the record of the module with the given name or None if no such module exists.
+        """
+
+        # Stream the modules until the named module is found.
+        for module in self.iter():
+            if module.name == name:
+                return module
+
+        return None
+
+
+    @override
+    def set(self, module: ModuleRecord) -> bool:
+        """
+        Sets the given module record in the configuration file. If a module with the same name
+        already exists it is replaced and true is returned. The configuration file is streamed
+        through the encoder so only one module is held in memory at a time.
+        """
+
+        # Serialize the module record once and track whether it was found while streaming.
+        module_model = module.to_dict()
+        found = False
+
+        def modules() -> Iterator[dict]:
+            """
+            Streams the current raw modules, substituting the given module for an existing module
+            with the same name, and appends the given module if it was not found.
+            """
+
+            nonlocal found
+
+            for existing in iter_module_dicts(self.path):
+                if existing.get('name') == module.name:
+                    found = True
+                    yield module_model
+                else:
+                    yield existing
+
+            if not found:
+                yield module_model
+
+        # Rewrite the configuration file from its own header and the substituted modules.
+        self.write_stream(read_header(self.path), modules())
+
+        return found
+
+
+    @override
+    def set_many(self, modules: Iterable[ModuleRecord]) -> int:
+        """
+        Sets each of the given module records, which must have distinct names, with a single
+        streamed rewrite of the configuration file. Existing modules are replaced in place and new
+        modules are appended in the given order. Returns the number of modules that already
+        existed.
+        """
+
+        # Serialize each module record once keyed by name.
+        pending = {module.name: module.to_dict() for module in modules}
+        found = 0
+
+        def modules() -> Iterator[dict]:
+            """
+            Streams the current raw modules, substituting the given modules for existing modules
+            with the same names, and appends the given modules that were not found.
+            """
+
+            nonlocal found
+
+            for existing in iter_module_dicts(self.path):
+                replacement = pending.pop(existing.get('name'), None)
+                if replacement is not None:
+                    found += 1
+                    yield replacement
+                else:
+                    yield existing
+
+            yield from pending.values()
+
+        # Rewrite the configuration file from its own header and the substituted modules.
+        self.write_stream(read_header(self.path), modules())
+
+        return found
+
+
+    @override
+    def create(self, modules: Iterable[ModuleRecord]) -> None:
+        """
+        Replaces the modules list in the configuration file with the given module records.
+        """
+
+        self.write_stream(read_header(self.path), modules)
+
+
+    @override
+    def destroy(self) -> None:
+        """
+        Empties the modules list in the configuration file. The project properties are kept.
+        """
+
+        self.create([])
+
+
+def transfer(source: StorageBackend, target: StorageBackend) -> int:
+    """
+    Copies every module record from the source backend into newly created data for the target
+    backend. The source data is left untouched. Modules are streamed from the source into the
+    target one at a time. Returns the number of modules copied.
+    """
+
+    # Count the modules as they are streamed into the target.
+    count = 0
+
+    def modules() -> Iterator[ModuleRecord]:
+        """
+        Streams the source modules while counting them.
+        """
+
+        nonlocal count
+
+        for module in source.iter():
+            count += 1
+            yield module
+
+    target.create(modules())
+
+    return count
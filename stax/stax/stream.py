@@ -0,0 +1,276 @@
+"""
+stream.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Provides an incremental JSON reader that streams module records out of a stax project configuration
+file while holding only a bounded window of the file in memory.
+"""
+
+from pathlib import Path
+from typing import Iterator, Any
+import re
+import json
+from pywbu.exc import MalformedDataException
+from stax.records import ModuleRecord
+from stax.schema import load_module
+
+
+CHUNK_SIZE = 64 * 1024
+"""
+The number of characters read from the configuration file at a time.
+"""
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+"""
+Matches a run of the characters that JSON treats as insignificant whitespace between tokens.
+"""
+
+
+class _Scanner(object):
+    """
+    Scans JSON tokens and values from a text file through a sliding buffer. Consumed text is
+    discarded as the scanner advances so memory is bounded by the largest single value scanned
+    plus one chunk.
+    """
+
+    __file: Any
+    """
+    The text file being scanned.
+    """
+
+    __path: Path
+    """
+    The path of the file being scanned. Used for error messages.
+    """
+
+    __buffer: str
+    """
+    The window of the file that has been read but not yet fully consumed.
+    """
+
+    __pos: int
+    """
+    The position of the next unconsumed character within the buffer.
+    """
+
+    __eof: bool
+    """
+    Whether the end of the file has been reached.
+    """
+
+    __decoder: json.JSONDecoder
+    """
+    The decoder used to parse complete JSON values from the buffer.
+    """
+
+
+    def __init__(self, file: Any, path: Path) -> None:
+        """
+        Creates a new scanner over an open text file.
+        """
+
+        self.__file = file
+        self.__path = path
+        self.__buffer = ''
+        self.__pos = 0
+        self.__eof = False
+        self.__decoder = json.JSONDecoder()
+
+
+    def __fill(self) -> bool:
+        """
+        Reads another chunk into the buffer, discarding the consumed prefix first. Returns false if
+        the end of the file has already been reached.
+        """
+
+        # Nothing more can be read once the end of the file is reached.
+        if self.__eof:
+            return False
+
+        # Drop the consumed prefix so the buffer never grows beyond the unconsumed window.
+        self.__buffer = self.__buffer[self.__pos:]
+        self.__pos = 0
+
+        # Read the next chunk and record whether the end of the file was reached.
+        chunk = self.__file.read(CHUNK_SIZE)
+        if not chunk:
+            self.__eof = True
+            return False
+
+        self.__buffer += chunk
+        return True
+
+
+    def malformed(self, reason: str) -> MalformedDataException:
+        """
+        Creates an exception describing malformed data at the current position.
+        """
+
+        return MalformedDataException(f'Malformed configuration file "{self.__path}": {reason}.')
+
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next significant character without consuming it. Returns
+        an empty string at the end of the file.
+        """
+
+        while True:
+
+            # Skip any whitespace in the buffer.
+            self.__pos = WHITESPACE.match(self.__buffer, self.__pos).end()
+
+            # Return the next character if one is buffered, otherwise read more.
+            if self.__pos < len(self.__buffer):
+                return self.__buffer[self.__pos]
+
+            if not self.__fill():
+                return ''
+
+
+    def expect(self, chars: str) -> str:
+        """
+        Consumes the next significant character and returns it. Raises an exception if it is not
+        one of the given characters.
+        """
+
+        char = self.peek()
+
+        if not char or char not in chars:
+            found = repr(char) if char else 'end of file'
+            raise self.malformed(f'expected one of {list(chars)} but found {found}')
+
+        self.__pos += 1
+        return char
+
+
+    def value(self) -> Any:
+        """
+        Decodes and consumes the next complete JSON value.
+        """
+
+        # Position the buffer at the start of the value.
+        if not self.peek():
+            raise self.malformed('unexpected end of file')
+
+        while True:
+
+            # Try to decode a value from the buffered text. A value that ends exactly at the end of
+            # the buffer may be a truncated number or literal so it is only accepted at the end of
+            # the file.
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__pos)
+                if end < len(self.__buffer) or self.__eof:
+                    self.__pos = end
+                    return value
+
+            # A decoding error may only mean the value is not fully buffered yet.
+            except json.JSONDecodeError as exc:
+                if self.__eof:
+                    raise self.malformed(exc.msg)
+
+            # Read more of the file and try again. The unconsumed value start is preserved.
+            self.__fill()
+
+
+def _scan_model(path: Path, header: dict=None, mode: str='record') -> Iterator[Any]:
+    """
+    Scans the configuration file at the given path and yields each module in file order. In the
+    "record" mode modules are yielded as module records, in the "dict" mode they are yielded as raw
+    dictionaries, and in the "skip" mode they are skipped and nothing is yielded. If a header
+    dictionary is given every property other than the modules list is stored in it.
+    """
+
+    # Open the configuration file for reading in an auto-closeable block.
+    with open(path, 'r') as file:
+        scanner = _Scanner(file, path)
+
+        # The model must be a JSON object.
+        scanner.expect('{')
+
+        # An empty object has no modules.
+        if scanner.peek() == '}':
+            return
+
+        while True:
+
+            # Read the next property key.
+            if scanner.peek() != '"':
+                raise scanner.malformed('expected a property name')
+            key = scanner.value()
+            scanner.expect(':')
+
+            # Stream the modules list one element at a time.
+            if key == 'modules':
+                scanner.expect('[')
+
+                if scanner.peek() == ']':
+                    scanner.expect(']')
+
+                else:
+                    index = 0
+                    while True:
+
+                        # Skip the module if modules are not being yielded.
+                        if mode == 'skip':
+                            scanner.value()
+
+                        # Yield the raw module dictionary if requested.
+                        elif mode == 'dict':
+                            yield scanner.value()
+
+                        # Otherwise decode a single module and validate it into a record.
+                        else:
+                            yield load_module(scanner.value(), f'modules[{index}]', path)
+
+                        # Continue to the next module or finish the list.
+                        index += 1
+                        if scanner.expect(',]') == ']':
+                            break
+
+            # Decode any other property value and keep it if requested.
+            else:
+                value = scanner.value()
+                if header is not None:
+                    header[key] = value
+
+            # Continue to the next property or finish the object.
+            if scanner.expect(',}') == '}':
+                return
+
+
+def iter_modules(path: Path) -> Iterator[ModuleRecord]:
+    """
+    Streams the module records from the configuration file at the given path in file order. Only
+    one module is decoded at a time so memory use does not depend on the number of modules. The
+    file is closed as soon as the iterator is exhausted or closed.
+    """
+
+    return _scan_model(path)
+
+
+def iter_module_dicts(path: Path) -> Iterator[dict]:
+    """
+    Streams the raw module dictionaries from the configuration file at the given path in file
+    order without converting them to records.
+    """
+
+    return _scan_model(path, mode='dict')
+
+
+def read_header(path: Path) -> dict:
+    """
+    Reads every property of the configuration file at the given path other than the modules list.
+    The modules are skipped one at a time without being kept in memory.
+    """
+
+    # Exhaust the scan without decoding modules, collecting the header properties.
+    header = {}
+    for _ in _scan_model(path, header, 'skip'):
+        pass
+
+    return header
@@ -0,0 +1,233 @@
+"""
+table.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Provides an optional columnar, NumPy-backed view of the modules in stax project configurations for
+vectorized analytics.
+"""
+
+from datetime import date
+from stax.records import ModuleRecord, ProjectRecord
+
+# NumPy is an optional dependency that is only needed for the columnar analytics view.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+"""
+The proleptic Gregorian ordinal of the Unix epoch, which is the zero point of NumPy datetime64.
+"""
+
+
+def numpy_available() -> bool:
+    """
+    Determines whether NumPy is installed and the columnar view can be used.
+    """
+
+    return np is not None
+
+
+def require_numpy() -> None:
+    """
+    Raises an exception if NumPy is not installed.
+    """
+
+    if np is None:
+        raise ImportError('The columnar module table requires NumPy. Install it with ' \
+                          + '"pip3 install numpy" or "pip3 install stax[stats]".')
+
+
+class ModuleTable(object):
+    """
+    Produces columnar views of module records. Each column is a NumPy array with one entry per
+    module so filters, group-bys, and histograms run vectorized rather than per record.
+    """
+
+    names: 'np.ndarray'
+    """
+    A unicode string array of module names.
+    """
+
+    creation_dates: 'np.ndarray'
+    """
+    A datetime64[D] array of module creation dates.
+    """
+
+    has_desc: 'np.ndarray'
+    """
+    A boolean array indicating whether each module has a description.
+    """
+
+    authors: 'np.ndarray'
+    """
+    A unicode string array of the author of the project each module belongs to. An empty string
+    indicates the project has no author.
+    """
+
+
+    def __init__(
+            self,
+            names: 'np.ndarray',
+            creation_dates: 'np.ndarray',
+            has_desc: 'np.ndarray',
+            authors: 'np.ndarray') -> None:
+        """
+        Creates a module table from existing, equally sized column arrays.
+        """
+
+        # Ensure NumPy is available before anything else.
+        require_numpy()
+
+        self.names = names
+        self.creation_dates = creation_dates
+        self.has_desc = has_desc
+        self.authors = authors
+
+
+    def __len__(self) -> int:
+        """
+        Returns the number of modules (rows) in the table.
+        """
+
+        return len(self.names)
+
+
+    @classmethod
+    def from_modules(cls, modules: list[ModuleRecord], author: str=None) -> 'ModuleTable':
+        """
+        Creates a module table from a list of module records. The optional project author is
+        assigned to every row.
+        """
+
+        # Ensure NumPy is available before building any arrays.
+        require_numpy()
+
+        # Build the date column from integer ordinals in one conversion rather than parsing each
+        # date through NumPy individually.
+        ordinals = np.fromiter((module.ordinal for module in modules), np.int64, len(modules))
+        creation_dates = (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+
+        # Build the remaining columns.
+        names = np.array([module.name for module in modules], dtype=np.str_)
+        has_desc = np.fromiter((bool(module.desc) for module in modules), np.bool_, len(modules))
+        authors = np.full(len(modules), author or '')
+
+        return cls(names, creation_dates, has_desc, authors)
+
+
+    @classmethod
+    def from_projects(cls, projects: list[ProjectRecord]) -> 'ModuleTable':
+        """
+        Creates a single module table spanning the modules of every given project record.
+        """
+
+        # Build a table per project then concatenate the columns.
+        return cls.concat([cls.from_modules(proj.modules, proj.author) for proj in projects])
+
+
+    @classmethod
+    def concat(cls, tables: list['ModuleTable']) -> 'ModuleTable':
+        """
+        Concatenates the rows of several module tables into one table.
+        """
+
+        # Ensure NumPy is available before building any arrays.
+        require_numpy()
+
+        # An empty list of tables produces an empty table.
+        if not tables:
+            return cls.from_modules([])
+
+        return cls(
+            np.concatenate([table.names for table in tables]),
+            np.concatenate([table.creation_dates for table in tables]),
+            np.concatenate([table.has_desc for table in tables]),
+            np.concatenate([table.authors for table in tables]))
+
+
+    def select(self, mask: 'np.ndarray') -> 'ModuleTable':
+        """
+        Returns a new table containing only the rows where the boolean mask is true.
+        """
+
+        return ModuleTable(
+            self.names[mask],
+            self.creation_dates[mask],
+            self.has_desc[mask],
+            self.authors[mask])
+
+
+    def created_between(self, start: date=None, end: date=None) -> 'ModuleTable':
+        """
+        Returns a new table containing only the modules created within the inclusive date range.
+        A bound of None leaves that side of the range open.
+        """
+
+        # Start with every row selected and narrow the mask with each given bound.
+        mask = np.ones(len(self), dtype=np.bool_)
+
+        if start is not None:
+            mask &= self.creation_dates >= np.datetime64(start, 'D')
+
+        if end is not None:
+            mask &= self.creation_dates <= np.datetime64(end, 'D')
+
+        return self.select(mask)
+
+
+    def counts_by_month(self) -> dict[str, int]:
+        """
+        Returns the number of modules created in each month keyed by a "YYYY-MM" string in
+        chronological order.
+        """
+
+        # Truncate the dates to months and count the unique values.
+        months, counts = np.unique(self.creation_dates.astype('datetime64[M]'), return_counts=True)
+
+        return {str(month): int(count) for month, count in zip(months, counts)}
+
+
+    def counts_by_author(self) -> dict[str, int]:
+        """
+        Returns the number of modules belonging to projects of each author. Modules of projects
+        without an author are counted under an empty string.
+        """
+
+        # Count the unique author values.
+        authors, counts = np.unique(self.authors, return_counts=True)
+
+        return {str(author): int(count) for author, count in zip(authors, counts)}
+
+
+    def ages(self, today: date=None) -> 'np.ndarray':
+        """
+        Returns an integer array of the age in days of each module relative to the given date. By
+        default the current date is used.
+        """
+
+        # Use the current date if none was given.
+        today = today or date.today()
+
+        return (np.datetime64(today, 'D') - self.creation_dates).astype(np.int64)
+
+
+    def age_histogram(self, bins: int=10, today: date=None) -> tuple[list[int], list[float]]:
+        """
+        Returns a histogram of module ages in days relative to the given date as a tuple of the
+        bin counts and the bin edges. By default the current date is used.
+        """
+
+        # An empty table has no meaningful range so return empty bins.
+        if len(self) == 0:
+            return ([], [])
+
+        counts, edges = np.histogram(self.ages(today), bins=bins)
+
+        return (counts.tolist(), edges.tolist())
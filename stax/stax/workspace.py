@@ -0,0 +1,356 @@
+"""
+workspace.py
+
+Type:       Python Script
+Author:     Will Brandon
+Created:    October 19, 2026
+Revised:    -
+
+Manages stax workspaces. A workspace is a directory marked by a workspace file that groups the stax
+projects beneath it. It keeps a persistent index of every project's properties and modules so
+questions spanning projects are answered without opening each project's configuration.
+"""
+
+from pathlib import Path
+from typing import Iterator
+from fnmatch import fnmatchcase
+from datetime import date
+import json
+import pywbu.console as csl
+import pywbu.filesystem as fs
+from pywbu.exc import MalformedDataException
+from stax.project import find_projects, open_project
+from stax.records import parse_date
+
+
+WORKSPACE_FILE_NAME = '.staxws'
+"""
+The name of the file that marks a directory as the root of a stax workspace. It holds the workspace
+properties as JSON.
+"""
+
+INDEX_FILE_NAME = '.staxws-index.json'
+"""
+The name of the file beside the workspace file that holds the aggregated index of the workspace's
+projects.
+"""
+
+INDEX_VERSION = 1
+"""
+The version of the index file format. An index of another version is rebuilt.
+"""
+
+# The logger of workspace indexing.
+_log = csl.get_logger(__name__)
+
+
+class IndexedModule(object):
+    """
+    Describes a module found in the workspace index.
+    """
+
+    project: str
+    """
+    The name of the project that defines the module.
+    """
+
+    path: str
+    """
+    The path of the project root relative to the workspace root.
+    """
+
+    name: str
+    """
+    The name of the module.
+    """
+
+    creation_date: date
+    """
+    The date the module was created.
+    """
+
+    desc: str
+    """
+    The description of the module or None.
+    """
+
+
+    def __init__(self, project: str, path: str, name: str, creation_date: date, desc: str) -> None:
+        """
+        Creates a description of an indexed module.
+        """
+
+        self.project = project
+        self.path = path
+        self.name = name
+        self.creation_date = creation_date
+        self.desc = desc
+
+
+class SyncResult(object):
+    """
+    Counts the changes made to the workspace index by a synchronization.
+    """
+
+    added: int
+    """
+    The number of projects added to the index.
+    """
+
+    updated: int
+    """
+    The number of projects whose configuration changed and was read again.
+    """
+
+    removed: int
+    """
+    The number of projects that no longer exist and were removed from the index.
+    """
+
+    unchanged: int
+    """
+    The number of projects whose configuration was unchanged and was not read.
+    """
+
+    errors: dict[str, Exception]
+    """
+    The exception raised reading each project that could not be indexed keyed by relative path.
+    """
+
+
+    def __init__(self) -> None:
+        """
+        Creates an empty synchronization result.
+        """
+
+        self.added = 0
+        self.updated = 0
+        self.removed = 0
+        self.unchanged = 0
+        self.errors = {}
+
+
+class Workspace(object):
+    """
+    Represents a stax workspace and its aggregated project index.
+    """
+
+    root: Path
+    """
+    The canonical path to the root directory of the workspace.
+    """
+
+    marker_path: Path
+    """
+    The canonical path to the workspace file.
+    """
+
+    index_path: Path
+    """
+    The canonical path to the index file.
+    """
+
+    __index: dict
+    """
+    The loaded index or None until first needed.
+    """
+
+
+    def __init__(self, root: Path) -> None:
+        """
+        Creates a workspace object for the workspace at the given root.
+        """
+
+        # Ensure the root directory is a workspace.
+        if not is_workspace(root):
+            raise FileNotFoundError(f'No stax workspace exists at "{root}".')
+
+        self.root = fs.canonical_path(root)
+        self.marker_path = self.root / WORKSPACE_FILE_NAME
+        self.index_path = self.root / INDEX_FILE_NAME
+        self.__index = None
+
+
+    def properties(self) -> dict:
+        """
+        Returns the workspace properties stored in the workspace file.
+        """
+
+        try:
+            with open(self.marker_path, 'r') as file:
+                properties = json.load(file)
+        except ValueError as exc:
+            raise MalformedDataException(f'Malformed workspace file "{self.marker_path}": {exc}.')
+
+        if not isinstance(properties, dict):
+            raise MalformedDataException(f'Malformed workspace file "{self.marker_path}": ' \
+                                         + 'expected an object.')
+
+        return properties
+
+
+    def index(self) -> dict:
+        """
+        Returns the index, which maps the relative path of each project root to its entry. An
+        entry holds the stamp of the project configuration when it was indexed, the project
+        properties, and the modules as lists of name, creation date, and description. A missing or
+        unrecognized index is treated as empty.
+        """
+
+        if self.__index is None:
+            try:
+                with open(self.index_path, 'r') as file:
+                    data = json.load(file)
+                valid = isinstance(data, dict) and data.get('version') == INDEX_VERSION
+                self.__index = data['projects'] if valid else {}
+            except (FileNotFoundError, ValueError):
+                self.__index = {}
+
+        return self.__index
+
+
+    def sync(self, progress: csl.Progress=None) -> SyncResult:
+        """
+        Brings the index up to date with the projects beneath the workspace root. Only projects
+        whose configuration stamp changed since they were indexed are read again. Projects that
+        cannot be read are left out of the index and reported. If a progress report is given its
+        total is set once the projects are found and it is advanced for each project.
+        """
+
+        index = self.index()
+        result = SyncResult()
+        found = {}
+
+        roots = find_projects(self.root)
+        if progress is not None:
+            progress.total = len(roots)
+
+        # Compare the stamp of each project configuration with its indexed stamp.
+        for root in roots:
+            if progress is not None:
+                progress.count += 1
+
+            path = root.relative_to(self.root).as_posix()
+            entry = index.get(path)
+
+            try:
+                config = open_project(root).config()
+                stamp = config.stamp()
+
+                if entry is not None and entry['stamp'] == stamp:
+                    found[path] = entry
+                    result.unchanged += 1
+                    continue
+
+                record = config.record()
+
+            except Exception as exc:
+                result.errors[path] = exc
+                continue
+
+            _log.debug('Indexing project "%s".', path, stamp=stamp)
+            found[path] = {
+                'stamp': stamp,
+                'uuid': str(record.uuid),
+                'name': record.name,
+                'author': record.author,
+                'creation_date': record.creation_date.isoformat(),
+                'modules': [[module.name, module.creation_date.isoformat(), module.desc]
+                            for module in record.modules]
+            }
+            if entry is None:
+                result.added += 1
+            else:
+                result.updated += 1
+
+        # Projects that were not found again have been removed.
+        result.removed = sum(path not in found and path not in result.errors for path in index)
+
+        # Write the index only if anything changed.
+        if len(found) != len(index) or result.added or result.updated \
+                or not self.index_path.is_file():
+            with fs.atomic_open(self.index_path) as file:
+                json.dump({'version': INDEX_VERSION, 'projects': found}, file,
+                          separators=(',', ':'))
+
+        _log.debug('Synchronized the workspace index.', added=result.added, updated=result.updated,
+                   removed=result.removed, unchanged=result.unchanged)
+        self.__index = found
+        return result
+
+
+    def iter_modules(self) -> Iterator[IndexedModule]:
+        """
+        Streams every module in the index in project path order.
+        """
+
+        for path, entry in sorted(self.index().items()):
+            for name, creation_date, desc in entry['modules']:
+                yield IndexedModule(entry['name'], path, name, parse_date(creation_date), desc)
+
+
+    def find(self,
+             pattern: str=None,
+             since: date=None,
+             until: date=None) -> Iterator[IndexedModule]:
+        """
+        Streams the indexed modules whose names match a glob pattern (every module by default) and
+        that were created within a date range. No project configuration is read.
+        """
+
+        for module in self.iter_modules():
+            if pattern is not None and not fnmatchcase(module.name, pattern):
+                continue
+            if since is not None and module.creation_date < since:
+                continue
+            if until is not None and module.creation_date > until:
+                continue
+            yield module
+
+
+def is_workspace(root: Path) -> bool:
+    """
+    Determines whether the given path points to a directory that is the root of a stax workspace.
+    """
+
+    return (root / WORKSPACE_FILE_NAME).is_file()
+
+
+def create_workspace(root: Path, name: str=None) -> Workspace:
+    """
+    Creates a stax workspace at the given directory, which must exist, and indexes the projects
+    beneath it. The workspace is named after the directory unless a name is given.
+    """
+
+    root = fs.canonical_path(root)
+
+    # If the directory is already a workspace raise an exception.
+    if is_workspace(root):
+        raise FileExistsError(f'Failed to create stax workspace at "{root}" because the ' \
+                              + 'directory is already a stax workspace.')
+
+    # Write the workspace file and build the index.
+    with fs.atomic_open(root / WORKSPACE_FILE_NAME) as file:
+        json.dump({'name': name or root.name, 'creation_date': date.today().isoformat()}, file,
+                  indent=2)
+
+    workspace = Workspace(root)
+    workspace.sync()
+
+    return workspace
+
+
+def enclosing_workspace(path: Path=None) -> Workspace:
+    """
+    Finds the workspace enclosing the given path (the current working directory by default). If
+    there are nested workspaces the bottommost is found. Returns None if no workspace encloses the
+    path.
+    """
+
+    path = fs.canonical_path(path if path is not None else fs.cwd())
+
+    for candidate in (path, *path.parents):
+        if is_workspace(candidate):
+            return Workspace(candidate)
+
+    return None